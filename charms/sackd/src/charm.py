@@ -94,8 +94,11 @@ class SackdCharm(ops.CharmBase):
         try:
             self.sackd.key.set(data.auth_key)
             self.sackd.conf_server = data.controllers
-            self.sackd.service.enable()
-            self.sackd.service.restart()
+            # The key file and options are only rewritten if they changed, so `sackd` does not
+            # need to be restarted if the controller data is unchanged and `sackd` is running.
+            if self.sackd.changed or not self.sackd.service.is_active():
+                self.sackd.service.enable()
+                self.sackd.service.restart()
         except SlurmOpsError as e:
             logger.error(e.message)
             event.defer()
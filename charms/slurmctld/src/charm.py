@@ -30,6 +30,7 @@ from config import (
     update_default_partition,
     update_nhc_args,
     update_overrides,
+    update_resources,
 )
 from constants import (
     ACCOUNTING_CONFIG_FILE,
@@ -47,6 +48,7 @@ from constants import (
     SLURMRESTD_INTEGRATION_NAME,
 )
 from high_availability import SlurmctldHA
+from hpc_libs.errors import SystemdError
 from hpc_libs.interfaces import (
     ControllerData,
     OCIRuntimeDisconnectedEvent,
@@ -71,8 +73,7 @@ from hpc_libs.interfaces import (
 from hpc_libs.utils import StopCharm, leader, plog, reconfigure, refresh
 from integrations import SlurmctldPeer, SlurmctldPeerConnectedEvent
 from interface_influxdb import InfluxDB, InfluxDBAvailableEvent, InfluxDBUnavailableEvent
-from netifaces import interfaces
-from slurm_ops import SlurmctldManager, SlurmOpsError, scontrol
+from slurm_ops import RestartAction, ServiceGroup, SlurmctldManager, SlurmOpsError, scontrol
 from slurmutils import (
     AcctGatherConfig,
     ModelError,
@@ -102,14 +103,19 @@ refresh.__doc__ = """Refresh status of the `slurmctld` unit after an event handl
 class SlurmctldCharm(ops.CharmBase):
     """Charmed operator for `slurmctld`, Slurm's controller service."""
 
+    stored = ops.StoredState()
+
     def __init__(self, framework: ops.Framework) -> None:
         super().__init__(framework)
 
         self.slurmctld = SlurmctldManager(snap=False)
+        self.stored.set_default(failed_restarts={})
+        framework.observe(framework.on.pre_commit, self._on_pre_commit)
         framework.observe(self.on.install, self._on_install)
         framework.observe(self.on.leader_elected, self._on_leader_elected)
         framework.observe(self.on.start, self._on_start)
         framework.observe(self.on.config_changed, self._on_config_changed)
+        framework.observe(self.on.config_changed, self._on_resource_profile_changed)
         framework.observe(self.on.update_status, self._on_update_status)
         framework.observe(self.on.show_current_config_action, self._on_show_current_config_action)
         framework.observe(self.on.drain_action, self._on_drain_nodes_action)
@@ -160,6 +166,33 @@ class SlurmctldCharm(ops.CharmBase):
             recurse_rules_dirs=True,
         )
 
+    def _on_pre_commit(self, _: ops.PreCommitEvent) -> None:
+        """Run the service restarts requested by event handlers once at the end of the hook.
+
+        Notes:
+            - Restarts that failed are recorded in the charm's stored state and requested
+              again at the end of the next hook.
+        """
+        restarts = self.slurmctld.restarts
+        for service, action in self.stored.failed_restarts.items():
+            restarts.request(service, RestartAction(action))
+
+        pending = restarts.pending
+        try:
+            # `slurmctld` and its exporter do not depend on each other, so restart them together.
+            flushed = restarts.flush(parallel=True)
+        except (SlurmOpsError, SystemdError) as e:
+            logger.error(e.message)
+            self.stored.failed_restarts = {name: int(action) for name, action in pending.items()}
+            self.unit.status = ops.BlockedStatus(
+                "Failed to restart `slurmctld`. See `juju debug-log` for details"
+            )
+            return
+
+        self.stored.failed_restarts = {}
+        if flushed:
+            self.unit.status = check_slurmctld(self)
+
     @refresh
     def _on_install(self, event: ops.InstallEvent) -> None:
         """Install `slurmctld` after charm is deployed on the unit."""
@@ -168,16 +201,14 @@ class SlurmctldCharm(ops.CharmBase):
         try:
             self.slurmctld.install()
 
-            self.slurmctld.exporter.service.stop()
-            self.slurmctld.exporter.service.disable()
+            services = self._services()
+            services.stop()
+            services.disable()
             self.slurmctld.exporter.args = [
                 "-slurm.collect-diags",
                 "-slurm.collect-limits",
             ]
 
-            self.slurmctld.service.stop()
-            self.slurmctld.service.disable()
-
             if self.unit.is_leader():
                 # Check for existence of keys to avoid erroneous regeneration in the case where a
                 # new unit is elected leader as it is being deployed
@@ -209,7 +240,7 @@ class SlurmctldCharm(ops.CharmBase):
 
         # Refresh only if in an HA setup with a shared SaveStateLocation
         # Check the *parent* as StateSaveLocation is a subdirectory under the shared filesystem in HA
-        config = self.slurmctld.config.load()
+        config = self.slurmctld.config.load_keys("state_save_location")
         state_save_parent = Path(config.state_save_location).parent
         if not state_save_parent.is_mount():
             logger.debug(
@@ -235,10 +266,11 @@ class SlurmctldCharm(ops.CharmBase):
             if self.unit.is_leader() and not self.slurmctld.config.exists():
                 init_config(self)
 
-            self.slurmctld.service.enable()
-            self.slurmctld.service.restart()
-            self.slurmctld.exporter.service.enable()
-            self.slurmctld.exporter.service.restart()
+            # Restarts are deferred to the end of the hook so that `start` events re-emitted
+            # by the `slurmctld-peer` integration do not restart `slurmctld` again.
+            self._services().enable()
+            self.slurmctld.service.request_restart()
+            self.slurmctld.exporter.service.request_restart()
         except SlurmOpsError as e:
             logger.error(e.message)
             event.defer()
@@ -256,11 +288,25 @@ class SlurmctldCharm(ops.CharmBase):
             - Only the `slurmctld` application leader should handle configuration changes. The
               non-leader units should only read configuration managed by the leader.
         """
+        # Save a generation of `slurm.conf` and its includes so that a bad configuration
+        # change can be rolled back with `self.slurmctld.config.restore()`.
+        self.slurmctld.config.save()
+
         update_cgroup_config(self)
         update_default_partition(self)
         update_nhc_args(self)
         update_overrides(self)
 
+    @refresh
+    def _on_resource_profile_changed(self, _: ops.ConfigChangedEvent) -> None:
+        """Apply the `resource-profile` configuration.
+
+        Notes:
+            - Unlike the Slurm configuration, the resource profile applies to the `slurmctld`
+              service on every unit, so it is handled by non-leader units too.
+        """
+        update_resources(self)
+
     @refresh
     def _on_update_status(self, _: ops.UpdateStatusEvent) -> None:
         """Check status of the `slurmctld` application."""
@@ -317,15 +363,15 @@ class SlurmctldCharm(ops.CharmBase):
         if default_partition == name:
             data.partition.default = True
 
-        with self.slurmctld.config.includes[include].edit() as config:
-            config.nodesets[name] = NodeSet(nodeset=name, feature=name)
-            config.partitions[name] = data.partition
+        with self.slurmctld.config.transaction() as tx:
+            partition = tx.includes[include]
+            partition.nodesets[name] = NodeSet(nodeset=name, feature=name)
+            partition.partitions[name] = data.partition
 
-        try:
-            with self.slurmctld.config.edit() as config:
-                config.include = [include] + config.include
-        except ModelError:
-            pass
+            try:
+                tx.config.include = [include] + tx.config.include
+            except ModelError:
+                pass
 
         new_endpoints = [f"{c}:{SLURMCTLD_PORT}" for c in get_controllers(self)]
         self.slurmd.set_controller_data(
@@ -345,13 +391,13 @@ class SlurmctldCharm(ops.CharmBase):
         data = self.slurmd.get_compute_data(event.relation.id)
         include = f"slurm.conf.{data.partition.partition_name}"
 
-        try:
-            with self.slurmctld.config.edit() as config:
-                config.include.remove(include)
-        except ValueError:
-            pass
+        with self.slurmctld.config.transaction() as tx:
+            try:
+                tx.config.include.remove(include)
+            except ValueError:
+                pass
 
-        self.slurmctld.config.includes[include].delete()
+            tx.delete(include)
 
     @refresh
     @block_unless(slurmctld_installed)
@@ -373,39 +419,41 @@ class SlurmctldCharm(ops.CharmBase):
         """Handle when database data is ready from a `slurmdbd` application."""
         data = self.slurmdbd.get_database_data(event.relation.id)
 
-        with self.slurmctld.config.includes[ACCOUNTING_CONFIG_FILE].edit() as config:
-            config.accounting_storage_host = data.hostname
-            config.accounting_storage_port = 6819
-            config.accounting_storage_type = "accounting_storage/slurmdbd"
-
         # Restore `acct_gather.conf` configuration if a snapshot exists.
         self.slurmctld.acct_gather.restore()
-        try:
-            with self.slurmctld.config.edit() as config:
-                config.include = [PROFILING_CONFIG_FILE] + config.include
-        except ModelError:
-            pass
+
+        with self.slurmctld.config.transaction() as tx:
+            accounting = tx.includes[ACCOUNTING_CONFIG_FILE]
+            accounting.accounting_storage_host = data.hostname
+            accounting.accounting_storage_port = 6819
+            accounting.accounting_storage_type = "accounting_storage/slurmdbd"
+
+            try:
+                tx.config.include = [PROFILING_CONFIG_FILE] + tx.config.include
+            except ModelError:
+                pass
 
     @refresh
     @reconfigure
     @block_unless(slurmctld_installed)
     def _on_slurmdbd_disconnected(self, _: SlurmdbdDisconnectedEvent) -> None:
         """Handle when a `slurmdbd` application is disconnected."""
-        with self.slurmctld.config.includes[ACCOUNTING_CONFIG_FILE].edit() as config:
-            del config.accounting_storage_host
-            del config.accounting_storage_port
-            del config.accounting_storage_type
-
         # Save a copy of `acct_gather.conf`. `acct_gather` plugins require that `slurmctld` is
         # integrated with `slurmdbd`. The `acct_gather` plugin will be re-enabled when an
         # integration with slurmdbd is re-established.
         self.slurmctld.acct_gather.save()
         self.slurmctld.acct_gather.delete()
-        try:
-            with self.slurmctld.config.edit() as config:
-                config.include.remove(PROFILING_CONFIG_FILE)
-        except ValueError:
-            pass
+
+        with self.slurmctld.config.transaction() as tx:
+            accounting = tx.includes[ACCOUNTING_CONFIG_FILE]
+            del accounting.accounting_storage_host
+            del accounting.accounting_storage_port
+            del accounting.accounting_storage_type
+
+            try:
+                tx.config.include.remove(PROFILING_CONFIG_FILE)
+            except ValueError:
+                pass
 
     @refresh
     @wait_unless(config_ready, database_ready, slurmctld_is_active)
@@ -430,6 +478,8 @@ class SlurmctldCharm(ops.CharmBase):
     @block_unless(slurmctld_installed)
     def _on_influxdb_available(self, event: InfluxDBAvailableEvent) -> None:
         """Assemble the influxdb acct_gather.conf options."""
+        from netifaces import interfaces
+
         logger.info("`influxdb` database is available. enabling job profiling")
         try:
             config = AcctGatherConfig(
@@ -543,6 +593,15 @@ class SlurmctldCharm(ops.CharmBase):
 
         event.set_results({"status": "resuming", "nodes": nodes})
 
+    def _services(self) -> ServiceGroup:
+        """Get a group of `slurmctld` and its exporter so that both are controlled at once."""
+        return ServiceGroup(
+            {
+                "slurmctld": self.slurmctld.service,
+                "prometheus-slurm-exporter": self.slurmctld.exporter.service,
+            }
+        )
+
     def _merge_controller_data(self, app: SackdRequirer | SlurmdRequirer, new_endpoints) -> None:
         """Merge new controller endpoints with existing controller data."""
         for integration in app.integrations:
@@ -26,7 +26,7 @@ from constants import (
 from hpc_libs.interfaces import ControllerData
 from hpc_libs.is_container import is_container
 from hpc_libs.utils import StopCharm, plog
-from slurm_ops import SlurmOpsError, scontrol
+from slurm_ops import ReconfigureAction, ResourceProfile, SlurmOpsError, scontrol
 from slurmutils import CGroupConfig, ModelError, SlurmConfig
 from state import slurmctld_ready
 
@@ -126,15 +126,14 @@ def update_default_partition(charm: "SlurmctldCharm") -> None:
 
     if new_default != current_default:
         includes = charm.slurmctld.config.includes
-        new_default_include = includes[f"slurm.conf.{new_default}"]
-        current_default_include = includes[f"slurm.conf.{current_default}"]
+        partitions = charm.slurmctld.partitions
 
-        if new_default != "" and new_default_include.exists():
-            with new_default_include.edit() as config:
+        if new_default != "" and (info := partitions.get(new_default)) is not None:
+            with includes[info.include].edit() as config:
                 config.partitions[new_default].default = True
 
-        if current_default != "" and current_default_include.exists():
-            with current_default_include.edit() as config:
+        if current_default != "" and (info := partitions.get(current_default)) is not None:
+            with includes[info.include].edit() as config:
                 config.partitions[current_default].default = False
 
 
@@ -178,14 +177,44 @@ def update_overrides(charm: "SlurmctldCharm") -> None:
     _logger.info("`%s` successfully updated", OVERRIDES_CONFIG_FILE)
 
 
+def update_resources(charm: "SlurmctldCharm") -> None:
+    """Apply the `resource-profile` configuration to the `slurmctld` service.
+
+    `slurmctld` is restarted at the end of the hook if it is running and the profile changed.
+
+    Raises:
+        StopCharm: Raised if the resource profile provided is invalid.
+    """
+    try:
+        profile = ResourceProfile.from_str(cast(str, charm.config.get("resource-profile", "")))
+    except ValueError as e:
+        _logger.error(e)
+        raise StopCharm(
+            ops.BlockedStatus(
+                "Failed to load `slurmctld` resource profile. See `juju debug-log` for details"
+            )
+        )
+
+    _logger.debug("`slurmctld` resource profile: %s", profile)
+    if charm.slurmctld.set_resources(profile) and charm.slurmctld.service.is_active():
+        charm.slurmctld.service.request_restart()
+
+
 def reconfigure_slurmctld(charm: "SlurmctldCharm") -> None:
     """Reconfigure the `slurmctld` service.
 
+    The least disruptive action that still applies the changes made by the event handler is
+    taken. Changes that `slurmctld` only reads at startup, such as `SlurmctldHost` lines, require
+    a restart. Other changes only require an `scontrol reconfigure`. Nothing is done if the
+    event handler did not change the effective Slurm configuration.
+
     In a `slurmctld` high availability setup, all `slurmctld` services across all `slurmctld` units
-    in the cluster are restarted by this function. This ensures all `slurm.conf` changes are picked
-    up, including those not re-read by an `scontrol reconfigure` command. If a restart is not done,
-    removal of a controller will result in a malfunctioning cluster as `SlurmctldHost` lines are not
-    re-read and an availability event may cause a failover attempt to a nonexistent backup.
+    in the cluster are restarted when a restart is required. If a restart is not done, removal of a
+    controller will result in a malfunctioning cluster as `SlurmctldHost` lines are not re-read and
+    an availability event may cause a failover attempt to a nonexistent backup.
+
+    The action is recorded as pending until it succeeds, so a later hook takes it again if the
+    restart or `scontrol reconfigure` fails.
 
     Raises:
         SlurmOpsError: Raised if the `scontrol reconfigure` command fails.
@@ -193,22 +222,31 @@ def reconfigure_slurmctld(charm: "SlurmctldCharm") -> None:
     if not slurmctld_ready(charm):
         return
 
+    action = charm.slurmctld.get_reconfigure_action()
+    if action == ReconfigureAction.NONE:
+        _logger.debug("`slurmctld` configuration is unchanged. skipping reconfigure")
+        return
+
+    charm.slurmctld.pending_action = action
+
     # This must occur before `scontrol reconfigure` in case the primary `slurmctld` has been
     # removed and this unit is a backup being promoted to the new primary.
     #
     # If the `scontrol reconfigure` is performed first in this situation, it fails with:
     #   '['scontrol', 'reconfigure']' failed with exit code 1. reason: slurm_reconfigure error:
     #   Slurm backup controller in standby mode
-    try:
-        charm.slurmctld.service.restart()
-    except SlurmOpsError as e:
-        _logger.error(e.message)
-        raise StopCharm(
-            ops.BlockedStatus(
-                "Failed to restart `slurmctld.service`. See `juju debug-log` for details"
+    if action == ReconfigureAction.RESTART:
+        try:
+            charm.slurmctld.service.restart()
+        except SlurmOpsError as e:
+            _logger.error(e.message)
+            raise StopCharm(
+                ops.BlockedStatus(
+                    "Failed to restart `slurmctld.service`. See `juju debug-log` for details"
+                )
             )
-        )
-    charm.slurmctld_peer.signal_slurmctld_restart()
+        charm.slurmctld_peer.signal_slurmctld_restart()
+        charm.slurmctld.pending_action = ReconfigureAction.RECONFIGURE
 
     try:
         scontrol("reconfigure")
@@ -220,7 +258,9 @@ def reconfigure_slurmctld(charm: "SlurmctldCharm") -> None:
             )
         )
 
-    if charm.slurmrestd.is_joined():
+    charm.slurmctld.pending_action = ReconfigureAction.NONE
+
+    if charm.slurmrestd.is_joined() and charm.slurmctld.config.changed:
         charm.slurmrestd.set_controller_data(
             ControllerData(
                 slurmconfig={
@@ -81,7 +81,7 @@ class SlurmctldHA(ops.Object):
             return
 
         # The leader must also migrate StateSaveLocation data
-        config = self._charm.slurmctld.config.load()
+        config = self._charm.slurmctld.config.load_keys("state_save_location")
         state_save_source = Path(config.state_save_location)
 
         try:
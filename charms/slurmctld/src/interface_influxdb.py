@@ -8,9 +8,6 @@ import logging
 import secrets
 from typing import TYPE_CHECKING
 
-import influxdb
-import requests
-from influxdb.exceptions import InfluxDBClientError
 from ops import (
     EventBase,
     EventSource,
@@ -103,6 +100,9 @@ class InfluxDB(Object):
 
     def _on_relation_joined(self, event: RelationJoinedEvent) -> None:
         """Store influxdb_ingress in the charm."""
+        # `influxdb` is imported here as it is slow to import and only used by this integration.
+        import influxdb
+
         if self.framework.model.unit.is_leader():
             logger.debug("Slurmctld Leader influxdb._on_relation_joined()")
 
@@ -205,6 +205,10 @@ class InfluxDB(Object):
 
     def _on_relation_broken(self, event: RelationBrokenEvent) -> None:
         """Remove the database and user from influxdb on relation-broken."""
+        import influxdb
+        import requests
+        from influxdb.exceptions import InfluxDBClientError
+
         if self.framework.model.unit.is_leader():
             if (app_data := event.relation.data.get(self.model.app)) is not None:
                 logger.debug(f"Infulxdb interface app data: {app_data}")
@@ -89,7 +89,7 @@ def shared_state_mounted(charm: "SlurmctldCharm") -> ConditionEvaluation:
 
     # Check the *parent* as StateSaveLocation is a subdirectory under the shared filesystem in HA
     # That is, with "HA_MOUNT_LOCATION/checkpoint" we check if "HA_MOUNT_LOCATION" is a mount
-    config = charm.slurmctld.config.load()
+    config = charm.slurmctld.config.load_keys("state_save_location")
     state_save_parent = Path(config.state_save_location).parent
     if not state_save_parent.is_mount():
         return failure
@@ -114,7 +114,7 @@ def peer_ready(charm: "SlurmctldCharm") -> ConditionEvaluation:
     if not charm.slurmctld.config.path.exists():
         return ConditionEvaluation(False, f"Waiting for {charm.slurmctld.config.path}")
 
-    config = charm.slurmctld.config.load()
+    config = charm.slurmctld.config.load_keys("slurmctld_host")
     if charm.slurmctld.hostname not in config.slurmctld_host:
         return ConditionEvaluation(
             False,
@@ -20,6 +20,7 @@ from constants import CLUSTER_NAME_PREFIX, OCI_RUNTIME_INTEGRATION_NAME, PEER_IN
 from hpc_libs.interfaces import OCIRuntimeDisconnectedEvent, OCIRuntimeReadyEvent
 from ops import testing
 from pytest_mock import MockerFixture
+from slurm_ops import RestartAction, SlurmOpsError
 from slurmutils import OCIConfig
 
 EXAMPLE_OCI_CONFIG = OCIConfig(
@@ -148,3 +149,34 @@ class TestSlurmctldCharm:
                 isinstance(event, OCIRuntimeDisconnectedEvent)
                 for event in mock_charm.emitted_events
             )
+
+    def test_on_pre_commit_retries_failed_restart(
+        self, mock_charm, mocker: MockerFixture, leader
+    ) -> None:
+        """Test that a failed restart is saved and run again at the end of the next hook."""
+        with mock_charm(mock_charm.on.update_status(), testing.State(leader=leader)) as manager:
+            slurmctld = manager.charm.slurmctld
+            mocker.patch.object(slurmctld, "is_installed", return_value=True)
+            restart = mocker.patch.object(
+                slurmctld.service, "restart", side_effect=SlurmOpsError("restart failed")
+            )
+            slurmctld.service.request_restart()
+
+            state = manager.run()
+
+        restart.assert_called_once()
+        assert state.get_stored_state("stored", owner_path="SlurmctldCharm").content == {
+            "failed_restarts": {"slurmctld": RestartAction.RESTART}
+        }
+
+        with mock_charm(mock_charm.on.update_status(), state) as manager:
+            slurmctld = manager.charm.slurmctld
+            mocker.patch.object(slurmctld, "is_installed", return_value=True)
+            restart = mocker.patch.object(slurmctld.service, "restart")
+
+            state = manager.run()
+
+        restart.assert_called_once()
+        assert state.get_stored_state("stored", owner_path="SlurmctldCharm").content == {
+            "failed_restarts": {}
+        }
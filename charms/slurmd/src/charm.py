@@ -25,6 +25,7 @@ import ops
 import rdma
 from config import (
     State,
+    get_install_source,
     get_node_info,
     get_partition,
     reboot_if_required,
@@ -43,7 +44,7 @@ from hpc_libs.interfaces import (
     wait_unless,
 )
 from hpc_libs.utils import StopCharm, reconfigure, refresh
-from slurm_ops import SlurmdManager, SlurmOpsError, scontrol
+from slurm_ops import ProvisioningPlan, RestartAction, SlurmdManager, SlurmOpsError, scontrol
 from slurmutils import ModelError, Node
 from state import check_slurmd, slurmd_installed
 
@@ -72,7 +73,9 @@ class SlurmdCharm(ops.CharmBase):
             custom_node_config="",
             custom_nhc_config="",
             custom_partition_config="",
+            failed_restarts={},
         )
+        framework.observe(framework.on.pre_commit, self._on_pre_commit)
         framework.observe(self.on.install, self._on_install)
         framework.observe(self.on.config_changed, self._on_config_changed)
         framework.observe(self.on.update_status, self._on_update_status)
@@ -96,6 +99,32 @@ class SlurmdCharm(ops.CharmBase):
 
         self._grafana_agent = COSAgentProvider(self)
 
+    def _on_pre_commit(self, _: ops.PreCommitEvent) -> None:
+        """Run the service restarts requested by event handlers once at the end of the hook.
+
+        Notes:
+            - Restarts that failed are recorded in the charm's stored state and requested
+              again at the end of the next hook.
+        """
+        restarts = self.slurmd.restarts
+        for service, action in self.stored.failed_restarts.items():
+            restarts.request(service, RestartAction(action))
+
+        pending = restarts.pending
+        try:
+            flushed = restarts.flush()
+        except (SlurmOpsError, SystemdError) as e:
+            logger.error(e.message)
+            self.stored.failed_restarts = {name: int(action) for name, action in pending.items()}
+            self.unit.status = ops.BlockedStatus(
+                "Failed to apply new `slurmd` configuration. See `juju debug-log` for details"
+            )
+            return
+
+        self.stored.failed_restarts = {}
+        if flushed:
+            self.unit.status = check_slurmd(self)
+
     @refresh
     def _on_install(self, event: ops.InstallEvent) -> None:
         """Provision the compute node after charm is deployed on unit.
@@ -111,34 +140,32 @@ class SlurmdCharm(ops.CharmBase):
         self.unit.status = ops.MaintenanceStatus("Provisioning compute node")
 
         try:
-            self.unit.status = ops.MaintenanceStatus("Installing `slurmd`")
-            self.slurmd.install()
+            # Install the packages needed by every provisioning phase in one `apt` transaction.
+            plan = ProvisioningPlan(source=get_install_source(self))
+            self.slurmd.provision(plan)
+            nhc.provision(plan)
+            rdma.provision(plan)
+            gpu.provision(plan)
 
-            self.unit.status = ops.MaintenanceStatus("Installing `nhc`")
-            nhc.install()
-
-            self.unit.status = ops.MaintenanceStatus("Installing RDMA packages")
-            rdma.install()
-
-            self.unit.status = ops.MaintenanceStatus("Detecting if machine is GPU-equipped")
-            gpu_enabled = gpu.autoinstall()
-            if gpu_enabled:
-                self.unit.status = ops.MaintenanceStatus("Successfully installed GPU drivers")
-            else:
-                self.unit.status = ops.MaintenanceStatus("No GPUs found. Continuing")
+            # Independent install steps run at the same time. Show which steps are running.
+            plan.apply(on_change=self._set_provisioning_status)
 
             self.slurmd.service.stop()
             self.slurmd.service.disable()
             self.slurmd.dynamic = True
             self.unit.set_workload_version(self.slurmd.version())
 
-        except (SlurmOpsError, gpu.GPUOpsError) as e:
+        except (SlurmOpsError, nhc.NHCOpsError) as e:
             logger.error(e.message)
             event.defer()
 
         self.unit.open_port("tcp", SLURMD_PORT)
         reboot_if_required(self)
 
+    def _set_provisioning_status(self, steps: list[str]) -> None:
+        """Show the install steps that are running in the unit status."""
+        self.unit.status = ops.MaintenanceStatus(f"Provisioning compute node ({', '.join(steps)})")
+
     @refresh
     def _on_config_changed(self, _: ops.ConfigChangedEvent) -> None:
         """Update the `slurmd` application's configuration."""
@@ -197,7 +224,10 @@ class SlurmdCharm(ops.CharmBase):
         self.slurmd.key.set(data.auth_key)
         self.slurmd.conf_server = data.controllers
         nhc.generate_wrapper(data.nhc_args)
-        self.service_needs_restart = True
+        # The key file and options are only rewritten if they changed, so `slurmd` does not
+        # need to be restarted if the controller data is unchanged and `slurmd` is running.
+        if self.slurmd.changed or not self.slurmd.service.is_active():
+            self.service_needs_restart = True
 
     @refresh
     @block_unless(slurmd_installed)
@@ -220,9 +250,10 @@ class SlurmdCharm(ops.CharmBase):
         self.stored.default_state = State.IDLE.value
         self.stored.default_reason = ""
 
-        node = self.slurmd.conf
-        del node.state
-        self.slurmd.conf = node
+        with self.slurmd.options() as options:
+            node = options.conf
+            del node.state
+            options.conf = node
 
         # Update the nodes state if it is already enlisted with `slurmctld`.
         try:
@@ -26,7 +26,7 @@ from hpc_libs.errors import SystemdError
 from hpc_libs.interfaces import ComputeData
 from hpc_libs.machine import call
 from hpc_libs.utils import StopCharm, plog
-from slurm_ops import SlurmOpsError, scontrol
+from slurm_ops import InstallSource, SlurmOpsError, scontrol
 from slurmutils import ModelError, Node, Partition
 from state import slurmd_ready
 
@@ -85,6 +85,37 @@ def get_node_info() -> Node:
     return node
 
 
+def get_install_source(charm: "SlurmdCharm") -> InstallSource | None:
+    """Get the local install source configured with `install-source` and `install-source-key`.
+
+    Returns:
+        The install source, or `None` if Slurm should be installed from the Ubuntu HPC PPA.
+
+    Raises:
+        SlurmOpsError: Raised if the install source is invalid, or if the `slurm-debs`
+            resource is missing or fails checksum verification.
+    """
+    value = cast(str, charm.config.get("install-source", "")).strip()
+    if not value:
+        return None
+
+    if value == "resource":
+        try:
+            path = charm.model.resources.fetch("slurm-debs")
+        except (ops.ModelError, NameError) as e:
+            _logger.error("failed to fetch `slurm-debs` resource. reason: %s", e)
+            raise SlurmOpsError("failed to fetch `slurm-debs` resource")
+
+        return InstallSource.from_debs(path)
+
+    key = cast(str, charm.config.get("install-source-key", ""))
+    try:
+        return InstallSource.from_str(value, key=key)
+    except ValueError as e:
+        _logger.error("failed to load install source '%s'. reason: %s", value, e)
+        raise SlurmOpsError("failed to load install source")
+
+
 def get_partition(charm: "SlurmdCharm") -> Partition:
     """Get the current partition configuration.
 
@@ -155,7 +186,9 @@ def reconfigure_slurmd(charm: "SlurmdCharm") -> None:
     scontrol("delete", f"nodename={charm.slurmd.hostname}", check=False)
     try:
         charm.slurmd.service.enable()
-        charm.slurmd.service.restart()
+        # Restart at the end of the hook so that several reconfigurations in one dispatch
+        # only restart `slurmd` once.
+        charm.slurmd.service.request_restart()
     except SystemdError as e:
         _logger.error(e.message)
         raise StopCharm(
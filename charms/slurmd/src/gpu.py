@@ -16,34 +16,27 @@
 
 import logging
 
-# ubuntu-drivers requires apt_pkg for package operations
-import apt_pkg  # pyright: ignore [reportMissingImports]
-import pynvml
-import UbuntuDrivers.detect  # pyright: ignore [reportMissingImports]
-
-import charms.operator_libs_linux.v0.apt as apt
+# `apt_pkg`, `pynvml`, and `UbuntuDrivers` are imported by the functions that use them. Only
+# the install hook and GRES configuration need them, so other hooks skip loading them.
+from slurm_ops import ProvisioningPlan
 
 _logger = logging.getLogger(__name__)
 
 
-class GPUOpsError(Exception):
-    """Exception raised when a GPU driver installation operation failed."""
-
-    @property
-    def message(self) -> str:
-        """Return message passed as argument to exception."""
-        return self.args[0]
-
-
 class GPUDriverDetector:
     """Detects GPU driver and kernel packages appropriate for the current hardware."""
 
     def __init__(self):
         """Initialize detection interfaces."""
+        # ubuntu-drivers requires apt_pkg for package operations
+        import apt_pkg  # pyright: ignore [reportMissingImports]
+
         apt_pkg.init()
 
     def _system_gpgpu_driver_packages(self) -> dict:
         """Detect the available GPGPU drivers for this node."""
+        import UbuntuDrivers.detect  # pyright: ignore [reportMissingImports]
+
         return UbuntuDrivers.detect.system_gpgpu_driver_packages()
 
     def _get_linux_modules_metapackage(self, driver) -> str:
@@ -51,6 +44,9 @@ class GPUDriverDetector:
 
         For example, linux-modules-nvidia-535-server-aws for driver nvidia-driver-535-server
         """
+        import apt_pkg  # pyright: ignore [reportMissingImports]
+        import UbuntuDrivers.detect  # pyright: ignore [reportMissingImports]
+
         return UbuntuDrivers.detect.get_linux_modules_metapackage(apt_pkg.Cache(None), driver)
 
     def system_packages(self) -> list[str]:
@@ -76,30 +72,28 @@ class GPUDriverDetector:
         return [p for p in install_packages if p]
 
 
-def autoinstall() -> bool:
-    """Autodetect available GPUs and install drivers.
+def provision(plan: ProvisioningPlan) -> None:
+    """Add the steps needed to install GPU drivers to a provisioning plan.
 
-    Returns:
-        True if drivers were installed, False otherwise.
-
-    Raises:
-        GPUOpsError: Raised if error is encountered during package install.
+    Notes:
+        - GPUs are detected once the plan has updated the `apt` package index, as the driver
+          packages to install are looked up in the package index.
     """
-    _logger.info("detecting GPUs and installing drivers")
+    plan.add("gpu", _driver_packages)
+
+
+def _driver_packages() -> list[str]:
+    """Autodetect available GPUs and get the driver packages to install."""
+    _logger.info("detecting GPUs")
     detector = GPUDriverDetector()
     install_packages = detector.system_packages()
 
     if len(install_packages) == 0:
         _logger.info("no GPU drivers requiring installation")
-        return False
+    else:
+        _logger.info("installing GPU driver packages: %s", install_packages)
 
-    _logger.info("installing GPU driver packages: %s", install_packages)
-    try:
-        apt.add_package(install_packages)
-    except (apt.PackageNotFoundError, apt.PackageError) as e:
-        raise GPUOpsError(f"failed to install packages {install_packages}. reason: {e}")
-
-    return True
+    return install_packages
 
 
 def get_all_gpu() -> dict[str, list[int]]:
@@ -114,6 +108,8 @@ def get_all_gpu() -> dict[str, list[int]]:
         represents a node with two Tesla T4 GPUs at /dev/nvidia0 and /dev/nvidia1, and two L40S
         GPUs at /dev/nvidia2 and /dev/nvidia3.
     """
+    import pynvml
+
     gpu_info = {}
 
     try:
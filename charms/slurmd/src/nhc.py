@@ -14,18 +14,23 @@
 
 """Manage node health check (nhc) installation on compute node."""
 
+import hashlib
 import logging
-import subprocess
-import tempfile
+import tarfile
 import textwrap
 from pathlib import Path
 
 from constants import NHC_CONFIG
-
-import charms.operator_libs_linux.v0.apt as apt
+from slurm_ops import ProvisioningPlan
 
 _logger = logging.getLogger(__name__)
 
+# Prebuilt NHC install tree and its manifest, produced by the `nhc` part in `charmcraft.yaml`.
+NHC_ARTIFACT = Path("nhc-1.4.3.tar.gz")
+NHC_MANIFEST = Path("nhc-1.4.3.manifest")
+# Copy of the manifest of the NHC install tree that is currently installed.
+NHC_INSTALLED_MANIFEST = Path("/usr/lib/nhc/.manifest")
+
 
 class NHCOpsError(Exception):
     """Exception raised when a NHC operation failed."""
@@ -36,70 +41,85 @@ class NHCOpsError(Exception):
         return self.args[0]
 
 
+def provision(plan: ProvisioningPlan) -> None:
+    """Add the steps needed to install NHC to a provisioning plan.
+
+    Notes:
+        - NHC is prebuilt when the charm is packed, so it does not need any packages.
+    """
+    plan.add("nhc", setup=install)
+
+
 def install() -> None:
-    """Install NHC on compute node.
+    """Install the prebuilt NHC install tree on compute node.
 
     Raises:
-        subprocess.CalledProcessError: Raised if error is encountered during NHC install.
+        NHCOpsError: Raised if the NHC install tree fails to extract or does not match
+            its manifest.
+
+    Notes:
+        - The install tree is only extracted if the installed NHC does not match the
+          manifest shipped with the charm.
     """
-    _logger.info("installing required packages to install Node Health Check (NHC)")
+    manifest = NHC_MANIFEST.read_text()
+    expected = _parse_manifest(manifest)
+    digest = hashlib.sha256(manifest.encode()).hexdigest()
+    if _installed_digest() == digest and _matches(expected):
+        _logger.info("NHC matching manifest digest %s is already installed. skipping", digest)
+    else:
+        _logger.info("installing NHC from %s", NHC_ARTIFACT)
+        try:
+            with tarfile.open(NHC_ARTIFACT) as tar:
+                # Skip directory members so system directories such as `/usr` keep their
+                # metadata. Parent directories of the extracted files are created as needed.
+                files = [member for member in tar if not member.isdir()]
+                tar.extractall("/", members=files, filter="data")
+        except (tarfile.TarError, OSError) as e:
+            raise NHCOpsError(f"failed to extract {NHC_ARTIFACT}. reason: {e}")
 
-    try:
-        apt.add_package("make")
-    except (apt.PackageNotFoundError, apt.PackageError) as e:
-        raise NHCOpsError(f"failed to install package `make`. reason: {e}")
+        if not _matches(expected):
+            raise NHCOpsError(f"installed NHC does not match {NHC_MANIFEST}")
 
-    _logger.info("installing NHC")
-    with tempfile.TemporaryDirectory() as tmpdir:
-        try:
-            env = {"LC_ALL": "C", "LANG": "C.UTF-8"}
-
-            _logger.info("extracting NHC tarball")
-            r = subprocess.check_output(
-                [
-                    "tar",
-                    "--extract",
-                    "--directory",
-                    tmpdir,
-                    "--file",
-                    "lbnl-nhc-1.4.3.tar.gz",
-                    "--strip",
-                    "1",
-                ],
-                stderr=subprocess.STDOUT,
-                text=True,
-            )
-            _logger.debug(r)
-
-            _logger.info("building NHC with autotools")
-            r = subprocess.check_output(
-                ["./autogen.sh", "--prefix=/usr", "--sysconfdir=/etc", "--libexecdir=/usr/lib"],
-                cwd=tmpdir,
-                env=env,
-                stderr=subprocess.STDOUT,
-                text=True,
-            )
-            _logger.debug(r)
-
-            _logger.info("testing NHC build")
-            r = subprocess.check_output(
-                ["make", "test"], cwd=tmpdir, env=env, stderr=subprocess.STDOUT, text=True
-            )
-            _logger.debug(r)
-
-            _logger.info("installing NHC")
-            r = subprocess.check_output(
-                ["make", "install"], cwd=tmpdir, env=env, stderr=subprocess.STDOUT, text=True
-            )
-            _logger.debug(r)
-        except subprocess.CalledProcessError as e:
-            _logger.error("failed to install NHC. reason: %s", e)
-            raise
+        NHC_INSTALLED_MANIFEST.parent.mkdir(parents=True, exist_ok=True)
+        NHC_INSTALLED_MANIFEST.write_text(manifest)
 
     # Write the nhc.conf following NHC installation.
     generate_config()
 
 
+def _parse_manifest(manifest: str) -> dict[Path, str]:
+    """Parse a manifest in `sha256sum` format into a map of installed paths to digests."""
+    expected = {}
+    for line in filter(str.strip, manifest.splitlines()):
+        digest, _, name = line.partition(" ")
+        expected[Path("/") / name.strip().lstrip("*")] = digest
+
+    return expected
+
+
+def _installed_digest() -> str | None:
+    """Get the digest of the manifest of the installed NHC, if NHC is installed."""
+    try:
+        return hashlib.sha256(NHC_INSTALLED_MANIFEST.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def _matches(expected: dict[Path, str]) -> bool:
+    """Check if every installed NHC file matches its digest in the manifest."""
+    for file, digest in expected.items():
+        try:
+            with file.open("rb") as f:
+                if hashlib.file_digest(f, "sha256").hexdigest() != digest:
+                    _logger.debug("%s does not match the NHC manifest", file)
+                    return False
+        except FileNotFoundError:
+            _logger.debug("%s is missing from the NHC install", file)
+            return False
+
+    return True
+
+
 def get_config() -> str:
     """Get the current NHC configuration.
 
@@ -17,30 +17,11 @@
 import logging
 from pathlib import Path
 
-import charms.operator_libs_linux.v0.apt as apt
+from slurm_ops import ProvisioningPlan
 
 _logger = logging.getLogger(__name__)
 
 
-class RDMAOpsError(Exception):
-    """Exception raised when an RDMA package installation operation failed."""
-
-    @property
-    def message(self) -> str:
-        """Return message passed as argument to exception."""
-        return self.args[0]
-
-
-def _install_rdma() -> None:
-    """Install the given list of packages."""
-    install_packages = ["rdma-core", "infiniband-diags"]
-    _logger.info("installing RDMA packages: %s", install_packages)
-    try:
-        apt.add_package(install_packages)
-    except (apt.PackageNotFoundError, apt.PackageError) as e:
-        raise RDMAOpsError(f"failed to install packages {install_packages}. reason: {e}")
-
-
 def _override_ompi_conf() -> None:
     """Re-enable UCX/UCT transport protocol by overriding system OpenMPI configuration.
 
@@ -82,11 +63,6 @@ def _override_ompi_conf() -> None:
     file.write_text("\n".join(filter(None, content)) + "\n")
 
 
-def install() -> None:
-    """Install RDMA packages.
-
-    Raises:
-        RDMAOpsError: Raised if error is encountered during package install.
-    """
-    _install_rdma()
-    _override_ompi_conf()
+def provision(plan: ProvisioningPlan) -> None:
+    """Add the steps needed to install RDMA packages to a provisioning plan."""
+    plan.add("rdma", ["rdma-core", "infiniband-diags"], setup=_override_ompi_conf)
@@ -27,6 +27,7 @@ from config import (
     init_config,
     reconfigure_slurmdbd,
     update_overrides,
+    update_resources,
     update_storage,
 )
 from constants import (
@@ -140,6 +141,7 @@ class SlurmdbdCharm(ops.CharmBase):
     def _on_config_changed(self, _: ops.ConfigChangedEvent) -> None:
         """Update the `slurmdbd` charm's configuration."""
         update_overrides(self)
+        update_resources(self)
 
     @leader
     @refresh
@@ -26,7 +26,7 @@ from constants import (
 )
 from hpc_libs.interfaces import DatabaseData
 from hpc_libs.utils import StopCharm, get_ingress_address, plog
-from slurm_ops import SlurmOpsError
+from slurm_ops import ResourceProfile, SlurmOpsError
 from slurmutils import ModelError, SlurmdbdConfig
 from state import slurmdbd_ready
 
@@ -79,6 +79,30 @@ def update_overrides(charm: "SlurmdbdCharm", /) -> None:
     _logger.info("`%s` successfully updated", OVERRIDES_CONFIG_FILE)
 
 
+def update_resources(charm: "SlurmdbdCharm", /) -> None:
+    """Apply the `resource-profile` configuration to the `slurmdbd` service.
+
+    `slurmdbd` is restarted at the end of the hook if it is running and the profile changed.
+    The restart is recorded as pending first, so it is retried by a later hook if it fails.
+
+    Raises:
+        StopCharm: Raised if the resource profile provided is invalid.
+    """
+    try:
+        profile = ResourceProfile.from_str(cast(str, charm.config.get("resource-profile", "")))
+    except ValueError as e:
+        _logger.error(e)
+        raise StopCharm(
+            ops.BlockedStatus(
+                "Failed to load `slurmdbd` resource profile. See `juju debug-log` for details"
+            )
+        )
+
+    _logger.debug("`slurmdbd` resource profile: %s", profile)
+    if charm.slurmdbd.set_resources(profile) and charm.slurmdbd.service.is_active():
+        charm.slurmdbd.restart_pending = True
+
+
 def update_storage(charm: "SlurmdbdCharm", /, config: dict[str, Any]) -> None:
     """Update the `slurmdbd.conf.storage` configuration file.
 
@@ -105,6 +129,10 @@ def update_storage(charm: "SlurmdbdCharm", /, config: dict[str, Any]) -> None:
 def reconfigure_slurmdbd(charm: "SlurmdbdCharm") -> None:
     """Reconfigure and restart the `slurmdbd` service.
 
+    The `slurmdbd` service is not restarted if it is already active and neither the merged
+    `slurmdbd.conf` file nor the secret and environment files of `slurmdbd` changed. A restart
+    that failed in an earlier hook is retried.
+
     Raises:
         SlurmOpsError: Raised if the `slurmdbd` service fails to start or restart.
     """
@@ -113,8 +141,13 @@ def reconfigure_slurmdbd(charm: "SlurmdbdCharm") -> None:
 
     try:
         charm.slurmdbd.config.merge()
-        charm.slurmdbd.service.enable()
-        charm.slurmdbd.service.restart()
+        if charm.slurmdbd.needs_restart or not charm.slurmdbd.service.is_active():
+            charm.slurmdbd.restart_pending = True
+            charm.slurmdbd.service.enable()
+            charm.slurmdbd.service.restart()
+            charm.slurmdbd.restart_pending = False
+        else:
+            _logger.debug("`slurmdbd` configuration is unchanged. skipping restart")
     except SlurmOpsError as e:
         _logger.error(e.message)
         raise StopCharm(
@@ -15,6 +15,41 @@
 
 """Unit tests for the `slurmdbd` charm."""
 
+import pytest
+from ops import testing
+from pyfakefs.fake_filesystem import FakeFilesystem
+from pytest_mock import MockerFixture
+
 
 def test_on_install() -> None:
     """Test the `_on_install` event handler."""
+
+
+@pytest.mark.parametrize(
+    "active",
+    (
+        pytest.param(True, id="active"),
+        pytest.param(False, id="inactive"),
+    ),
+)
+def test_on_config_changed_resource_profile(
+    mock_charm, fs: FakeFilesystem, mocker: MockerFixture, active
+) -> None:
+    """Test that changing the resource profile of a running `slurmdbd` restarts it."""
+    fs.create_dir("/etc/slurm")
+    mocker.patch("shutil.chown")  # User/group `slurm` doesn't exist on host.
+
+    with mock_charm(
+        mock_charm.on.config_changed(),
+        testing.State(leader=True, config={"resource-profile": "cpus=8-11"}),
+    ) as manager:
+        slurmdbd = manager.charm.slurmdbd
+        mocker.patch.object(slurmdbd, "is_installed", return_value=True)
+        set_resources = mocker.patch.object(slurmdbd, "set_resources", return_value=True)
+        mocker.patch.object(slurmdbd.service, "is_active", return_value=active)
+
+        manager.run()
+
+    set_resources.assert_called_once()
+    # `slurmdbd` is not ready to start without its integrations, so the restart stays pending.
+    assert slurmdbd.restart_pending is active
@@ -17,6 +17,7 @@
 """Charmed operator for `slurmrestd`, Slurm's REST API service."""
 
 import logging
+from typing import cast
 
 import ops
 from constants import SLURMRESTD_INTEGRATION_NAME, SLURMRESTD_PORT
@@ -29,7 +30,7 @@ from hpc_libs.interfaces import (
     wait_unless,
 )
 from hpc_libs.utils import StopCharm, refresh
-from slurm_ops import SlurmOpsError, SlurmrestdManager
+from slurm_ops import ResourceProfile, SlurmOpsError, SlurmrestdManager
 from state import check_slurmrestd, slurmrestd_installed
 
 logger = logging.getLogger(__name__)
@@ -45,6 +46,7 @@ class SlurmrestdCharm(ops.CharmBase):
 
         self.slurmrestd = SlurmrestdManager(snap=False)
         framework.observe(self.on.install, self._on_install)
+        framework.observe(self.on.config_changed, self._on_config_changed)
         framework.observe(self.on.update_status, self._on_update_status)
 
         self.slurmctld = SlurmrestdProvider(self, SLURMRESTD_INTEGRATION_NAME)
@@ -83,6 +85,32 @@ class SlurmrestdCharm(ops.CharmBase):
 
         self.unit.open_port("tcp", SLURMRESTD_PORT)
 
+    @refresh
+    def _on_config_changed(self, event: ops.ConfigChangedEvent) -> None:
+        """Apply the `resource-profile` configuration to the `slurmrestd` service."""
+        try:
+            profile = ResourceProfile.from_str(cast(str, self.config.get("resource-profile", "")))
+        except ValueError as e:
+            logger.error(e)
+            raise StopCharm(
+                ops.BlockedStatus(
+                    "Failed to load `slurmrestd` resource profile. "
+                    + "See `juju debug-log` for details"
+                )
+            )
+
+        try:
+            if self.slurmrestd.set_resources(profile) and self.slurmrestd.service.is_active():
+                self.slurmrestd.service.restart()
+        except SlurmOpsError as e:
+            logger.error(e.message)
+            event.defer()
+            raise StopCharm(
+                ops.BlockedStatus(
+                    "Failed to restart `slurmrestd`. See `juju debug-log` for details"
+                )
+            )
+
     @refresh
     def _on_update_status(self, _: ops.UpdateStatusEvent) -> None:
         """Check status of the `slurmrestd` application/unit."""
@@ -98,8 +126,9 @@ class SlurmrestdCharm(ops.CharmBase):
             self.slurmrestd.key.set(data.auth_key)
             for name, config in data.slurmconfig.items():
                 self.slurmrestd.config.includes[name].dump(config)
-            self.slurmrestd.service.enable()
-            self.slurmrestd.service.restart()
+            if self.slurmrestd.changed or not self.slurmrestd.service.is_active():
+                self.slurmrestd.service.enable()
+                self.slurmrestd.service.restart()
         except SlurmOpsError as e:
             logger.error(e.message)
             event.defer()
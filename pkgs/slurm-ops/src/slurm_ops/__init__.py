@@ -22,15 +22,31 @@ __all__ = [
     "SLURMD_USER",
     "SLURMRESTD_GROUP",
     "SLURMRESTD_USER",
+    "InstallSource",
+    "ProvisioningPlan",
+    "ResourceProfile",
+    "RestartAction",
+    "Sandbox",
+    "ServiceGroup",
+    "ServiceGroupError",
     "SlurmOpsError",
+    # From `diff.py`
+    "ReconfigureAction",
+    "SlurmConfigDiff",
+    "diff_slurm_config",
+    # From `partitions.py`
+    "PartitionCatalog",
+    "PartitionInfo",
     # From `sackd.py`
     "SackdManager",
+    "SackdOptions",
     # From `scontrol.py`
     "scontrol",
     # From `slurmctld.py`
     "SlurmctldManager",
     # From `slurmd.py`
     "SlurmdManager",
+    "SlurmdOptions",
     # From `slurmdbd.py`
     "SlurmdbdManager",
     # From `slurmrestd.py`
@@ -44,11 +60,20 @@ from .core import (
     SLURMD_USER,
     SLURMRESTD_GROUP,
     SLURMRESTD_USER,
+    InstallSource,
+    ProvisioningPlan,
+    ResourceProfile,
+    RestartAction,
+    Sandbox,
+    ServiceGroup,
+    ServiceGroupError,
     SlurmOpsError,
 )
-from .sackd import SackdManager
+from .diff import ReconfigureAction, SlurmConfigDiff, diff_slurm_config
+from .partitions import PartitionCatalog, PartitionInfo
+from .sackd import SackdManager, SackdOptions
 from .scontrol import scontrol
 from .slurmctld import SlurmctldManager
-from .slurmd import SlurmdManager
+from .slurmd import SlurmdManager, SlurmdOptions
 from .slurmdbd import SlurmdbdManager
 from .slurmrestd import SlurmrestdManager
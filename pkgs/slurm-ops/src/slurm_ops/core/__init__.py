@@ -26,11 +26,42 @@ __all__ = [
     "SLURMD_GROUP",
     "SLURMRESTD_USER",
     "SLURMRESTD_GROUP",
+    # From `dropins.py`
+    "DropInManager",
     # From `errors.py`
+    "ServiceGroupError",
     "SlurmOpsError",
     # From `options.py`
     "marshal_options",
     "parse_options",
+    # From `parallel.py`
+    "ServiceGroup",
+    "run_parallel",
+    # From `provision.py`
+    "ProvisioningPlan",
+    "index_age",
+    # From `resources.py`
+    "ResourceProfile",
+    # From `restarts.py`
+    "CoalescingServiceManager",
+    "RestartAction",
+    "RestartCoordinator",
+    # From `sandbox.py`
+    "Sandbox",
+    "SandboxServiceManager",
+    # From `snapd.py`
+    "SnapdClient",
+    "SnapdServiceManager",
+    # From `snapshots.py`
+    "Generation",
+    "SnapshotStore",
+    # From `sources.py`
+    "InstallSource",
+    # From `stages.py`
+    "StagedExecutor",
+    # From `systemd.py`
+    "DBusServiceManager",
+    "SystemdBus",
 ]
 
 from .base import SlurmManager
@@ -43,5 +74,16 @@ from .constants import (
     SLURMRESTD_GROUP,
     SLURMRESTD_USER,
 )
-from .errors import SlurmOpsError
+from .dropins import DropInManager
+from .errors import ServiceGroupError, SlurmOpsError
 from .options import marshal_options, parse_options
+from .parallel import ServiceGroup, run_parallel
+from .provision import ProvisioningPlan, index_age
+from .resources import ResourceProfile
+from .restarts import CoalescingServiceManager, RestartAction, RestartCoordinator
+from .sandbox import Sandbox, SandboxServiceManager
+from .snapd import SnapdClient, SnapdServiceManager
+from .snapshots import Generation, SnapshotStore
+from .sources import InstallSource
+from .stages import StagedExecutor
+from .systemd import DBusServiceManager, SystemdBus
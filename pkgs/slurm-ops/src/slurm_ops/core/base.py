@@ -21,7 +21,11 @@ __all__ = [
 ]
 
 import base64
+import grp
+import hashlib
 import logging
+import os
+import pwd
 import secrets
 import shlex
 import shutil
@@ -34,10 +38,8 @@ from pathlib import Path
 from subprocess import CalledProcessError
 from typing import Any, Protocol
 
-import distro
-import yaml
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
+# `cryptography`, `distro`, and `yaml` are imported where they are used as they are slow to
+# import, and most charm hooks never need them.
 from hpc_libs.machine import (
     EnvManager,
     ServiceManager,
@@ -49,10 +51,25 @@ from hpc_libs.machine import (
     systemctl,
 )
 
+from .config import SlurmConfigManager
+from .dropins import DropInManager
 from .errors import SlurmOpsError
 from .options import marshal_options, parse_options
+from .provision import ProvisioningPlan
+from .resources import ResourceProfile
+from .restarts import CoalescingServiceManager, RestartCoordinator
+from .sandbox import Sandbox
+from .snapd import SnapdClient, SnapdServiceManager
+from .snapshots import SnapshotStore
+from .systemd import DBusServiceManager, SystemdBus
+from .versions import VersionCache, dpkg_status_key, snap_revision_key
 
 _logger = logging.getLogger(__name__)
+_versions = VersionCache("/var/cache/slurm-ops/versions.json")
+# Shared by every service manager so that a hook only opens one connection to the system bus.
+_systemd_bus = SystemdBus()
+# Shared by every snap service manager so that a hook only opens one connection to snapd.
+_snapd = SnapdClient()
 UBUNTU_HPC_PPA_KEY = """
 -----BEGIN PGP PUBLIC KEY BLOCK-----
 Comment: Hostname:
@@ -96,9 +113,19 @@ class OpsManager(Protocol):  # pragma: no cover
     def env_manager_for(self, service: str) -> EnvManager:  # noqa D102
         raise NotImplementedError
 
+    def reload_service(self, service: str) -> None:  # noqa D102
+        raise NotImplementedError
+
+    def dropin_manager_for(self, service: str) -> DropInManager:  # noqa D102
+        raise NotImplementedError
+
     def install(self) -> None:  # noqa D102
         raise NotImplementedError
 
+    def provision(self, plan: ProvisioningPlan) -> None:
+        """Add the steps needed to install Slurm to a provisioning plan."""
+        plan.add("slurm", setup=self.install)
+
     def version(self) -> str:  # noqa D102
         raise NotImplementedError
 
@@ -110,6 +137,10 @@ class OpsManager(Protocol):  # pragma: no cover
         except SlurmOpsError:
             return False
 
+    def file_owner(self, user: str, group: str) -> tuple[str, str]:
+        """Get the owner of the files written for a service that runs as `user:group`."""
+        return user, group
+
     @property
     def etc_path(self) -> Path:  # noqa D102
         raise NotImplementedError
@@ -134,11 +165,21 @@ class SecretManager(Protocol):  # pragma: no cover
         """Generate a new, cryptographically secure secret."""
         raise NotImplementedError
 
+    @property
+    def id(self) -> str:
+        """Get the stable content ID of the current secret."""
+        raise NotImplementedError
+
     @property
     def path(self) -> Path:
         """Get path to the secret file."""
         raise NotImplementedError
 
+    @property
+    def changed(self) -> bool:
+        """Check if the secret file has been set by this secret manager."""
+        raise NotImplementedError
+
 
 class _AptManager(OpsManager):
     """Operations manager for the Slurm Debian package backend.
@@ -149,26 +190,79 @@ class _AptManager(OpsManager):
         ensure the new command correctly passes the environment variable to the command.
     """
 
-    def __init__(self, service: str, /) -> None:
+    def __init__(self, service: str, /, bus: SystemdBus | None = None) -> None:
         self._service_name = service
+        self._bus = bus
+
+    def service_manager_for(self, service: str) -> ServiceManager:
+        """Return the `ServiceManager` for the specified `ServiceType`.
+
+        Notes:
+            - Services are controlled over D-Bus if this manager was created with a
+              `SystemdBus`, otherwise with `systemctl`.
+        """
+        if self._bus is not None:
+            return DBusServiceManager(service, self._bus)
 
-    def service_manager_for(self, service: str) -> SystemctlServiceManager:
-        """Return the `ServiceManager` for the specified `ServiceType`."""
         return SystemctlServiceManager(service)
 
     def env_manager_for(self, service: str) -> EnvManager:
         """Return the `_EnvManager` for the specified `ServiceType`."""
         return EnvManager(file=f"/etc/default/{service}")
 
+    def reload_service(self, service: str) -> None:
+        """Reload the configuration of a service without restarting it."""
+        if self._bus is not None:
+            self._bus.run_job("ReloadUnit", service)
+        else:
+            systemctl("reload", service)
+
+    def dropin_manager_for(self, service: str) -> DropInManager:
+        """Return the `DropInManager` for the specified `ServiceType`."""
+        return DropInManager(f"{service}.service", reload=self._daemon_reload)
+
+    def _daemon_reload(self) -> None:
+        """Reload the systemd manager configuration."""
+        if self._bus is not None:
+            self._bus.reload()
+        else:
+            systemctl("daemon-reload")
+
     def install(self) -> None:
         """Install Slurm using the `slurm-wlm` Debian package set."""
-        self._init_ubuntu_hpc_ppa()
-        self._install_service()
+        plan = ProvisioningPlan()
+        self.provision(plan)
+        plan.apply()
+
+    def provision(self, plan: ProvisioningPlan) -> None:
+        """Add the steps needed to install the `slurm-wlm` Debian package set to a plan.
+
+        Notes:
+            - The Ubuntu HPC PPA is added to the `apt` sources immediately so that the
+              package index is updated with the PPA enabled when the plan is applied.
+              The PPA is not used if the plan installs from a local install source.
+        """
+        if plan.source is None:
+            self._init_ubuntu_hpc_ppa()
+
+        plan.add(self._service_name, self._service_packages(), setup=self._setup_service)
+
+    def _setup_service(self) -> None:
+        """Prepare the Slurm service once its packages are installed."""
+        _versions.invalidate(self._service_name)
         self._create_state_save_location()
         self._apply_overrides()
 
     def version(self) -> str:
-        """Get the current version of Slurm installed on the system."""
+        """Get the current version of Slurm installed on the system.
+
+        Notes:
+            - The version is cached until the dpkg status file changes.
+        """
+        return _versions.get(self._service_name, dpkg_status_key(), self._version)
+
+    def _version(self) -> str:
+        """Query dpkg for the current version of Slurm installed on the system."""
         try:
             return apt.DebianPackage.from_installed_package(self._service_name).version.number
         except apt.PackageNotFoundError as e:
@@ -189,8 +283,15 @@ class _AptManager(OpsManager):
         """Initialize `apt` to use Ubuntu HPC Debian package repositories.
 
         Raises:
-            SlurmOpsError: Raised if `apt` fails to update with Ubuntu HPC repositories enabled.
+            SlurmOpsError: Raised if `apt` fails to add the Ubuntu HPC repositories.
+
+        Notes:
+            - The repositories are only added if they are not configured yet, so the `apt`
+              package index does not need to be updated again on every install.
+            - The package index is updated by the `ProvisioningPlan` that installs Slurm.
         """
+        import distro
+
         _logger.debug("initializing apt to use ubuntu hpc debian package repositories")
         try:
             experimental = apt.DebianRepository(
@@ -200,10 +301,18 @@ class _AptManager(OpsManager):
                 release=distro.codename(),
                 groups=["main"],
             )
-            experimental.import_key(UBUNTU_HPC_PPA_KEY)
             repositories = apt.RepositoryMapping()
+            if any(
+                repository.enabled
+                and repository.uri == experimental.uri
+                and repository.release == experimental.release
+                for repository in repositories
+            ):
+                _logger.debug("ubuntu hpc debian package repositories already configured")
+                return
+
+            experimental.import_key(UBUNTU_HPC_PPA_KEY)
             repositories.add(experimental)
-            apt.update()
         except (apt.GPGKeyError, CalledProcessError) as e:
             raise SlurmOpsError(
                 f"failed to initialize apt to use ubuntu hpc repositories. reason: {e}"
@@ -227,12 +336,8 @@ class _AptManager(OpsManager):
         ulimit_config_file.write_text(ulimit_config)
         ulimit_config_file.chmod(0o644)
 
-    def _install_service(self) -> None:
-        """Install Slurm service and other necessary packages.
-
-        Raises:
-            SlurmOpsError: Raised if `apt` fails to install the required Slurm packages.
-        """
+    def _service_packages(self) -> list[str]:
+        """Get the packages needed by the Slurm service."""
         packages = [self._service_name]
         match self._service_name:
             case "sackd":
@@ -249,11 +354,7 @@ class _AptManager(OpsManager):
                     self._service_name,
                 )
 
-        _logger.debug("installing packages %s with apt", packages)
-        try:
-            apt.add_package(packages)
-        except (apt.PackageNotFoundError, apt.PackageError) as e:
-            raise SlurmOpsError(f"failed to install {self._service_name}. reason: {e}")
+        return packages
 
     def _create_state_save_location(self) -> None:
         """Create `StateSaveLocation` for Slurm services.
@@ -272,25 +373,22 @@ class _AptManager(OpsManager):
         shutil.chown(target, "slurm", "slurm")
 
     def _apply_overrides(self) -> None:
-        """Override defaults supplied provided by Slurm Debian packages."""
+        """Override defaults supplied provided by Slurm Debian packages.
+
+        Notes:
+            - The systemd manager configuration is only reloaded if a unit file or
+              drop-in file changed.
+        """
+        dropins = self.dropin_manager_for(self._service_name)
         match self._service_name:
             case "sackd":
                 _logger.debug("overriding default sackd service configuration")
-                sackd_restart_override = Path(
-                    "/etc/systemd/system/sackd.service.d/10-charmed-hpc.conf"
-                )
-                sackd_restart_override.parent.mkdir(exist_ok=True, parents=True)
-                sackd_restart_override.write_text(
-                    textwrap.dedent(
-                        """
-                        [Unit]
-                        StartLimitIntervalSec=90
-                        StartLimitBurst=10
-                        [Service]
-                        Restart=on-failure
-                        RestartSec=10
-                        """
-                    )
+                dropins.set(
+                    "10-charmed-hpc",
+                    {
+                        "Unit": {"StartLimitIntervalSec": 90, "StartLimitBurst": 10},
+                        "Service": {"Restart": "on-failure", "RestartSec": 10},
+                    },
                 )
                 # TODO: https://github.com/charmed-hpc/hpc-libs/issues/54 -
                 #   Make `sackd` create its service environment file so that we
@@ -300,45 +398,33 @@ class _AptManager(OpsManager):
             case "slurmctld":
                 _logger.debug("overriding default slurmctld service configuration")
                 self._set_ulimit()
-
-                nofile_override = Path(
-                    "/etc/systemd/system/slurmctld.service.d/10-charmed-hpc.conf"
-                )
-                nofile_override.parent.mkdir(exist_ok=True, parents=True)
-                nofile_override.write_text(
-                    textwrap.dedent(
-                        """
-                        [Service]
-                        LimitMEMLOCK=infinity
-                        LimitNOFILE=1048576
-                        Restart=on-failure
-                        RestartSec=10
-                        """
-                    )
+                dropins.set(
+                    "10-charmed-hpc",
+                    {
+                        "Service": {
+                            "LimitMEMLOCK": "infinity",
+                            "LimitNOFILE": 1048576,
+                            "Restart": "on-failure",
+                            "RestartSec": 10,
+                        },
+                    },
                 )
                 systemctl("disable", "--now", "munge")
             case "slurmd":
                 _logger.debug("overriding default slurmd service configuration")
                 self._set_ulimit()
-
-                nofile_override = Path("/etc/systemd/system/slurmd.service.d/10-charmed-hpc.conf")
-                nofile_override.parent.mkdir(exist_ok=True, parents=True)
-                nofile_override.write_text(
-                    textwrap.dedent(
-                        """
-                        [Unit]
-                        StartLimitIntervalSec=90
-                        StartLimitBurst=10
-
-                        [Service]
-                        LimitMEMLOCK=infinity
-                        LimitNOFILE=1048576
-                        Restart=on-failure
-                        RestartSec=10
-                        """
-                    )
+                dropins.set(
+                    "10-charmed-hpc",
+                    {
+                        "Unit": {"StartLimitIntervalSec": 90, "StartLimitBurst": 10},
+                        "Service": {
+                            "LimitMEMLOCK": "infinity",
+                            "LimitNOFILE": 1048576,
+                            "Restart": "on-failure",
+                            "RestartSec": 10,
+                        },
+                    },
                 )
-
                 systemctl("disable", "--now", "munge")
             case "slurmrestd":
                 # TODO: https://github.com/charmed-hpc/hpc-libs/issues/39 -
@@ -375,53 +461,72 @@ class _AptManager(OpsManager):
                 Path("/etc/default/slurmrestd").touch(mode=0o644)
 
                 _logger.debug("overriding default slurmrestd service configuration")
-                config_override = Path("/usr/lib/systemd/system/slurmrestd.service")
-                config_override.write_text(
-                    textwrap.dedent(
-                        """
-                        [Unit]
-                        Description=Slurm REST daemon
-                        After=network.target slurmctld.service
-                        ConditionPathExists=/etc/slurm/slurm.conf
-                        Documentation=man:slurmrestd(8)
-
-                        [Service]
-                        Type=simple
-                        EnvironmentFile=-/etc/default/slurmrestd
-                        Environment="SLURM_JWT=daemon"
-                        ExecStart=/usr/sbin/slurmrestd $SLURMRESTD_OPTIONS -vv 0.0.0.0:6820
-                        ExecReload=/bin/kill -HUP $MAINPID
-                        User=slurmrestd
-                        Group=slurmrestd
-
-                        # Restart service if failed
-                        Restart=on-failure
-                        RestartSec=30s
-
-                        [Install]
-                        WantedBy=multi-user.target
-                        """
-                    )
+                dropins.set_unit(
+                    {
+                        "Unit": {
+                            "Description": "Slurm REST daemon",
+                            "After": "network.target slurmctld.service",
+                            "ConditionPathExists": "/etc/slurm/slurm.conf",
+                            "Documentation": "man:slurmrestd(8)",
+                        },
+                        "Service": {
+                            "Type": "simple",
+                            "EnvironmentFile": "-/etc/default/slurmrestd",
+                            "Environment": '"SLURM_JWT=daemon"',
+                            "ExecStart": (
+                                "/usr/sbin/slurmrestd $SLURMRESTD_OPTIONS -vv 0.0.0.0:6820"
+                            ),
+                            "ExecReload": "/bin/kill -HUP $MAINPID",
+                            "User": "slurmrestd",
+                            "Group": "slurmrestd",
+                            "Restart": "on-failure",
+                            "RestartSec": "30s",
+                        },
+                        "Install": {"WantedBy": "multi-user.target"},
+                    },
+                    path="/usr/lib/systemd/system",
                 )
             case _:
                 _logger.debug("'%s' does not require any overrides", self._service_name)
 
-        systemctl("daemon-reload")
+        dropins.apply()
 
 
 class _SnapManager(OpsManager):
-    """Operations manager for the Slurm snap backend."""
+    """Operations manager for the Slurm snap backend.
 
-    def service_manager_for(self, service: str) -> SnapServiceManager:
+    Notes:
+        Service operations and version queries go through the snapd REST API if the snapd
+        socket exists, otherwise they fall back to the `snap` CLI.
+    """
+
+    def service_manager_for(self, service: str) -> ServiceManager:
         """Return the `ServiceManager` for the specified `ServiceType`."""
+        if _snapd.available:
+            return SnapdServiceManager(service, _snapd, snap="slurm")
+
         return SnapServiceManager(service, snap="slurm")
 
     def env_manager_for(self, service: str) -> EnvManager:
         """Return the `_EnvManager` for the specified `ServiceType`."""
         return EnvManager(file="/var/snap/slurm/common/.env")
 
+    def reload_service(self, service: str) -> None:
+        """Reload the configuration of a service without restarting it."""
+        if _snapd.available:
+            _snapd.service_action("restart", f"slurm.{service}", reload=True)
+        else:
+            snap("restart", "--reload", f"slurm.{service}")
+
+    def dropin_manager_for(self, service: str) -> DropInManager:
+        """Return the `DropInManager` for the specified `ServiceType`."""
+        return DropInManager(
+            f"snap.slurm.{service}.service", reload=lambda: systemctl("daemon-reload")
+        )
+
     def install(self) -> None:
         """Install Slurm using the `slurm` snap."""
+        _versions.invalidate("slurm")
         snap("install", "slurm", "--channel", "23.11/stable", "--classic")
         self._create_state_save_location()
         self._apply_overrides()
@@ -435,7 +540,26 @@ class _SnapManager(OpsManager):
             return False
 
     def version(self) -> str:
-        """Get the current version of the `slurm` snap installed on the system."""
+        """Get the current version of the `slurm` snap installed on the system.
+
+        Notes:
+            - The version is cached until the current revision of the `slurm` snap changes.
+        """
+        return _versions.get("slurm", snap_revision_key("slurm"), self._version)
+
+    def _version(self) -> str:
+        """Query snapd for the current version of the `slurm` snap installed on the system."""
+        if _snapd.available:
+            info = _snapd.snap("slurm")
+            if info is None:
+                raise SlurmOpsError(
+                    "unable to retrieve snap info. ensure slurm is correctly installed"
+                )
+
+            return info["version"]
+
+        import yaml
+
         info = yaml.safe_load(snap("info", "slurm")[0])
         version = info.get("installed")
         if version is None:
@@ -474,7 +598,136 @@ class _SnapManager(OpsManager):
     @staticmethod
     def _apply_overrides() -> None:
         """Override defaults provided by the Slurm snap."""
-        snap("stop", "--disable", "slurm.munged")
+        if _snapd.available:
+            _snapd.service_action("stop", "slurm.munged", disable=True)
+        else:
+            snap("stop", "--disable", "slurm.munged")
+
+
+class _SandboxManager(OpsManager):
+    """Operations manager for a sandboxed machine.
+
+    This backend runs the real configuration, secret, and drop-in code paths against a
+    sandbox root, so full hook flows can run in unit tests and benchmarks without root
+    privileges, `apt`, `snap`, or `systemd`.
+
+    Notes:
+        - Files are owned by the current user rather than the user the service runs as.
+    """
+
+    def __init__(self, service: str, sandbox: Sandbox, /) -> None:
+        self._service_name = service
+        self._sandbox = sandbox
+
+    def service_manager_for(self, service: str) -> ServiceManager:
+        """Return the sandboxed `ServiceManager` for the specified `ServiceType`."""
+        return self._sandbox.service(service)
+
+    def env_manager_for(self, service: str) -> EnvManager:
+        """Return the `_EnvManager` for the specified `ServiceType`."""
+        file = self._sandbox.path(f"/etc/default/{service}")
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.touch(mode=0o644, exist_ok=True)
+        return EnvManager(file=file)
+
+    def reload_service(self, service: str) -> None:
+        """Reload the configuration of a service without restarting it."""
+        self._sandbox.service(service).reload()
+
+    def dropin_manager_for(self, service: str) -> DropInManager:
+        """Return the `DropInManager` for the specified `ServiceType`."""
+        return DropInManager(
+            f"{service}.service",
+            reload=self._daemon_reload,
+            unit_path=self._sandbox.path("/etc/systemd/system"),
+        )
+
+    def _daemon_reload(self) -> None:
+        """Record a reload of the systemd manager configuration."""
+        self._sandbox.daemon_reloads += 1
+
+    def install(self) -> None:
+        """Mark Slurm as installed and create the directories the Slurm packages provide."""
+        self.etc_path.mkdir(parents=True, exist_ok=True)
+        (self.var_lib_path / "checkpoint").mkdir(mode=0o755, parents=True, exist_ok=True)
+        self._sandbox.installed = True
+
+    def version(self) -> str:
+        """Get the version of Slurm installed in the sandbox."""
+        if not self._sandbox.installed:
+            raise SlurmOpsError(f"unable to retrieve {self._service_name} version. not installed")
+
+        return self._sandbox.version
+
+    def file_owner(self, user: str, group: str) -> tuple[str, str]:
+        """Get the current user and group, which own every file written in the sandbox."""
+        return pwd.getpwuid(os.getuid()).pw_name, grp.getgrgid(os.getgid()).gr_name
+
+    @property
+    def etc_path(self) -> Path:
+        """Get the path to the Slurm configuration directory."""
+        return self._sandbox.path("/etc/slurm")
+
+    @property
+    def var_lib_path(self) -> Path:
+        """Get the path to the Slurm variable state data directory."""
+        return self._sandbox.path("/var/lib/slurm")
+
+
+class _SecretFile:
+    """Cached view of a secret file.
+
+    The content of the file is cached and keyed on the file's modification time and size, so
+    repeated reads of the secret within a hook only `stat` the file.
+
+    Notes:
+        - Writing content identical to the current content is skipped, so the file is not
+          rewritten or re-owned, and the secret manager does not report a change.
+    """
+
+    def __init__(self, file: Path, /, user: str, group: str) -> None:
+        self.path = file
+        self._user = user
+        self._group = group
+        self._cache: tuple[tuple[int, int], bytes, str] | None = None
+
+    def read(self) -> bytes:
+        """Read the content of the secret file."""
+        return self._load()[1]
+
+    def write(self, content: bytes) -> bool:
+        """Write the content of the secret file if it changed.
+
+        Returns:
+            `True` if the secret file was written, otherwise `False`.
+        """
+        try:
+            if self.read() == content:
+                _logger.debug("'%s' is unchanged. skipping write", self.path)
+                return False
+        except FileNotFoundError:
+            pass
+
+        self.path.write_bytes(content)
+        self.path.chmod(0o600)
+        shutil.chown(self.path, self._user, self._group)
+        self._cache = None
+        return True
+
+    @property
+    def id(self) -> str:
+        """Get the SHA-256 digest of the content of the secret file."""
+        return self._load()[2]
+
+    def _load(self) -> tuple[tuple[int, int], bytes, str]:
+        """Load the secret file, or return the cached content if the file is unchanged."""
+        stat = self.path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        if self._cache is None or self._cache[0] != key:
+            content = self.path.read_bytes()
+            self._cache = (key, content, hashlib.sha256(content).hexdigest())
+
+        return self._cache
 
 
 # TODO: https://github.com/charmed-hpc/hpc-libs/issues/36 -
@@ -487,22 +740,26 @@ class _JWTSecretManager(SecretManager):
     """Manage the `jwt_hs256.key` secret file."""
 
     def __init__(self, ops_manager: OpsManager, /, user: str, group: str) -> None:
-        self._file = ops_manager.etc_path / "jwt_hs256.key"
-        self._user = user
-        self._group = group
+        self._file = _SecretFile(ops_manager.etc_path / "jwt_hs256.key", user=user, group=group)
+        self._changed = False
 
     def get(self) -> str:
         """Get the contents of the current `jwt_hs256.key` secret file."""
-        return self._file.read_text()
+        return self._file.read().decode()
 
     def set(self, secret: str) -> None:
-        """Set the contents of the `jwt_hs256.key` secret file."""
-        self._file.write_text(secret)
-        self._file.chmod(0o600)
-        shutil.chown(self._file, self._user, self._group)
+        """Set the contents of the `jwt_hs256.key` secret file.
+
+        Notes:
+            - The secret file is not rewritten if `secret` is the current secret.
+        """
+        self._changed |= self._file.write(secret.encode())
 
     def generate(self) -> None:
         """Generate a new, cryptographically secure `jwt_hs256.key` secret."""
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import rsa
+
         key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
         self.set(
             key.private_bytes(
@@ -512,46 +769,81 @@ class _JWTSecretManager(SecretManager):
             ).decode()
         )
 
+    @property
+    def id(self) -> str:
+        """Get the SHA-256 digest of the current `jwt_hs256.key` secret."""
+        return self._file.id
+
     @property
     def path(self) -> Path:
         """Get the path to the `jwt_hs256.key` secret file."""
-        return self._file
+        return self._file.path
+
+    @property
+    def changed(self) -> bool:
+        """Check if the `jwt_hs256.key` secret file has been changed by this secret manager."""
+        return self._changed
 
 
 class _SlurmSecretManager(SecretManager):
     """Manage the `slurm.key` secret file."""
 
     def __init__(self, ops_manager: OpsManager, /, user: str, group: str) -> None:
-        self._file = ops_manager.etc_path / "slurm.key"
-        self._user = user
-        self._group = group
+        self._file = _SecretFile(ops_manager.etc_path / "slurm.key", user=user, group=group)
+        self._changed = False
 
     def get(self) -> str:
         """Get the contents of the current `slurm.key` secret file."""
-        return base64.b64encode(self._file.read_bytes()).decode()
+        return base64.b64encode(self._file.read()).decode()
 
     def set(self, secret: str) -> None:
-        """Set the contents of the `slurm.key` secret file."""
-        self._file.write_bytes(base64.b64decode(secret.encode()))
-        self._file.chmod(0o600)
-        shutil.chown(self._file, self._user, self._group)
+        """Set the contents of the `slurm.key` secret file.
+
+        Notes:
+            - The secret file is not rewritten if `secret` is the current secret.
+        """
+        self._changed |= self._file.write(base64.b64decode(secret.encode()))
 
     def generate(self) -> None:
         """Generate a new, cryptographically secure `slurm.key` secret."""
         key = secrets.token_bytes(2048)
         self.set(base64.b64encode(key).decode())
 
+    @property
+    def id(self) -> str:
+        """Get the SHA-256 digest of the current `slurm.key` secret."""
+        return self._file.id
+
     @property
     def path(self) -> Path:
         """Get the path to the `slurm.key` secret file."""
-        return self._file
+        return self._file.path
+
+    @property
+    def changed(self) -> bool:
+        """Check if the `slurm.key` secret file has been changed by this secret manager."""
+        return self._changed
+
+
+def _coalescing(
+    ops_manager: OpsManager, service: str, /, coordinator: RestartCoordinator
+) -> CoalescingServiceManager:
+    """Get a service manager that can defer restarts and reloads to the end of the hook."""
+    return CoalescingServiceManager(
+        service,
+        ops_manager.service_manager_for(service),
+        reload=lambda: ops_manager.reload_service(service),
+        coordinator=coordinator,
+    )
 
 
 class PrometheusExporterManager:
     """Manage `prometheus-slurm-exporter` service operations."""
 
-    def __init__(self, ops_manager: OpsManager) -> None:
-        self.service = ops_manager.service_manager_for("prometheus-slurm-exporter")
+    def __init__(self, ops_manager: OpsManager, /, coordinator: RestartCoordinator) -> None:
+        self.service = _coalescing(
+            ops_manager, "prometheus-slurm-exporter", coordinator=coordinator
+        )
         self._env_manager = ops_manager.env_manager_for("prometheus-slurm-exporter")
 
     @property
@@ -570,18 +862,49 @@ class PrometheusExporterManager:
 
 
 class SlurmManager(ABC):
-    """Base class for composing Slurm service managers."""
+    """Base class for composing Slurm service managers.
+
+    Args:
+        service: Name of the managed Slurm service.
+        snap: Use the `slurm` snap backend rather than the Debian package backend.
+        dbus: Control services over D-Bus rather than with `systemctl`.
+        sandbox: Run against a sandboxed machine rather than the host. Takes precedence over
+            `snap` and `dbus`.
+    """
 
-    def __init__(self, service: str, snap: bool = False) -> None:
+    def __init__(
+        self,
+        service: str,
+        snap: bool = False,
+        dbus: bool = False,
+        sandbox: Sandbox | None = None,
+    ) -> None:
         self._service = service
-        self._ops_manager = _SnapManager() if snap else _AptManager(service)
+        self._ops_manager: OpsManager
+        if sandbox is not None:
+            self._ops_manager = _SandboxManager(service, sandbox)
+        elif snap:
+            self._ops_manager = _SnapManager()
+        else:
+            self._ops_manager = _AptManager(service, bus=_systemd_bus if dbus else None)
+        self._file_user, self._file_group = self._ops_manager.file_owner(self.user, self.group)
         self._env_manager = self._ops_manager.env_manager_for(service)
-
-        self.service = self._ops_manager.service_manager_for(service)
-        self.key = _SlurmSecretManager(self._ops_manager, user=self.user, group=self.group)
-        self.jwt = _JWTSecretManager(self._ops_manager, user=self.user, group=self.group)
-        self.exporter = PrometheusExporterManager(self._ops_manager)
+        self._env_changed = False
+        self._units_changed = False
+        self._snapshots = SnapshotStore(self._ops_manager.var_lib_path / "snapshots")
+
+        self.restarts = RestartCoordinator()
+        self.service = _coalescing(self._ops_manager, service, coordinator=self.restarts)
+        self.dropins = self._ops_manager.dropin_manager_for(service)
+        self.key = _SlurmSecretManager(
+            self._ops_manager, user=self._file_user, group=self._file_group
+        )
+        self.jwt = _JWTSecretManager(
+            self._ops_manager, user=self._file_user, group=self._file_group
+        )
+        self.exporter = PrometheusExporterManager(self._ops_manager, coordinator=self.restarts)
         self.install = self._ops_manager.install
+        self.provision = self._ops_manager.provision
         self.is_installed = self._ops_manager.is_installed
         self.version = self._ops_manager.version
 
@@ -590,6 +913,20 @@ class SlurmManager(ABC):
         """Get the hostname of the machine the managed Slurm service is running on."""
         return socket.gethostname().split(".")[0]
 
+    @property
+    def changed(self) -> bool:
+        """Check if this manager has changed any configuration, secret, environment, or unit files.
+
+        Notes:
+            - Configuration files that were rewritten with identical content are not
+              considered changed.
+        """
+        return self._env_changed or self._units_changed or any(
+            manager.changed
+            for manager in vars(self).values()
+            if isinstance(manager, (SlurmConfigManager, _SlurmSecretManager, _JWTSecretManager))
+        )
+
     @property
     @abstractmethod
     def user(self) -> str:  # noqa D102  # pragma: no cover
@@ -600,12 +937,38 @@ class SlurmManager(ABC):
     def group(self) -> str:  # noqa D102  # pragma: no cover
         raise NotImplementedError
 
+    def set_resources(self, profile: ResourceProfile) -> bool:
+        """Apply a resource isolation profile to the managed Slurm service.
+
+        The profile is written to the `20-resources` drop-in of the service. An empty profile
+        deletes the drop-in so that the service runs with the systemd defaults again.
+
+        Returns:
+            `True` if the drop-in changed and the service must be restarted to apply it,
+            otherwise `False`.
+        """
+        with self.dropins.edit() as dropins:
+            if profile:
+                changed = dropins.set("20-resources", profile.sections())
+            else:
+                changed = dropins.delete("20-resources")
+
+        self._units_changed |= changed
+        return changed
+
     @contextmanager
     def _edit_options(self) -> Iterator[dict[str, Any]]:
-        """Edit `<SERVICE>_OPTIONS` in the service environment file."""
+        """Edit `<SERVICE>_OPTIONS` in the service environment file.
+
+        Notes:
+            - The service environment file is only written if the marshalled value of
+              `<SERVICE>_OPTIONS` changed.
+        """
         options = self._load_options()
+        original = marshal_options(options)
         yield options
-        self._save_options(options)
+        if marshal_options(options) != original:
+            self._save_options(options)
 
     def _load_options(self) -> dict[str, Any]:
         """Load `<SERVICE>_OPTIONS` from the service environment file."""
@@ -616,3 +979,4 @@ class SlurmManager(ABC):
         self._env_manager.set(
             {f"{self._service.upper()}_OPTIONS": marshal_options(options)}, quote=False
         )
+        self._env_changed = True
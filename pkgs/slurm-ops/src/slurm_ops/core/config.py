@@ -14,8 +14,14 @@
 
 """Configuration managers for Slurm operations managers."""
 
+import copy
+import hashlib
+import json
+import os
+import re
 import shutil
-from collections.abc import Iterator, Mapping, Iterable
+import tempfile
+from collections.abc import Callable, Iterator, Mapping, Iterable
 from contextlib import contextmanager
 from os import PathLike
 from pathlib import Path
@@ -24,10 +30,130 @@ from typing import Any
 
 from slurmutils import BaseEditor
 
+from .snapshots import Generation, SnapshotStore
+
+# Map of record sections to the key that starts each record line and the model attribute
+# that holds the records, e.g. `PartitionName=batch ...` lines are held by `partitions`.
+_RECORD_SECTIONS = {
+    "nodes": ("nodename", "nodes"),
+    "frontendnodes": ("frontendnodename", "frontend_nodes"),
+    "nodesets": ("nodeset", "nodesets"),
+    "partitions": ("partitionname", "partitions"),
+    "downnodes": ("downnodes", "down_nodes"),
+}
+
+_KEY_PATTERN = re.compile(r"\s*([^=\s#]+)")
+
+
+class _ParseCache:
+    """Cache of parsed configuration files.
+
+    Entries are keyed on the inode, modification time, and size of the configuration file,
+    so a repeated load of an unchanged file only costs a `stat()` call.
+
+    Notes:
+        - The cache returns the cached configuration itself. `SlurmConfigManager` copies it
+          before handing it out, so changes made by callers never reach the cache.
+    """
+
+    def __init__(self) -> None:
+        self._data: dict[tuple[type, Path], tuple[tuple[int, int, int], bytes, Any]] = {}
+        self._watchers: list[Callable[[Path], None]] = []
+
+    def load(self, editor: Any, file: Path) -> Any:
+        """Load a configuration file, parsing it only if it changed since the last load.
+
+        Raises:
+            FileNotFoundError: Raised if `file` does not exist.
+        """
+        key = self._key(file)
+        entry = self._data.get((editor.__class__, file))
+        if entry is None or entry[0] != key:
+            content = file.read_text()
+            entry = (key, _digest(content), editor.loads(content))
+            self._data[(editor.__class__, file)] = entry
+
+        return entry[2]
+
+    def get(self, editor: Any, file: Path) -> Any | None:
+        """Get the cached configuration of a file without parsing it.
+
+        Returns:
+            The cached configuration, or `None` if `file` has not been loaded since it was
+            last changed.
+
+        Raises:
+            FileNotFoundError: Raised if `file` does not exist.
+        """
+        entry = self._data.get((editor.__class__, file))
+        if entry is None or entry[0] != self._key(file):
+            return None
+
+        return entry[2]
+
+    def digest(self, file: Path) -> bytes | None:
+        """Get the digest of a configuration file's contents.
+
+        The file is only read if it has changed since it was last loaded.
+
+        Returns:
+            The SHA-256 digest of the file, or `None` if the file does not exist.
+        """
+        try:
+            key = self._key(file)
+        except FileNotFoundError:
+            return None
+
+        for (_, path), (k, digest, _) in self._data.items():
+            if path == file and k == key:
+                return digest
+
+        try:
+            return _digest(file.read_text())
+        except FileNotFoundError:
+            return None
+
+    def invalidate(self, file: Path) -> None:
+        """Drop all cached entries for a configuration file and notify watchers of the change."""
+        for k in [k for k in self._data if k[1] == file]:
+            del self._data[k]
+
+        for watcher in self._watchers:
+            watcher(file)
+
+    def watch(self, callback: Callable[[Path], None]) -> None:
+        """Call `callback` with the path of each configuration file that is changed."""
+        self._watchers.append(callback)
+
+    @staticmethod
+    def _key(file: Path) -> tuple[int, int, int]:
+        info = file.stat()
+        return info.st_ino, info.st_mtime_ns, info.st_size
+
+
+def _normalize(key: str) -> str:
+    """Normalize a configuration key, e.g. `slurmctld_host` or `SlurmctldHost`."""
+    return key.replace("_", "").lower()
+
+
+def _line_key(line: str) -> str:
+    """Get the normalized key of a configuration file line, or an empty string for comments."""
+    match = _KEY_PATTERN.match(line)
+    return match.group(1).lower() if match else ""
+
+
+def _digest(content: str) -> bytes:
+    """Get the SHA-256 digest of configuration file content."""
+    return hashlib.sha256(content.encode()).digest()
+
 
 class IncludeMapping[T: type[BaseEditor]](Mapping):
     """Map of include file names to `SlurmConfigManager` instances.
 
+    `SlurmConfigManager` instances are only created when an include file is first accessed.
+    Configuration managers created by the mapping update the mapping when they create or
+    delete their include file.
+
     Notes:
         - If an include file does not exist within the mapping, a `SlurmConfigManager`
           object will be created. This behavior is to reduce the amount of unnecessary
@@ -47,45 +173,178 @@ class IncludeMapping[T: type[BaseEditor]](Mapping):
         mode: int,
         user: str,
         group: str,
+        cache: _ParseCache | None = None,
+        changes: dict[Path, str | None] | None = None,
+        mtime: int | None = None,
     ) -> None:
         self._editor = editor
         self._path = path
         self._mode = mode
         self._user = user
         self._group = group
+        self._cache = cache
+        self._changes = changes
+        self._mtime = mtime
 
-        self._data = {
-            p.name: SlurmConfigManager(
-                self._editor,
-                file=p,
-                mode=self._mode,
-                user=self._user,
-                group=self._group,
-            )
-            for p in includes
-        }
+        self._data: dict[str, SlurmConfigManager | None] = {p.name: None for p in includes}
+        self._missing: dict[str, SlurmConfigManager] = {}
 
     def __getitem__(self, key, /) -> "SlurmConfigManager":
         try:
-            return self._data[key]
+            manager = self._data[key]
         except KeyError:
             return self.__missing__(key)
 
+        if manager is None:
+            manager = self._data[key] = self._new(key)
+
+        return manager
+
     def __len__(self) -> int:
         return len(self._data)
 
     def __iter__(self) -> Iterator[str]:
         return iter(self._data)
 
+    def __contains__(self, key: object, /) -> bool:
+        return key in self._data
+
     def __missing__(self, key: str) -> "SlurmConfigManager":
+        if key not in self._missing:
+            self._missing[key] = self._new(key)
+
+        return self._missing[key]
+
+    def _new(self, key: str) -> "SlurmConfigManager":
+        """Create a new configuration manager for an include file."""
         return SlurmConfigManager(
             self._editor,
             Path(self._path) / key,
             mode=self._mode,
             user=self._user,
             group=self._group,
+            cache=self._cache,
+            changes=self._changes,
+            index=self,
         )
 
+    def _update(self, manager: "SlurmConfigManager") -> None:
+        """Update the mapping after a configuration manager created or deleted its file.
+
+        Notes:
+            - The mapping is replaced rather than modified in place so that callers iterating
+              over the mapping are not affected.
+        """
+        name = manager.path.name
+        data = dict(self._data)
+        if manager.exists():
+            data[name] = self._missing.pop(name, None) or data.get(name) or manager
+        else:
+            data.pop(name, None)
+
+        self._data = data
+        self._mtime = _mtime(self._path)
+
+
+def _mtime(path: Path) -> int | None:
+    """Get the modification time of a directory, or `None` if it does not exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+class ConfigTransaction:
+    """Staged edits to a configuration file and its includes.
+
+    Configuration files are loaded on first access and kept in memory until the transaction
+    is committed. Use `SlurmConfigManager.transaction` to create a new transaction.
+
+    Args:
+        manager: Configuration manager of the main configuration file.
+    """
+
+    def __init__(self, manager: "SlurmConfigManager", /) -> None:
+        self._manager = manager
+        self._staged: dict[Path, tuple[SlurmConfigManager, Any]] = {}
+        self._deleted: dict[Path, SlurmConfigManager] = {}
+        self.includes: Mapping[str, Any] = _StagedIncludes(self)
+
+    @property
+    def config(self) -> Any:
+        """Get the staged configuration of the main configuration file."""
+        return self._stage(self._manager)
+
+    def delete(self, include: str, /) -> None:
+        """Delete an include file when the transaction is committed.
+
+        Args:
+            include: Name of the include file to delete.
+        """
+        manager = self._manager.includes[include]
+        self._staged.pop(manager.path, None)
+        self._deleted[manager.path] = manager
+
+    def _stage(self, manager: "SlurmConfigManager") -> Any:
+        """Stage a configuration file for editing."""
+        if manager.path not in self._staged:
+            self._deleted.pop(manager.path, None)
+            try:
+                config = manager.load()
+            except FileNotFoundError:
+                config = manager._editor.__model__()
+
+            self._staged[manager.path] = (manager, config)
+
+        return self._staged[manager.path][1]
+
+    def _commit(self) -> None:
+        """Write all staged configuration files.
+
+        Each changed configuration is first written to a temporary file next to its target.
+        The temporary files are only moved into place once all of them have been written.
+        Staged configurations that match the contents of their target file are not written.
+        """
+        pending = []
+        try:
+            for manager, config in self._staged.values():
+                content = manager._editor.dumps(config) + "\n"
+                if _digest(content) != manager._cache.digest(manager.path):
+                    pending.append((manager._write_temp(content), manager))
+
+            for temp, manager in pending:
+                created = not manager.exists()
+                manager._record_change(manager.path)
+                os.replace(temp, manager.path)
+                if created:
+                    manager._update_index()
+        finally:
+            for temp, manager in pending:
+                temp.unlink(missing_ok=True)
+                manager._cache.invalidate(manager.path)
+
+        for manager in self._deleted.values():
+            manager.delete()
+
+
+class _StagedIncludes(Mapping):
+    """Map of include file names to staged configurations."""
+
+    def __init__(self, transaction: ConfigTransaction, /) -> None:
+        self._transaction = transaction
+
+    def __getitem__(self, key: str) -> Any:
+        return self._transaction._stage(self._transaction._manager.includes[key])
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._transaction._manager.includes
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._transaction._manager.includes)
+
+    def __len__(self) -> int:
+        return len(self._transaction._manager.includes)
+
 
 class SlurmConfigManager[T: type[BaseEditor]]:
     """Slurm configuration manager.
@@ -96,9 +355,32 @@ class SlurmConfigManager[T: type[BaseEditor]]:
         mode: File access mode to assign the configuration file.
         user: System user that owns the managed configuration file.
         group: System group that owns the managed configuration file.
+        cache:
+            Parse cache to share with other configuration managers. A new cache is created
+            if no cache is provided. Include and snapshot managers share their parent's cache.
+        changes:
+            Map to record changed configuration files and their original contents in.
+            Include and snapshot managers share their parent's map.
+        index: Include mapping to notify when the configuration file is created or deleted.
+        store:
+            Snapshot store to save generations of the configuration file and its includes in.
+            If no store is provided, `save` and `restore` keep a single `.snapshot` copy of
+            each file next to the file.
     """
 
-    def __init__(self, editor: T, file: str | PathLike, mode: int, user: str, group: str) -> None:
+    def __init__(
+        self,
+        editor: T,
+        file: str | PathLike,
+        mode: int,
+        user: str,
+        group: str,
+        *,
+        cache: _ParseCache | None = None,
+        changes: dict[Path, str | None] | None = None,
+        index: IncludeMapping | None = None,
+        store: SnapshotStore | None = None,
+    ) -> None:
         # Cast to `Any` as we only want `editor` to be subtype of `BaseEditor`,
         # but not be a `BaseEditor` object.
         self._editor: Any = editor()
@@ -106,67 +388,440 @@ class SlurmConfigManager[T: type[BaseEditor]]:
         self._mode = mode
         self._user = user
         self._group = group
+        self._cache = cache if cache is not None else _ParseCache()
+        self._changes = changes if changes is not None else {}
+        self._index = index
+        self._store = store
+        self._includes: IncludeMapping | None = None
 
     def load(self) -> Any:
-        """Load the configuration file."""
-        return self._editor.load(self._file)
+        """Load the configuration file.
+
+        Notes:
+            - The configuration file is only parsed if it has changed since it was last loaded.
+              Each call returns a copy of the cached configuration, so modifying it does not
+              affect later loads. Use `edit` or `transaction` to modify the configuration file.
+        """
+        return copy.deepcopy(self._cache.load(self._editor, self.path))
+
+    def load_keys(self, *keys: str) -> Any:
+        """Load only some keys from the configuration file.
+
+        If the configuration file is already parsed and cached, the cached configuration is
+        returned. Otherwise, the configuration file is read line by line and only the lines
+        that set one of `keys` are parsed, so loading a single key from a large configuration
+        file does not build a model of every node and partition.
+
+        Args:
+            *keys:
+                Keys to load, e.g. `slurmctld_host` or `SlurmctldHost`. Record sections such as
+                `nodes` or `partitions` load all records in the section.
+
+        Returns:
+            A configuration that holds the requested keys. A copy of the cached configuration
+            also holds all other keys.
+
+        Raises:
+            FileNotFoundError: Raised if the configuration file does not exist.
 
-    def dump(self, config: Any) -> None:
+        Examples:
+            >>> manager.load_keys("slurmctld_host").slurmctld_host
+            ['juju-c9fc6f-2']
+        """
+        if (config := self._cache.get(self._editor, self.path)) is not None:
+            return copy.deepcopy(config)
+
+        wanted = set()
+        for key in map(_normalize, keys):
+            wanted.add(_RECORD_SECTIONS[key][0] if key in _RECORD_SECTIONS else key)
+
+        with self.path.open() as f:
+            lines = [line for line in f if _line_key(line) in wanted]
+
+        return self._editor.loads("".join(lines))
+
+    def records(self, section: str) -> Iterator[Any]:
+        """Iterate over the records in a section of the configuration file.
+
+        If the configuration file is already parsed and cached, copies of the cached records
+        are returned. Otherwise, records are parsed one line at a time as the iterator advances,
+        so callers that stop iterating early, e.g. after finding a single partition, do not
+        parse the remaining records.
+
+        Args:
+            section: Record section to iterate over, e.g. `nodes` or `partitions`.
+
+        Raises:
+            ValueError: Raised if `section` is not a record section.
+            FileNotFoundError: Raised if the configuration file does not exist.
+        """
+        if (normalized := _normalize(section)) not in _RECORD_SECTIONS:
+            raise ValueError(f"'{section}' is not a configuration record section")
+
+        return self._records(*_RECORD_SECTIONS[normalized])
+
+    def _records(self, key: str, attr: str) -> Iterator[Any]:
+        """Parse records that start with `key` one line at a time."""
+        if (config := self._cache.get(self._editor, self.path)) is not None:
+            records = getattr(config, attr)
+            for record in records.values() if isinstance(records, Mapping) else records:
+                yield copy.deepcopy(record)
+
+            return
+
+        with self.path.open() as f:
+            for line in f:
+                if _line_key(line) == key:
+                    records = getattr(self._editor.loads(line), attr)
+                    yield from records.values() if isinstance(records, Mapping) else records
+
+    def dump(self, config: Any) -> bool:
         """Dump a new configuration into the configuration file.
 
+        Returns:
+            `True` if the configuration file was written, `False` if the configuration file
+            already contains `config` and was left untouched.
+
         Warnings:
             - This method will overwrite the entire content of the configuration file.
               If you just want to update the content of the current configuration file,
               use the `edit` method instead.
         """
-        self._editor.dump(config, self._file, mode=self._mode, user=self._user, group=self._group)
+        content = self._editor.dumps(config) + "\n"
+        digest = self._cache.digest(self.path)
+        if _digest(content) == digest:
+            return False
+
+        temp = self._write_temp(content)
+        self._record_change(self.path)
+        try:
+            os.replace(temp, self.path)
+        finally:
+            temp.unlink(missing_ok=True)
+            self._cache.invalidate(self.path)
+
+        if digest is None:
+            self._update_index()
+
+        return True
 
     @contextmanager
     def edit(self) -> Iterator[Any]:
-        """Edit the contents of the current configuration file."""
-        with self._editor.edit(
-            self._file, mode=self._mode, user=self._user, group=self._group
-        ) as config:
-            yield config
-
-    def merge(self) -> None:
-        """Merge 'include' files into the main configuration file."""
-        includes = [include.load() for include in self.includes.values()]
-        with self.edit() as config:
-            for include in includes:
-                config.update(include)
+        """Edit the contents of the current configuration file.
+
+        Notes:
+            - An empty configuration is created if the configuration file does not exist.
+            - The configuration file is not rewritten if the edit does not change its contents.
+        """
+        try:
+            config = self.load()
+        except FileNotFoundError:
+            config = self._editor.__model__()
+
+        yield config
+        self.dump(config)
+
+    @contextmanager
+    def transaction(self) -> Iterator[ConfigTransaction]:
+        """Edit the main configuration file and its includes together.
+
+        Yields:
+            A `ConfigTransaction` object. Use `config` to edit the main configuration file,
+            and `includes[...]` to edit an include file.
+
+        Notes:
+            - Edits are only written when the context exits without raising an exception.
+              Each edited file is written once, and files are replaced using `rename` so
+              readers never observe a partially applied set of configuration files.
+
+        Examples:
+            >>> with slurmctld.config.transaction() as tx:
+            ...     tx.includes["slurm.conf.batch"].partitions["batch"] = partition
+            ...     tx.config.include = ["slurm.conf.batch"] + tx.config.include
+        """
+        transaction = ConfigTransaction(self)
+        yield transaction
+        transaction._commit()
+
+    def merge(self) -> bool:
+        """Merge 'include' files into the main configuration file.
+
+        Include files are merged in name order. Only include files that changed since the last
+        merge are re-applied, along with the include files merged after them so that later
+        include files still take precedence.
+
+        Returns:
+            `True` if the main configuration file changed, otherwise `False`.
+
+        Notes:
+            - The digests of the include files at the last merge are stored in the hidden
+              `.<file>.merge` file next to the main configuration file.
+            - All include files are re-applied if the main configuration file was changed
+              after the last merge, if an include file was deleted, or if a changed include
+              file no longer sets a key that it set at the last merge.
+        """
+        state = self._load_merge_state()
+        names = sorted(self.includes)
+        digests = {name: self.includes[name].digest() for name in names}
+
+        merged = state.get("includes", {})
+        merged_keys = state.get("keys", {})
+        start = 0
+        if state.get("main") == self.digest() and merged.keys() <= digests.keys():
+            start = next(
+                (i for i, name in enumerate(names) if merged.get(name) != digests[name]),
+                len(names),
+            )
+            if start == len(names):
+                return False
+
+        includes = {name: self.includes[name].load() for name in names[start:]}
+        keys = {name: sorted(include.dict()) for name, include in includes.items()}
+        if start and any(
+            name in merged
+            and merged[name] != digests[name]
+            and (name not in merged_keys or not set(merged_keys[name]) <= set(keys[name]))
+            for name in names[start:]
+        ):
+            # A changed include file dropped keys, so the values that earlier include files
+            # set for those keys must be merged again.
+            earlier = {name: self.includes[name].load() for name in names[:start]}
+            keys |= {name: sorted(include.dict()) for name, include in earlier.items()}
+            includes = earlier | includes
+
+        try:
+            config = self.load()
+        except FileNotFoundError:
+            config = self._editor.__model__()
+
+        for include in includes.values():
+            config.update(include)
+
+        changed = self.dump(config)
+        keys = {name: keys.get(name, merged_keys.get(name, [])) for name in names}
+        self._save_merge_state({"main": self.digest(), "includes": digests, "keys": keys})
+        return changed
 
     def save(self) -> None:
-        """Create a snapshot of the current configuration file."""
-        for p in [self.path] + [include.path for include in self.includes.values()]:
+        """Create a snapshot of the current configuration file and its includes.
+
+        Notes:
+            - If the configuration manager has a snapshot store, a new generation is only
+              saved if a file changed since the newest generation was saved.
+        """
+        files = [self.path] + [include.path for include in self.includes.values()]
+        if self._store is not None:
+            contents = {}
+            for p in files:
+                try:
+                    contents[p.name] = p.read_text()
+                except FileNotFoundError:
+                    pass
+
+            if contents:
+                self._store.save(self.path.name, contents)
+
+            return
+
+        for p in files:
             try:
                 shutil.copy(p, p.with_suffix(p.suffix + ".snapshot"))
             except FileNotFoundError:
                 pass
 
-    def restore(self) -> None:
-        """Restore the current configuration file from a snapshot."""
+    def restore(self, generation: int | None = None) -> None:
+        """Restore the current configuration file and its includes from a snapshot.
+
+        Args:
+            generation:
+                Generation to restore from the snapshot store. Defaults to the newest generation.
+                Only supported if the configuration manager has a snapshot store.
+
+        Raises:
+            SlurmOpsError: Raised if the generation cannot be loaded from the snapshot store.
+
+        Notes:
+            - A generation is restored as a whole. Include files that are not part of the
+              generation are deleted. All files are staged before any file is replaced, so a
+              failure to stage a file leaves the configuration untouched.
+        """
+        if self._store is not None:
+            self._restore_generation(self._store.load(self.path.name, generation))
+            return
+
         for snapshot in self.snapshots.values():
-            shutil.copy(snapshot.path, snapshot.path.parent / snapshot.path.stem)
+            target = snapshot.path.parent / snapshot.path.stem
+            self._record_change(target)
+            shutil.copy(snapshot.path, target)
+            self._cache.invalidate(target)
 
     def exists(self) -> bool:
         """Check whether the configuration file exists."""
         return self.path.exists()
 
+    def digest(self) -> str | None:
+        """Get the SHA-256 digest of the configuration file.
+
+        Returns:
+            The hex-encoded digest, or `None` if the configuration file does not exist.
+        """
+        digest = self._cache.digest(self.path)
+        return digest.hex() if digest is not None else None
+
+    def watch(self, callback: Callable[[Path], None]) -> None:
+        """Call `callback` after a configuration file is written or deleted by this manager.
+
+        Args:
+            callback:
+                Function to call with the path of the changed configuration file. Changes made
+                through include and snapshot managers are also reported.
+        """
+        self._cache.watch(callback)
+
     def delete(self) -> None:
         """Delete the configuration file."""
+        if not self.exists():
+            return
+
+        self._record_change(self.path)
         self.path.unlink(missing_ok=True)
+        self._cache.invalidate(self.path)
+        self._update_index()
+
+    def list_generations(self) -> list[Generation]:
+        """List the generations of the configuration file in the snapshot store, oldest first.
+
+        Returns:
+            The saved generations. An empty list is returned if the configuration manager
+            does not have a snapshot store.
+        """
+        return self._store.list_generations(self.path.name) if self._store is not None else []
+
+    def _restore_generation(self, files: Mapping[str, str]) -> None:
+        """Replace the configuration file and its includes with the files of a generation."""
+        if not files:
+            return
+
+        targets = {self.path.parent / name: content for name, content in files.items()}
+        removed = [
+            include.path for include in self.includes.values() if include.path not in targets
+        ]
+        pending = {}
+        try:
+            for target, content in targets.items():
+                if self._cache.digest(target) != _digest(content):
+                    pending[target] = self._write_temp(content)
+
+            for target, temp in pending.items():
+                self._record_change(target)
+                os.replace(temp, target)
+
+            for target in removed:
+                self._record_change(target)
+                target.unlink(missing_ok=True)
+        finally:
+            for target, temp in pending.items():
+                temp.unlink(missing_ok=True)
+
+            for target in [*pending, *removed]:
+                self._cache.invalidate(target)
+
+        # Include files may have been created or deleted.
+        self._includes = None
+
+    def _load_merge_state(self) -> dict[str, Any]:
+        """Load the digests and keys recorded by the last merge of the include files."""
+        try:
+            return json.loads(self._merge_state_path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save_merge_state(self, state: Mapping[str, Any]) -> None:
+        """Atomically record the digests and keys of the merged include files."""
+        os.replace(self._write_temp(json.dumps(state, sort_keys=True)), self._merge_state_path)
+
+    @property
+    def _merge_state_path(self) -> Path:
+        """Get path to the file that records the digests of the last merge."""
+        return self.path.parent / f".{self.path.name}.merge"
+
+    def _update_index(self) -> None:
+        """Update the include mapping after the configuration file is created or deleted."""
+        if self._index is not None:
+            self._index._update(self)
+
+    def _record_change(self, file: Path) -> None:
+        """Record that a configuration file is about to change.
+
+        Only the contents of the file before its first change are recorded.
+        """
+        if file not in self._changes:
+            try:
+                self._changes[file] = file.read_text()
+            except FileNotFoundError:
+                self._changes[file] = None
+
+    def _write_temp(self, content: str) -> Path:
+        """Write content to a temporary file in the configuration file's directory.
+
+        Returns:
+            Path to the temporary file. Permissions on the temporary file match the
+            permissions that would be set on the configuration file.
+        """
+        fd, temp = tempfile.mkstemp(prefix=f".{self.path.name}.", dir=self.path.parent)
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+
+            os.chmod(temp, self._mode)
+            shutil.chown(temp, self._user, self._group)
+        except BaseException:
+            os.unlink(temp)
+            raise
+
+        return Path(temp)
 
     @property
     def path(self) -> Path:
         """Get path to configuration file."""
         return Path(self._file)
 
+    @property
+    def changes(self) -> frozenset[Path]:
+        """Get the configuration files changed by this configuration manager.
+
+        Notes:
+            - Changes made through include and snapshot managers are also reported.
+        """
+        return frozenset(self._changes)
+
+    @property
+    def changed(self) -> bool:
+        """Check if this configuration manager has changed any configuration files."""
+        return bool(self._changes)
+
+    @property
+    def originals(self) -> MappingProxyType[Path, str | None]:
+        """Get the contents of changed configuration files before they were first changed.
+
+        Notes:
+            - Files that did not exist before they were changed map to `None`.
+        """
+        return MappingProxyType(self._changes)
+
     @property
     def includes(self) -> MappingProxyType[str, "SlurmConfigManager"]:
-        """Get paths to additional configuration files."""
-        return MappingProxyType(
-            IncludeMapping(
+        """Get paths to additional configuration files.
+
+        Notes:
+            - Include files are only listed again if the modification time of the configuration
+              file's directory has changed since the include files were last listed.
+        """
+        mtime = _mtime(self.path.parent)
+        if self._includes is None or mtime is None or self._includes._mtime != mtime:
+            self._includes = IncludeMapping(
                 [
                     p
                     for p in self.path.parent.glob(f"{self.path.name}.*")
@@ -177,8 +832,12 @@ class SlurmConfigManager[T: type[BaseEditor]]:
                 mode=self._mode,
                 user=self._user,
                 group=self._group,
+                cache=self._cache,
+                changes=self._changes,
+                mtime=mtime,
             )
-        )
+
+        return MappingProxyType(self._includes)
 
     @property
     def snapshots(self) -> MappingProxyType[str, "SlurmConfigManager"]:
@@ -191,6 +850,8 @@ class SlurmConfigManager[T: type[BaseEditor]]:
                     mode=self._mode,
                     user=self._user,
                     group=self._group,
+                    cache=self._cache,
+                    changes=self._changes,
                 )
                 for p in self.path.parent.glob(f"{self.path.name}*.snapshot")
             }
@@ -0,0 +1,199 @@
+# Copyright 2025 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Manage systemd unit files and drop-in overrides for Slurm services."""
+
+__all__ = ["DropInManager", "render_unit"]
+
+import logging
+import os
+import tempfile
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from os import PathLike
+from pathlib import Path
+from typing import Any
+
+_logger = logging.getLogger(__name__)
+
+UnitSections = Mapping[str, Mapping[str, Any]]
+
+
+def _value(value: Any) -> str:
+    """Render a single systemd setting value."""
+    if isinstance(value, bool):
+        return "yes" if value else "no"
+
+    return str(value)
+
+
+def render_unit(sections: UnitSections) -> str:
+    """Render systemd unit file content.
+
+    Settings with a list or tuple value are rendered once per item. Settings with a `None`
+    value are omitted.
+
+    Examples:
+        >>> print(render_unit({"Service": {"LimitNOFILE": 1048576, "Restart": "on-failure"}}))
+        [Service]
+        LimitNOFILE=1048576
+        Restart=on-failure
+        <BLANKLINE>
+    """
+    blocks = []
+    for section, settings in sections.items():
+        lines = [f"[{section}]"]
+        for key, value in settings.items():
+            values = value if isinstance(value, (list, tuple)) else [value]
+            lines.extend(f"{key}={_value(v)}" for v in values if v is not None)
+
+        blocks.append("\n".join(lines) + "\n")
+
+    return "\n".join(blocks)
+
+
+class DropInManager:
+    """Manage the unit file and drop-in overrides of a systemd service.
+
+    Content is only written if it differs from the content on disk, and the systemd manager
+    configuration is only reloaded if a file was written or deleted.
+
+    Examples:
+        >>> with slurmd.dropins.edit() as dropins:
+        ...     dropins.set("20-resources", {"Service": {"MemoryHigh": "90%"}})
+    """
+
+    def __init__(
+        self,
+        unit: str,
+        /,
+        reload: Callable[[], Any],
+        *,
+        unit_path: str | PathLike = "/etc/systemd/system",
+    ) -> None:
+        self._unit = unit
+        self._reload = reload
+        self._unit_path = Path(unit_path)
+        self._dirty = False
+
+    @property
+    def unit(self) -> str:
+        """Get the name of the managed systemd unit."""
+        return self._unit
+
+    @property
+    def path(self) -> Path:
+        """Get the path to the drop-in directory of the managed unit."""
+        return self._unit_path / f"{self._unit}.d"
+
+    @property
+    def dirty(self) -> bool:
+        """Check if a file was changed since the systemd manager configuration was reloaded."""
+        return self._dirty
+
+    def get(self, name: str) -> str | None:
+        """Get the content of a drop-in file, or `None` if it does not exist."""
+        try:
+            return (self.path / f"{name}.conf").read_text()
+        except FileNotFoundError:
+            return None
+
+    def names(self) -> list[str]:
+        """List the names of the drop-in files of the managed unit."""
+        return sorted(p.stem for p in self.path.glob("*.conf"))
+
+    def set(self, name: str, sections: UnitSections) -> bool:
+        """Set the content of a drop-in file.
+
+        Args:
+            name: Name of the drop-in file without the `.conf` suffix, e.g. "10-charmed-hpc".
+            sections: Sections of the drop-in file mapped to their settings.
+
+        Returns:
+            `True` if the drop-in file changed, otherwise `False`.
+        """
+        return self._write(self.path / f"{name}.conf", render_unit(sections))
+
+    def delete(self, name: str) -> bool:
+        """Delete a drop-in file.
+
+        Returns:
+            `True` if the drop-in file existed, otherwise `False`.
+        """
+        try:
+            (self.path / f"{name}.conf").unlink()
+        except FileNotFoundError:
+            return False
+
+        _logger.debug("deleted drop-in %s of %s", name, self._unit)
+        self._dirty = True
+        return True
+
+    def set_unit(self, sections: UnitSections, path: str | PathLike | None = None) -> bool:
+        """Set the content of the unit file itself.
+
+        Args:
+            sections: Sections of the unit file mapped to their settings.
+            path: Directory to write the unit file to. Defaults to the directory of the
+                drop-in files, e.g. `/etc/systemd/system`.
+
+        Returns:
+            `True` if the unit file changed, otherwise `False`.
+        """
+        directory = Path(path) if path is not None else self._unit_path
+        return self._write(directory / self._unit, render_unit(sections))
+
+    def apply(self) -> bool:
+        """Reload the systemd manager configuration if a file changed.
+
+        Returns:
+            `True` if the systemd manager configuration was reloaded, otherwise `False`.
+        """
+        if not self._dirty:
+            return False
+
+        _logger.debug("reloading systemd manager configuration for %s", self._unit)
+        self._reload()
+        self._dirty = False
+        return True
+
+    @contextmanager
+    def edit(self) -> Iterator["DropInManager"]:
+        """Edit drop-in files and reload the systemd manager configuration once on exit."""
+        yield self
+        self.apply()
+
+    def _write(self, file: Path, content: str) -> bool:
+        """Atomically write a file if its content changed."""
+        try:
+            if file.read_text() == content:
+                return False
+        except FileNotFoundError:
+            pass
+
+        file.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp = tempfile.mkstemp(prefix=f".{file.name}.", dir=file.parent)
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(content)
+
+            os.chmod(temp, 0o644)
+            os.replace(temp, file)
+        except BaseException:
+            Path(temp).unlink(missing_ok=True)
+            raise
+
+        _logger.debug("updated %s", file)
+        self._dirty = True
+        return True
@@ -19,3 +19,15 @@ from hpc_libs.errors import Error
 
 class SlurmOpsError(Error):
     """Error raised when a Slurm-related operation fails."""
+
+
+class ServiceGroupError(SlurmOpsError):
+    """Error raised when operations run on a group of services fail.
+
+    Attributes:
+        errors: Map of the names of the services whose operation failed to the error raised.
+    """
+
+    def __init__(self, message: str, /, errors: dict[str, BaseException]) -> None:
+        super().__init__(message)
+        self.errors = errors
@@ -0,0 +1,151 @@
+# Copyright 2025 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Run independent service operations at the same time."""
+
+__all__ = ["ServiceGroup", "run_parallel"]
+
+import logging
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any
+
+from hpc_libs.machine import ServiceManager
+
+from .errors import ServiceGroupError
+
+_logger = logging.getLogger(__name__)
+
+# Default time in seconds to wait for each operation to finish.
+DEFAULT_TIMEOUT = 90.0
+
+
+def run_parallel(
+    calls: Mapping[str, Callable[[], Any]], /, timeout: float | None = DEFAULT_TIMEOUT
+) -> dict[str, Any]:
+    """Run independent operations at the same time and wait for all of them to finish.
+
+    Args:
+        calls: Map of operation names, such as service names, to the operation to run.
+        timeout: Time in seconds to wait for each operation to finish. Operations are all
+            started at once, so this is also the longest time spent waiting overall.
+            `None` waits indefinitely.
+
+    Returns:
+        Map of operation names to the value returned by the operation.
+
+    Raises:
+        ServiceGroupError: Raised if any operation failed or did not finish within the timeout.
+            The error of each failed operation is available in `errors`. A failed operation
+            does not stop the other operations.
+
+    Notes:
+        - An operation that times out is not interrupted. It keeps running in the background
+          and its result is discarded.
+    """
+    results: dict[str, Any] = {}
+    errors: dict[str, BaseException] = {}
+    if len(calls) <= 1:
+        # Avoid the overhead of a thread pool if there is nothing to run concurrently.
+        for name, call in calls.items():
+            try:
+                results[name] = call()
+            except Exception as e:
+                errors[name] = e
+    else:
+        pool = ThreadPoolExecutor(max_workers=len(calls), thread_name_prefix="slurm-ops")
+        futures = {name: pool.submit(call) for name, call in calls.items()}
+        wait(futures.values(), timeout=timeout)
+        for name, future in futures.items():
+            if not future.done():
+                errors[name] = TimeoutError(f"timed out after {timeout} seconds")
+            elif (error := future.exception()) is not None:
+                errors[name] = error
+            else:
+                results[name] = future.result()
+
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    if errors:
+        for name, error in errors.items():
+            _logger.error("operation on %s failed. reason: %s", name, error)
+
+        raise ServiceGroupError(
+            "failed to run operation on "
+            + ", ".join(sorted(errors))
+            + ". reason: "
+            + "; ".join(f"{name}: {error}" for name, error in sorted(errors.items())),
+            errors=errors,
+        )
+
+    return results
+
+
+class ServiceGroup(ServiceManager):
+    """Control several independent services at the same time.
+
+    Each operation is run on every service in the group concurrently, so the time taken is
+    that of the slowest service rather than the sum of all services.
+
+    Examples:
+        >>> services = ServiceGroup(
+        ...     {"slurmctld": slurmctld.service, "exporter": slurmctld.exporter.service}
+        ... )
+        >>> services.stop()
+        >>> services.disable()
+
+    Notes:
+        - Only group services that do not depend on each other being started or stopped
+          in a particular order.
+    """
+
+    def __init__(
+        self,
+        services: Mapping[str, ServiceManager],
+        /,
+        timeout: float | None = DEFAULT_TIMEOUT,
+    ) -> None:
+        self._services = dict(services)
+        self._timeout = timeout
+
+    def start(self) -> None:
+        """Start every service in the group."""
+        self._run(lambda s: s.start())
+
+    def stop(self) -> None:
+        """Stop every service in the group."""
+        self._run(lambda s: s.stop())
+
+    def enable(self) -> None:
+        """Enable every service in the group."""
+        self._run(lambda s: s.enable())
+
+    def disable(self) -> None:
+        """Disable every service in the group."""
+        self._run(lambda s: s.disable())
+
+    def restart(self) -> None:
+        """Restart every service in the group."""
+        self._run(lambda s: s.restart())
+
+    def is_active(self) -> bool:
+        """Check if every service in the group is active."""
+        return all(self._run(lambda s: s.is_active()).values())
+
+    def _run(self, operation: Callable[[ServiceManager], Any]) -> dict[str, Any]:
+        """Run an operation on every service in the group at the same time."""
+        return run_parallel(
+            {name: (lambda s=s: operation(s)) for name, s in self._services.items()},
+            timeout=self._timeout,
+        )
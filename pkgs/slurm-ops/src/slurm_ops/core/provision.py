@@ -0,0 +1,283 @@
+# Copyright 2025 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Provision a machine with a single `apt` transaction."""
+
+__all__ = ["ProvisioningPlan", "index_age"]
+
+import logging
+import os
+import subprocess
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from os import PathLike
+from pathlib import Path
+
+from hpc_libs.machine import apt
+
+from .errors import SlurmOpsError
+from .sources import InstallSource
+from .stages import StagedExecutor
+
+_logger = logging.getLogger(__name__)
+
+# Default time in seconds that the `apt` package index is considered fresh for.
+DEFAULT_MAX_INDEX_AGE = 3600.0
+# Files touched whenever the `apt` package index is successfully updated.
+_UPDATE_STAMPS = (
+    Path("/var/lib/apt/periodic/update-success-stamp"),
+    Path("/var/cache/slurm-ops/apt-update-stamp"),
+)
+_LISTS = Path("/var/lib/apt/lists")
+_SOURCES = (Path("/etc/apt/sources.list"), Path("/etc/apt/sources.list.d"))
+
+
+def _mtime(path: Path) -> float | None:
+    """Get the modification time of a file, or `None` if the file does not exist."""
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+
+
+def index_age(
+    stamps: Iterable[str | PathLike] = _UPDATE_STAMPS,
+    lists: str | PathLike = _LISTS,
+    sources: Iterable[str | PathLike] = _SOURCES,
+) -> float | None:
+    """Get the age in seconds of the `apt` package index.
+
+    Args:
+        stamps: Files touched whenever the package index is successfully updated.
+        lists: Directory the package index is stored in.
+        sources: Files and directories listing the configured package repositories.
+
+    Returns:
+        Age of the package index, or `None` if the package index has never been updated or
+        a package repository was configured after the package index was last updated.
+    """
+    updated = max(
+        filter(None, [_mtime(Path(s)) for s in stamps] + [_mtime(Path(lists))]), default=None
+    )
+    if updated is None:
+        return None
+
+    for source in map(Path, sources):
+        files = source.glob("*") if source.is_dir() else [source]
+        if any((mtime := _mtime(f)) is not None and mtime > updated for f in files):
+            _logger.debug("'%s' changed since the apt package index was last updated", source)
+            return None
+
+    return max(time.time() - updated, 0.0)
+
+
+@dataclass
+class _Phase:
+    name: str
+    packages: tuple[str, ...] | Callable[[], Iterable[str]]
+    setup: Callable[[], None] | None
+    after: tuple[str, ...]
+    dpkg_lock: bool
+
+
+@dataclass
+class ProvisioningPlan:
+    """Plan for installing the packages needed by every provisioning phase at once.
+
+    Each phase declares the packages it needs and an optional setup step to run once they
+    are installed. Applying the plan updates the `apt` package index only if it is older
+    than `max_index_age`, installs the packages of every phase in a single `apt`
+    transaction, and runs the setup step of each phase.
+
+    Steps run as soon as the steps they depend on have finished, so independent steps run
+    at the same time. The setup step of a phase that needs packages runs after the
+    packages are installed. The setup step of a phase that does not need packages runs
+    straight away, alongside the package index update and install.
+
+    If the plan has an install `source`, packages are installed from that local mirror
+    instead, and only the package index of the mirror is updated.
+
+    Examples:
+        >>> plan = ProvisioningPlan()
+        >>> slurmd.provision(plan)
+        >>> plan.add("rdma", ["rdma-core", "infiniband-diags"], setup=override_ompi_conf)
+        >>> plan.apply()
+        {'update': 0.0, 'install': 41.2, 'slurmd': 0.1, 'rdma': 0.0}
+
+    Notes:
+        - `timings` records the time in seconds taken by the index update, the package
+          install, the package lookup of each phase with a package function, and the setup
+          step of each phase, in the order the steps finished. A skipped step takes no time.
+    """
+
+    max_index_age: float = DEFAULT_MAX_INDEX_AGE
+    source: InstallSource | None = None
+    timings: dict[str, float] = field(default_factory=dict, init=False)
+    _phases: list[_Phase] = field(default_factory=list, init=False, repr=False)
+
+    def add(
+        self,
+        phase: str,
+        packages: Iterable[str] | Callable[[], Iterable[str]] = (),
+        /,
+        setup: Callable[[], None] | None = None,
+        after: Iterable[str] = (),
+        dpkg_lock: bool = False,
+    ) -> None:
+        """Add a provisioning phase to the plan.
+
+        Args:
+            phase: Name of the phase, used in timings, status updates, and error messages.
+            packages: Packages needed by the phase, or a function returning the packages.
+                The function is called after the package index is updated, so it can query
+                the package index to decide which packages are needed.
+            setup: Step to run once the packages of the phase are installed.
+            after: Names of other phases whose setup step must finish before the setup
+                step of this phase starts.
+            dpkg_lock: Whether the setup step takes the dpkg lock, for example because it
+                runs `apt` or `dpkg` itself.
+        """
+        if not callable(packages):
+            packages = tuple(packages)
+
+        self._phases.append(_Phase(phase, packages, setup, tuple(after), dpkg_lock))
+
+    @property
+    def phases(self) -> list[str]:
+        """Get the names of the phases in the plan."""
+        return [phase.name for phase in self._phases]
+
+    def apply(self, on_change: Callable[[list[str]], None] | None = None) -> dict[str, float]:
+        """Apply the plan.
+
+        Args:
+            on_change: Function called with the names of the running steps whenever the
+                running steps change, such as to update the unit status. It is called from
+                the calling thread.
+
+        Returns:
+            Map of step names to the time in seconds taken by the step.
+
+        Raises:
+            SlurmOpsError: Raised if the package index fails to update or the packages fail
+                to install. Errors raised by the setup step of a phase are not wrapped.
+        """
+        resolved: dict[str, list[str]] = {}
+        executor = StagedExecutor()
+        executor.add("update", self.update_index, dpkg_lock=True)
+        lookups = []
+        for phase in self._phases:
+            if callable(packages := phase.packages):
+                lookup = f"{phase.name}-packages"
+                executor.add(
+                    lookup,
+                    lambda name=phase.name, packages=packages: resolved.update(
+                        {name: list(packages())}
+                    ),
+                    after=["update"],
+                )
+                lookups.append(lookup)
+
+        executor.add(
+            "install",
+            lambda: self._install(self._resolve(resolved)),
+            after=["update", *lookups],
+            dpkg_lock=True,
+        )
+        for phase in self._phases:
+            if phase.setup is not None:
+                needs_packages = callable(phase.packages) or bool(phase.packages)
+                executor.add(
+                    phase.name,
+                    phase.setup,
+                    after=[*phase.after, *(["install"] if needs_packages else [])],
+                    dpkg_lock=phase.dpkg_lock,
+                )
+
+        start = time.monotonic()
+        self.timings = executor.run(on_change=on_change)
+        _logger.info(
+            "provisioning took %.1fs (%s)",
+            time.monotonic() - start,
+            ", ".join(f"{name}: {seconds:.1f}s" for name, seconds in self.timings.items()),
+        )
+        return dict(self.timings)
+
+    def update_index(self) -> bool:
+        """Update the `apt` package index if it is older than `max_index_age`.
+
+        Returns:
+            `True` if the package index was updated, otherwise `False`.
+
+        Raises:
+            SlurmOpsError: Raised if the package index fails to update.
+
+        Notes:
+            - If the plan has an install `source`, only the package index of the source is
+              updated, and it is always updated as this does not reach the upstream archives.
+        """
+        if self.source is not None:
+            self.source.configure()
+            self.source.update()
+            return True
+
+        InstallSource.clear()
+        age = index_age()
+        if age is not None and age <= self.max_index_age:
+            _logger.debug("apt package index is %.0fs old. skipping update", age)
+            return False
+
+        _logger.info("updating apt package index")
+        try:
+            apt.update()
+        except subprocess.CalledProcessError as e:
+            raise SlurmOpsError(f"failed to update apt package index. reason: {e}")
+
+        stamp = _UPDATE_STAMPS[-1]
+        stamp.parent.mkdir(parents=True, exist_ok=True)
+        stamp.touch()
+        return True
+
+    def _install(self, packages: list[str]) -> None:
+        """Install packages in a single `apt-get install` transaction.
+
+        Notes:
+            - `apt.add_package` is not used as it runs `apt-get install` once per package.
+        """
+        if not packages:
+            return
+
+        _logger.info("installing packages %s with apt", packages)
+        try:
+            subprocess.run(
+                ["apt-get", "--yes", "install", *packages],
+                env={**os.environ, "DEBIAN_FRONTEND": "noninteractive"},
+                capture_output=True,
+                check=True,
+                text=True,
+            )
+        except subprocess.CalledProcessError as e:
+            raise SlurmOpsError(
+                f"failed to install packages for {', '.join(self.phases)}. reason: {e.stderr}"
+            )
+
+    def _resolve(self, resolved: dict[str, list[str]]) -> list[str]:
+        """Collect the packages needed by every phase, without duplicates."""
+        packages: dict[str, None] = {}
+        for phase in self._phases:
+            needed = resolved[phase.name] if callable(phase.packages) else phase.packages
+            packages.update(dict.fromkeys(needed))
+
+        return list(packages)
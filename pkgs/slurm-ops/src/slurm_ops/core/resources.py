@@ -0,0 +1,103 @@
+# Copyright 2025 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Isolate the resources used by Slurm services with systemd."""
+
+__all__ = ["ResourceProfile"]
+
+import re
+from dataclasses import dataclass, fields
+from typing import Any
+
+_CPUS = re.compile(r"^\d+(-\d+)?(,\d+(-\d+)?)*$")
+_MEMORY = re.compile(r"^(\d+[KMGT]?|\d{1,3}%|infinity)$")
+
+
+@dataclass(frozen=True)
+class ResourceProfile:
+    """Resource isolation profile of a Slurm service.
+
+    Attributes:
+        slice: systemd slice to run the service in, e.g. `slurm.slice`. The slice is created
+            implicitly by systemd when the service is started in it.
+        cpus: CPUs the service and its threads may run on, e.g. `0-7,64-71`. Sets both
+            `AllowedCPUs` and `CPUAffinity`.
+        memory_low: Memory protected from reclaim for the service, e.g. `8G` or `10%`.
+        io_weight: Relative I/O weight of the service between 1 and 10000.
+        nice: Scheduling priority of the service between -20 and 19.
+
+    Examples:
+        >>> ResourceProfile.from_str("slice=slurm.slice cpus=0-3 nice=-5")
+        ResourceProfile(slice='slurm.slice', cpus='0-3', memory_low=None, io_weight=None, nice=-5)
+    """
+
+    slice: str | None = None
+    cpus: str | None = None
+    memory_low: str | None = None
+    io_weight: int | None = None
+    nice: int | None = None
+
+    def __post_init__(self) -> None:  # noqa D105
+        if self.slice is not None and not self.slice.endswith(".slice"):
+            raise ValueError(f"invalid slice '{self.slice}'. slice names must end in '.slice'")
+        if self.cpus is not None and not _CPUS.match(self.cpus):
+            raise ValueError(f"invalid cpus '{self.cpus}'. expected a list such as '0-7,16'")
+        if self.memory_low is not None and not _MEMORY.match(self.memory_low):
+            raise ValueError(f"invalid memory-low '{self.memory_low}'")
+        if self.io_weight is not None and not 1 <= self.io_weight <= 10000:
+            raise ValueError(f"invalid io-weight {self.io_weight}. expected 1 to 10000")
+        if self.nice is not None and not -20 <= self.nice <= 19:
+            raise ValueError(f"invalid nice {self.nice}. expected -20 to 19")
+
+    def __bool__(self) -> bool:
+        """Check if the profile sets any resource control."""
+        return any(getattr(self, field.name) is not None for field in fields(self))
+
+    @classmethod
+    def from_str(cls, value: str, /) -> "ResourceProfile":
+        """Parse a resource profile from space-separated `key=value` pairs.
+
+        Keys are the attribute names of the profile with dashes in place of underscores,
+        e.g. `slice=slurm.slice cpus=0-7 memory-low=8G io-weight=500 nice=-5`.
+
+        Raises:
+            ValueError: Raised if the profile contains an unknown key or an invalid value.
+        """
+        names = {field.name.replace("_", "-"): field for field in fields(cls)}
+        kwargs: dict[str, Any] = {}
+        for pair in value.split():
+            key, sep, setting = pair.partition("=")
+            if not sep or key not in names:
+                raise ValueError(f"invalid resource profile setting '{pair}'")
+
+            field = names[key]
+            try:
+                kwargs[field.name] = int(setting) if field.type == int | None else setting
+            except ValueError:
+                raise ValueError(f"invalid {key} '{setting}'. expected an integer")
+
+        return cls(**kwargs)
+
+    def sections(self) -> dict[str, dict[str, Any]]:
+        """Get the systemd drop-in sections that apply this profile to a service."""
+        return {
+            "Service": {
+                "Slice": self.slice,
+                "AllowedCPUs": self.cpus,
+                "CPUAffinity": self.cpus,
+                "MemoryLow": self.memory_low,
+                "IOWeight": self.io_weight,
+                "Nice": self.nice,
+            }
+        }
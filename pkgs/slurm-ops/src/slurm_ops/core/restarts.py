@@ -0,0 +1,213 @@
+# Copyright 2025 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Coalesce restarts and reloads of Slurm services within a single charm hook."""
+
+__all__ = ["CoalescingServiceManager", "RestartAction", "RestartCoordinator"]
+
+import logging
+from collections.abc import Callable
+from enum import IntEnum
+
+from hpc_libs.machine import ServiceManager
+
+from .parallel import DEFAULT_TIMEOUT, run_parallel
+
+_logger = logging.getLogger(__name__)
+
+
+class RestartAction(IntEnum):
+    """Action requested for a service.
+
+    Actions are ordered so that merging two requests keeps the more disruptive action.
+    """
+
+    NONE = 0
+    RELOAD = 1
+    RESTART = 2
+
+
+class RestartCoordinator:
+    """Record restart and reload requests and run them once at the end of a hook.
+
+    Notes:
+        - Requests for the same service are merged. A restart wins over a reload, and
+          a reload wins over no action.
+        - Charms should call `flush` once the hook's event handlers have completed, for
+          example when the framework emits `pre_commit`. Charm state changed in a `commit`
+          observer is not saved.
+        - Each Slurm service manager creates its own coordinator, shared by its service and
+          exporter managers, so requests do not leak between managers or charm instances.
+    """
+
+    def __init__(self) -> None:
+        self._managers: dict[str, CoalescingServiceManager] = {}
+        self._pending: dict[str, CoalescingServiceManager] = {}
+
+    def flush(
+        self, *, parallel: bool = False, timeout: float | None = DEFAULT_TIMEOUT
+    ) -> dict[str, RestartAction]:
+        """Run the pending action of every service.
+
+        Args:
+            parallel: Run the pending actions of all services at the same time rather than
+                one after another. Only use this if the services do not depend on each other
+                being restarted in a particular order.
+            timeout: Time in seconds to wait for each action if `parallel` is set.
+
+        Returns:
+            The action run for each service that had a pending action.
+
+        Raises:
+            ServiceGroupError: Raised if `parallel` is set and any action failed. The actions
+                of the other services are still run.
+
+        Notes:
+            - A pending action is dropped before it is run, so an action that fails is not
+              retried by a later `flush`. The pending actions of services that were not
+              flushed yet are kept.
+        """
+        if parallel:
+            managers = dict(self._pending)
+            result = {name: manager.pending for name, manager in managers.items()}
+            run_parallel({name: manager.flush for name, manager in managers.items()}, timeout)
+            return result
+
+        result = {}
+        for name, manager in list(self._pending.items()):
+            action = manager.pending
+            manager.flush()
+            result[name] = action
+
+        return result
+
+    @property
+    def pending(self) -> dict[str, RestartAction]:
+        """Get the pending action of every service."""
+        return {name: manager.pending for name, manager in self._pending.items()}
+
+    def request(self, name: str, action: RestartAction) -> None:
+        """Request an action for a service by name.
+
+        This is used to request actions again that failed in an earlier hook.
+
+        Raises:
+            KeyError: Raised if no service named `name` is managed with this coordinator.
+        """
+        self._managers[name]._request(action)
+
+    def _register(self, name: str, manager: "CoalescingServiceManager") -> None:
+        """Register a service manager so that actions can be requested by name."""
+        self._managers[name] = manager
+
+    def _track(self, name: str, manager: "CoalescingServiceManager") -> None:
+        """Track a service manager with a pending action."""
+        self._pending[name] = manager
+
+    def _untrack(self, name: str) -> None:
+        """Stop tracking a service manager that no longer has a pending action."""
+        self._pending.pop(name, None)
+
+
+class CoalescingServiceManager(ServiceManager):
+    """Service manager that can defer restarts and reloads to the end of a hook.
+
+    `restart` and `reload` still act immediately for callers that need the service to be
+    restarted before they continue. An immediate restart also satisfies any pending request,
+    so it will not be repeated at the end of the hook.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        service: ServiceManager,
+        /,
+        reload: Callable[[], None],
+        coordinator: RestartCoordinator,
+    ) -> None:
+        self._name = name
+        self._service = service
+        self._reload = reload
+        self._coordinator = coordinator
+        self._pending = RestartAction.NONE
+        coordinator._register(name, self)
+
+    @property
+    def pending(self) -> RestartAction:
+        """Get the action that will be run for this service at the end of the hook."""
+        return self._pending
+
+    def request_restart(self) -> None:
+        """Request a restart of the service at the end of the hook."""
+        self._request(RestartAction.RESTART)
+
+    def request_reload(self) -> None:
+        """Request a reload of the service at the end of the hook."""
+        self._request(RestartAction.RELOAD)
+
+    def flush(self) -> None:
+        """Run the pending action of the service now."""
+        action = self._pending
+        self._set(RestartAction.NONE)
+        match action:
+            case RestartAction.RESTART:
+                self.restart()
+            case RestartAction.RELOAD:
+                self.reload()
+
+    def start(self) -> None:
+        """Start the service."""
+        self._service.start()
+
+    def stop(self) -> None:
+        """Stop the service and drop any pending action."""
+        self._service.stop()
+        self._set(RestartAction.NONE)
+
+    def enable(self) -> None:
+        """Enable the service."""
+        self._service.enable()
+
+    def disable(self) -> None:
+        """Disable the service."""
+        self._service.disable()
+
+    def restart(self) -> None:
+        """Restart the service now and drop any pending action."""
+        _logger.debug("restarting %s", self._name)
+        self._service.restart()
+        self._set(RestartAction.NONE)
+
+    def reload(self) -> None:
+        """Reload the service now and drop a pending reload."""
+        _logger.debug("reloading %s", self._name)
+        self._reload()
+        if self._pending == RestartAction.RELOAD:
+            self._set(RestartAction.NONE)
+
+    def is_active(self) -> bool:
+        """Check if the service is active."""
+        return self._service.is_active()
+
+    def _request(self, action: RestartAction) -> None:
+        """Merge a new request with the pending action."""
+        self._set(max(self._pending, action))
+
+    def _set(self, action: RestartAction) -> None:
+        """Set the pending action and register it with the coordinator."""
+        self._pending = action
+        if action == RestartAction.NONE:
+            self._coordinator._untrack(self._name)
+        else:
+            self._coordinator._track(self._name, self)
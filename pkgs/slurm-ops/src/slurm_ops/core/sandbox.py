@@ -0,0 +1,103 @@
+# Copyright 2025 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Run Slurm service managers against a sandboxed root rather than the host."""
+
+__all__ = ["Sandbox", "SandboxServiceManager"]
+
+from os import PathLike
+from pathlib import Path
+
+from hpc_libs.machine import ServiceManager
+
+
+class SandboxServiceManager(ServiceManager):
+    """In-process service manager that records service state without running any process.
+
+    Every operation is appended to `calls`, so tests and benchmarks can assert on or count
+    the service operations performed by a hook.
+    """
+
+    def __init__(self, service: str, /) -> None:
+        self._service = service
+        self.active = False
+        self.enabled = False
+        self.calls: list[str] = []
+
+    def start(self) -> None:
+        """Start the service."""
+        self.calls.append("start")
+        self.active = True
+
+    def stop(self) -> None:
+        """Stop the service."""
+        self.calls.append("stop")
+        self.active = False
+
+    def enable(self) -> None:
+        """Enable the service."""
+        self.calls.append("enable")
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Disable the service."""
+        self.calls.append("disable")
+        self.enabled = False
+
+    def restart(self) -> None:
+        """Restart the service."""
+        self.calls.append("restart")
+        self.active = True
+
+    def reload(self) -> None:
+        """Reload the configuration of the service."""
+        self.calls.append("reload")
+
+    def is_active(self) -> bool:
+        """Check if the service is active."""
+        return self.active
+
+
+class Sandbox:
+    """Sandboxed machine for Slurm service managers.
+
+    Files that the apt backend writes under `/` are written under `root` instead, services
+    are replaced by `SandboxServiceManager` instances shared by every manager using this
+    sandbox, and the installed Slurm version is reported from `version` rather than dpkg.
+
+    Examples:
+        >>> sandbox = Sandbox(tmp_path)
+        >>> slurmctld = SlurmctldManager(sandbox=sandbox)
+        >>> slurmctld.install()
+        >>> slurmctld.config.path
+        PosixPath('/tmp/.../etc/slurm/slurm.conf')
+    """
+
+    def __init__(self, root: str | PathLike, /, version: str = "23.11.7") -> None:
+        self.root = Path(root)
+        self.version = version
+        self.installed = False
+        self.daemon_reloads = 0
+        self._services: dict[str, SandboxServiceManager] = {}
+
+    def path(self, path: str | PathLike) -> Path:
+        """Map an absolute path on the host to its location in the sandbox."""
+        return self.root / Path(path).relative_to("/")
+
+    def service(self, service: str) -> SandboxServiceManager:
+        """Get the sandboxed service manager for a service."""
+        if service not in self._services:
+            self._services[service] = SandboxServiceManager(service)
+
+        return self._services[service]
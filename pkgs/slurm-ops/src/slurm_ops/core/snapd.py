@@ -0,0 +1,245 @@
+# Copyright 2025 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Manage snaps through the snapd REST API rather than by forking the `snap` CLI."""
+
+__all__ = ["SNAPD_SOCKET", "SnapdClient", "SnapdServiceManager"]
+
+import http.client
+import json
+import socket
+import threading
+import time
+from os import PathLike
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlencode
+
+from hpc_libs.machine import ServiceManager
+
+from .errors import SlurmOpsError
+
+SNAPD_SOCKET = Path("/run/snapd.socket")
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a UNIX domain socket."""
+
+    def __init__(self, path: str | PathLike, timeout: float) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self._path = str(path)
+
+    def connect(self) -> None:
+        """Connect to the UNIX domain socket."""
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self._path)
+
+
+class SnapdClient:
+    """Client for the snapd REST API.
+
+    A single keep-alive connection to the snapd socket is opened on first use and reused
+    for every later request, so a hook that checks or controls several snap services only
+    connects once.
+
+    Notes:
+        - Asynchronous snapd operations, such as starting a service, are waited on until the
+          change is ready, which matches the default behavior of the `snap` CLI.
+    """
+
+    def __init__(
+        self,
+        socket_path: str | PathLike = SNAPD_SOCKET,
+        *,
+        timeout: float = 30.0,
+        poll_interval: float = 0.1,
+    ) -> None:
+        self._socket_path = Path(socket_path)
+        self._timeout = timeout
+        self._poll_interval = poll_interval
+        self._conn: _UnixHTTPConnection | None = None
+        # Requests from several threads share the kept-alive connection one at a time.
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> bool:
+        """Check if the snapd socket exists."""
+        return self._socket_path.exists()
+
+    def snap(self, name: str) -> dict[str, Any] | None:
+        """Get information about an installed snap.
+
+        Returns:
+            The snap information reported by snapd, or `None` if the snap is not installed.
+        """
+        response = self._send("GET", f"/v2/snaps/{name}")
+        if response.get("result", {}).get("kind") == "snap-not-found":
+            return None
+
+        return self._result(response)
+
+    def services(self, *names: str) -> dict[str, dict[str, Any]]:
+        """Get the status of snap services.
+
+        Args:
+            names: Names of the services in the `<snap>.<app>` format.
+
+        Returns:
+            Map of service names to the status reported by snapd.
+        """
+        query = urlencode({"names": ",".join(names), "select": "service"})
+        apps = self._request("GET", f"/v2/apps?{query}")
+        return {f"{app['snap']}.{app['name']}": app for app in apps}
+
+    def service_action(self, action: str, *names: str, **options: bool) -> None:
+        """Run a service action and wait for snapd to finish it.
+
+        Args:
+            action: Action to run. Either "start", "stop", or "restart".
+            names: Names of the services in the `<snap>.<app>` format.
+            options: Extra options for the action, such as `enable`, `disable`, or `reload`.
+        """
+        body = {"action": action, "names": list(names)} | options
+        self.wait(self._request("POST", "/v2/apps", body))
+
+    def wait(self, change: str) -> dict[str, Any]:
+        """Wait for a snapd change to be ready.
+
+        Raises:
+            SlurmOpsError: Raised if the change failed or did not finish within the timeout.
+        """
+        deadline = time.monotonic() + self._timeout
+        while True:
+            result = self._request("GET", f"/v2/changes/{change}")
+            if result.get("ready"):
+                if result.get("status") != "Done":
+                    raise SlurmOpsError(
+                        f"snapd change {change} failed. reason: {result.get('err', '')}"
+                    )
+                return result
+
+            if time.monotonic() > deadline:
+                raise SlurmOpsError(f"timed out waiting for snapd change {change}")
+
+            time.sleep(self._poll_interval)
+
+    def close(self) -> None:
+        """Close the connection to snapd."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _request(self, method: str, path: str, body: dict[str, Any] | None = None) -> Any:
+        """Send a request to snapd and return the result of the response."""
+        return self._result(self._send(method, path, body))
+
+    def _send(self, method: str, path: str, body: dict[str, Any] | None = None) -> dict:
+        """Send a request to snapd and return the decoded response.
+
+        A request is sent again over a new connection if it failed before it was sent. GET
+        requests are also sent again if they failed after they were sent.
+
+        Raises:
+            SlurmOpsError: Raised if snapd cannot be reached or returns an invalid response.
+        """
+        payload = json.dumps(body).encode() if body is not None else None
+        with self._lock:
+            try:
+                return self._roundtrip(method, path, payload)
+            except (ConnectionRefusedError, BrokenPipeError):
+                # The request was not sent, e.g. because snapd closed the kept-alive connection
+                # since the last request, so it is safe to send it again.
+                self.close()
+            except (OSError, http.client.HTTPException) as e:
+                self.close()
+                # snapd may have acted on a request whose response was lost, so only
+                # requests that do not change anything are sent again.
+                if method != "GET":
+                    raise SlurmOpsError(f"failed to reach snapd. reason: {e}")
+
+            try:
+                return self._roundtrip(method, path, payload)
+            except (OSError, http.client.HTTPException) as e:
+                self.close()
+                raise SlurmOpsError(f"failed to reach snapd. reason: {e}")
+
+    def _roundtrip(self, method: str, path: str, payload: bytes | None) -> dict:
+        """Send a request over the kept-alive connection and decode the response."""
+        if self._conn is None:
+            self._conn = _UnixHTTPConnection(self._socket_path, self._timeout)
+
+        headers = {"Content-Type": "application/json"} if payload is not None else {}
+        self._conn.request(method, path, body=payload, headers=headers)
+        content = self._conn.getresponse().read()
+        try:
+            return json.loads(content)
+        except json.JSONDecodeError as e:
+            self.close()
+            raise SlurmOpsError(f"snapd returned an invalid response. reason: {e}")
+
+    @staticmethod
+    def _result(response: dict[str, Any]) -> Any:
+        """Get the result of a snapd response.
+
+        Returns:
+            The `result` of a synchronous response, or the change ID of an asynchronous response.
+
+        Raises:
+            SlurmOpsError: Raised if snapd responded with an error.
+        """
+        if response.get("type") == "error":
+            reason = response.get("result", {}).get("message", "")
+            raise SlurmOpsError(f"snapd request failed. reason: {reason}")
+
+        if response.get("type") == "async":
+            return response["change"]
+
+        return response.get("result")
+
+
+class SnapdServiceManager(ServiceManager):
+    """Control a snap service through the snapd REST API.
+
+    This service manager is a drop-in replacement for `SnapServiceManager` that does not
+    fork a `snap` process for each operation.
+    """
+
+    def __init__(self, service: str, client: SnapdClient, /, snap: str) -> None:
+        self._name = f"{snap}.{service}"
+        self._client = client
+
+    def start(self) -> None:
+        """Start the service."""
+        self._client.service_action("start", self._name)
+
+    def stop(self) -> None:
+        """Stop the service."""
+        self._client.service_action("stop", self._name)
+
+    def enable(self) -> None:
+        """Enable and start the service."""
+        self._client.service_action("start", self._name, enable=True)
+
+    def disable(self) -> None:
+        """Disable and stop the service."""
+        self._client.service_action("stop", self._name, disable=True)
+
+    def restart(self) -> None:
+        """Restart the service."""
+        self._client.service_action("restart", self._name)
+
+    def is_active(self) -> bool:
+        """Check if the service is active."""
+        return self._client.services(self._name).get(self._name, {}).get("active", False)
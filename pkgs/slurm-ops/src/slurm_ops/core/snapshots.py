@@ -0,0 +1,203 @@
+# Copyright 2025 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Store generations of configuration files for Slurm operations managers."""
+
+__all__ = ["Generation", "SnapshotStore"]
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+
+from .errors import SlurmOpsError
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Generation:
+    """A saved generation of a set of configuration files.
+
+    Attributes:
+        id: Number of the generation. Newer generations have higher numbers.
+        created: Time the generation was saved, in seconds since the epoch.
+        files: Map of configuration file names to the SHA-256 digest of their contents.
+    """
+
+    id: int
+    created: float
+    files: Mapping[str, str]
+
+
+class SnapshotStore:
+    """Content-addressed store of configuration file generations.
+
+    File contents are stored once per unique digest as gzip-compressed objects under
+    `<root>/objects`, so files that are unchanged between generations are not stored again.
+    Each generation is a small JSON manifest under `<root>/generations/<name>` that maps
+    file names to digests.
+
+    Notes:
+        - Only the newest `keep` generations of each set of files are kept. Objects that are
+          no longer referenced by any generation are removed when old generations are pruned.
+        - The store is only readable by its owner as configuration files may hold secrets.
+    """
+
+    def __init__(self, root: Path, /, keep: int = 5) -> None:
+        self._root = root
+        self._keep = keep
+
+    def save(self, name: str, files: Mapping[str, str]) -> Generation:
+        """Save a new generation of a set of configuration files.
+
+        Args:
+            name: Name of the set of configuration files, e.g. `slurm.conf`.
+            files: Map of configuration file names to their contents.
+
+        Returns:
+            The new generation, or the newest existing generation if the contents of the
+            configuration files are unchanged since it was saved.
+        """
+        digests = {}
+        for file, content in files.items():
+            digests[file] = self._put(content.encode())
+
+        generations = self.list_generations(name)
+        if generations and generations[-1].files == digests:
+            _logger.debug("'%s' is unchanged since generation %s", name, generations[-1].id)
+            return generations[-1]
+
+        generation = Generation(
+            id=generations[-1].id + 1 if generations else 1, created=time.time(), files=digests
+        )
+        self._write(
+            self._root / "generations" / name / f"{generation.id:08d}.json",
+            json.dumps(
+                {"created": generation.created, "files": generation.files}, sort_keys=True
+            ).encode(),
+        )
+        _logger.debug("saved generation %s of '%s'", generation.id, name)
+
+        self._prune(name)
+        return generation
+
+    def load(self, name: str, generation: int | None = None) -> dict[str, str]:
+        """Load the contents of the configuration files in a generation.
+
+        Args:
+            name: Name of the set of configuration files, e.g. `slurm.conf`.
+            generation: Number of the generation to load. Defaults to the newest generation.
+
+        Returns:
+            Map of configuration file names to their contents. An empty map is returned if
+            there are no saved generations and `generation` is not set.
+
+        Raises:
+            SlurmOpsError: Raised if the generation does not exist or is corrupt.
+        """
+        generations = {g.id: g for g in self.list_generations(name)}
+        if generation is None:
+            if not generations:
+                return {}
+
+            generation = max(generations)
+
+        if generation not in generations:
+            raise SlurmOpsError(f"generation {generation} of '{name}' does not exist")
+
+        result = {}
+        for file, digest in generations[generation].files.items():
+            try:
+                content = gzip.decompress((self._root / "objects" / f"{digest}.gz").read_bytes())
+            except (FileNotFoundError, gzip.BadGzipFile) as e:
+                raise SlurmOpsError(
+                    f"failed to load '{file}' from generation {generation} of '{name}'. "
+                    + f"reason: {e}"
+                )
+
+            if hashlib.sha256(content).hexdigest() != digest:
+                raise SlurmOpsError(f"'{file}' in generation {generation} of '{name}' is corrupt")
+
+            result[file] = content.decode()
+
+        return result
+
+    def list_generations(self, name: str) -> list[Generation]:
+        """List the saved generations of a set of configuration files, oldest first.
+
+        Args:
+            name: Name of the set of configuration files, e.g. `slurm.conf`.
+        """
+        result = []
+        for manifest in sorted((self._root / "generations" / name).glob("*.json")):
+            data = json.loads(manifest.read_text())
+            result.append(
+                Generation(id=int(manifest.stem), created=data["created"], files=data["files"])
+            )
+
+        return result
+
+    def _put(self, content: bytes) -> str:
+        """Store content in the object store if it is not already stored.
+
+        Returns:
+            The SHA-256 digest of the content.
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        target = self._root / "objects" / f"{digest}.gz"
+        if not target.exists():
+            self._write(target, gzip.compress(content, mtime=0))
+
+        return digest
+
+    def _prune(self, name: str) -> None:
+        """Remove old generations and the objects only they reference."""
+        generations = self.list_generations(name)
+        if len(generations) <= self._keep:
+            return
+
+        for generation in generations[: -self._keep]:
+            (self._root / "generations" / name / f"{generation.id:08d}.json").unlink()
+
+        referenced = {
+            digest
+            for manifest in (self._root / "generations").glob("*/*.json")
+            for digest in json.loads(manifest.read_text())["files"].values()
+        }
+        for obj in (self._root / "objects").glob("*.gz"):
+            if obj.name.removesuffix(".gz") not in referenced:
+                obj.unlink()
+
+    @staticmethod
+    def _write(target: Path, content: bytes) -> None:
+        """Atomically write content to a file in the store."""
+        target.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, temp = tempfile.mkstemp(prefix=f".{target.name}.", dir=target.parent)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+
+            os.replace(temp, target)
+        except BaseException:
+            Path(temp).unlink(missing_ok=True)
+            raise
@@ -0,0 +1,261 @@
+# Copyright 2025 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Install Slurm from a local package mirror rather than the Ubuntu HPC PPA."""
+
+__all__ = ["InstallSource"]
+
+import hashlib
+import logging
+import shlex
+import shutil
+import tarfile
+from dataclasses import dataclass, field
+from os import PathLike
+from pathlib import Path
+from subprocess import CalledProcessError
+
+from hpc_libs.machine import call
+
+from .errors import SlurmOpsError
+
+_logger = logging.getLogger(__name__)
+
+# `apt` source list that the install source is written to.
+SOURCE_LIST = Path("/etc/apt/sources.list.d/slurm-ops-install-source.list")
+# Keyring that the signing key of the install source is written to.
+KEYRING = Path("/etc/apt/keyrings/slurm-ops-install-source.asc")
+# Directory that archives of pre-fetched packages are extracted into.
+DEBS_DIR = Path("/var/cache/slurm-ops/debs")
+# File listing the SHA-256 checksum of every pre-fetched package, in `sha256sum` format.
+CHECKSUMS = "SHA256SUMS"
+
+
+@dataclass(frozen=True)
+class InstallSource:
+    """Local `apt` repository to install Slurm packages from.
+
+    The repository must be signed by `key`, which `apt` uses to authenticate the package
+    indexes of the repository. Only flat repositories created by `from_debs`, whose packages
+    were verified against a `SHA256SUMS` file, are trusted without a signing key.
+
+    Attributes:
+        uri: URI of the repository. Either a `file:`, `http:`, or `https:` URI.
+        suite: Suite of the repository, or a path ending in `/` for a flat repository.
+        components: Components of the repository to enable. Empty for a flat repository.
+        key: ASCII-armored public key that signs the repository.
+        verified: Whether the packages of the repository were verified by `from_debs`.
+    """
+
+    uri: str
+    suite: str = "./"
+    components: tuple[str, ...] = ()
+    key: str = field(default="", repr=False)
+    verified: bool = False
+
+    def __post_init__(self) -> None:  # noqa D105
+        if not self.uri.startswith(("file:", "http://", "https://")):
+            raise ValueError(
+                f"invalid install source uri '{self.uri}'. "
+                + "expected a `file:`, `http://`, or `https://` uri"
+            )
+
+        if self.verified and not self.uri.startswith("file:"):
+            raise ValueError(f"install source '{self.uri}' cannot be verified locally")
+
+        if not self.verified and not self.key.strip().startswith(
+            "-----BEGIN PGP PUBLIC KEY BLOCK-----"
+        ):
+            raise ValueError(f"install source '{self.uri}' requires an ASCII-armored signing key")
+
+        if self.suite.endswith("/") and self.components:
+            raise ValueError(f"flat install source suite '{self.suite}' cannot have components")
+
+        if not self.suite.endswith("/") and not self.components:
+            raise ValueError(f"install source suite '{self.suite}' requires a component")
+
+    def __str__(self) -> str:  # noqa D105
+        options = "trusted=yes" if self.verified else f"signed-by={KEYRING}"
+        return f"deb [{options}] {' '.join([self.uri, self.suite, *self.components])}"
+
+    @classmethod
+    def from_str(cls, value: str, /, key: str) -> "InstallSource":
+        """Create a new `InstallSource` from a `<uri> [<suite> [<component> ...]]` string.
+
+        Args:
+            value: Repository to install Slurm packages from.
+            key: ASCII-armored public key that signs the repository.
+
+        Raises:
+            ValueError: Raised if `value` is not a valid install source, or `key` is not an
+                ASCII-armored public key.
+
+        Examples:
+            >>> InstallSource.from_str("http://mirror.internal/ubuntu-hpc noble main", key=key)
+            >>> InstallSource.from_str("file:///srv/slurm-debs", key=key)
+        """
+        uri, *rest = shlex.split(value) or [""]
+        if not rest:
+            return cls(uri, key=key)
+
+        return cls(uri, rest[0], tuple(rest[1:]), key=key)
+
+    @classmethod
+    def from_debs(cls, path: str | PathLike) -> "InstallSource":
+        """Create a flat `InstallSource` from a directory or archive of pre-fetched packages.
+
+        Args:
+            path: Directory, or tar archive, of `.deb` packages. The directory must contain a
+                `SHA256SUMS` file listing the checksum of every package in the directory.
+
+        Raises:
+            SlurmOpsError: Raised if a package is missing, does not match its checksum, is not
+                listed in `SHA256SUMS`, or if the package index cannot be generated.
+
+        Notes:
+            - Archives are extracted into `/var/cache/slurm-ops/debs`.
+            - The `Packages` index of the flat repository is generated from the packages, so
+              the directory does not need to be a repository itself.
+        """
+        directory = Path(path)
+        if directory.is_file():
+            directory = _extract(directory, DEBS_DIR)
+
+        _verify(directory)
+        _write_index(directory)
+        return cls(directory.resolve().as_uri(), verified=True)
+
+    def configure(self) -> None:
+        """Write the install source, and its signing key, to `apt` if they changed."""
+        if self.verified:
+            KEYRING.unlink(missing_ok=True)
+        elif not KEYRING.exists() or KEYRING.read_text() != self.key:
+            KEYRING.parent.mkdir(parents=True, exist_ok=True)
+            KEYRING.write_text(self.key)
+            KEYRING.chmod(0o644)
+
+        content = f"{self}\n"
+        if SOURCE_LIST.exists() and SOURCE_LIST.read_text() == content:
+            return
+
+        _logger.info("configuring apt to install slurm from '%s'", self.uri)
+        SOURCE_LIST.write_text(content)
+        SOURCE_LIST.chmod(0o644)
+
+    def update(self) -> None:
+        """Update the `apt` package index of the install source only.
+
+        Raises:
+            SlurmOpsError: Raised if the package index of the install source fails to update.
+        """
+        _logger.info("updating apt package index of '%s'", self.uri)
+        try:
+            call(
+                "apt-get",
+                "update",
+                "-o",
+                f"Dir::Etc::SourceList={SOURCE_LIST}",
+                "-o",
+                "Dir::Etc::SourceParts=-",
+                "-o",
+                "APT::Get::List-Cleanup=0",
+            )
+        except CalledProcessError as e:
+            raise SlurmOpsError(
+                f"failed to update apt package index of '{self.uri}'. reason: {e.stderr}"
+            )
+
+    @staticmethod
+    def clear() -> None:
+        """Remove the install source, and its signing key, from `apt` if it is configured."""
+        if SOURCE_LIST.exists():
+            _logger.info("removing apt install source '%s'", SOURCE_LIST)
+            SOURCE_LIST.unlink()
+
+        KEYRING.unlink(missing_ok=True)
+
+
+def _extract(archive: Path, target: Path) -> Path:
+    """Extract an archive of pre-fetched packages into `target`."""
+    _logger.debug("extracting '%s' into '%s'", archive, target)
+    shutil.rmtree(target, ignore_errors=True)
+    target.mkdir(parents=True)
+
+    try:
+        with tarfile.open(archive) as tar:
+            tar.extractall(target, filter="data")
+    except (tarfile.TarError, OSError) as e:
+        raise SlurmOpsError(f"failed to extract packages from '{archive}'. reason: {e}")
+
+    # Archives may contain a single top-level directory rather than the packages themselves.
+    if not (target / CHECKSUMS).exists():
+        nested = [d for d in target.iterdir() if (d / CHECKSUMS).exists()]
+        if len(nested) == 1:
+            return nested[0]
+
+    return target
+
+
+def _verify(directory: Path) -> None:
+    """Verify the packages in `directory` against its `SHA256SUMS` file."""
+    try:
+        lines = (directory / CHECKSUMS).read_text().splitlines()
+    except FileNotFoundError:
+        raise SlurmOpsError(f"'{directory}' does not contain a {CHECKSUMS} file")
+
+    expected = {}
+    for line in filter(str.strip, lines):
+        checksum, _, name = line.partition(" ")
+        expected[name.strip().lstrip("*")] = checksum.lower()
+
+    unlisted = sorted({deb.name for deb in directory.glob("*.deb")} - expected.keys())
+    if unlisted:
+        raise SlurmOpsError(f"packages {unlisted} are not listed in {directory / CHECKSUMS}")
+
+    for name, checksum in expected.items():
+        if Path(name).name != name:
+            raise SlurmOpsError(f"invalid package name '{name}' in {directory / CHECKSUMS}")
+
+        try:
+            with (directory / name).open("rb") as f:
+                digest = hashlib.file_digest(f, "sha256").hexdigest()
+        except FileNotFoundError:
+            raise SlurmOpsError(f"package '{name}' listed in {CHECKSUMS} is missing")
+
+        if digest != checksum:
+            raise SlurmOpsError(
+                f"checksum mismatch for package '{name}'. expected {checksum}, got {digest}"
+            )
+
+    _logger.debug("verified %s packages in '%s'", len(expected), directory)
+
+
+def _write_index(directory: Path) -> None:
+    """Generate the `Packages` index of a flat repository of `.deb` packages."""
+    stanzas = []
+    for deb in sorted(directory.glob("*.deb")):
+        try:
+            control = call("dpkg-deb", "--field", str(deb)).stdout.strip()
+        except CalledProcessError as e:
+            raise SlurmOpsError(f"failed to read package '{deb.name}'. reason: {e.stderr}")
+
+        content = deb.read_bytes()
+        stanzas.append(
+            f"{control}\n"
+            + f"Filename: ./{deb.name}\n"
+            + f"Size: {len(content)}\n"
+            + f"SHA256: {hashlib.sha256(content).hexdigest()}\n"
+        )
+
+    (directory / "Packages").write_text("\n".join(stanzas))
@@ -0,0 +1,168 @@
+# Copyright 2025 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Run steps that depend on each other, running independent steps at the same time."""
+
+__all__ = ["StagedExecutor"]
+
+import logging
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from graphlib import TopologicalSorter
+from typing import Any
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class _Step:
+    name: str
+    run: Callable[[], Any]
+    after: frozenset[str]
+    dpkg_lock: bool
+
+
+class StagedExecutor:
+    """Run steps in dependency order, running independent steps at the same time.
+
+    Each step declares the steps it must run after, and whether it takes the dpkg lock.
+    A step starts as soon as every step it depends on has finished. Steps that take the
+    dpkg lock never run at the same time as each other, as `apt` and `dpkg` would fail to
+    acquire the lock rather than wait for it.
+
+    Examples:
+        >>> executor = StagedExecutor()
+        >>> executor.add("update", apt.update, dpkg_lock=True)
+        >>> executor.add("nhc", nhc.install)
+        >>> executor.add("install", install_packages, after=["update"], dpkg_lock=True)
+        >>> executor.run(on_change=lambda running: print(running))
+        ['update', 'nhc']
+        ['update']
+        ['install']
+        {'nhc': 1.2, 'update': 4.5, 'install': 40.1}
+    """
+
+    def __init__(self) -> None:
+        self._steps: dict[str, _Step] = {}
+
+    def add(
+        self,
+        name: str,
+        run: Callable[[], Any],
+        /,
+        after: Iterable[str] = (),
+        dpkg_lock: bool = False,
+    ) -> None:
+        """Add a step.
+
+        Args:
+            name: Name of the step.
+            run: Function to run for the step.
+            after: Names of the steps that must finish before this step starts.
+            dpkg_lock: Whether the step takes the dpkg lock.
+
+        Raises:
+            ValueError: Raised if a step with the same name was already added.
+        """
+        if name in self._steps:
+            raise ValueError(f"step '{name}' already exists")
+
+        self._steps[name] = _Step(name, run, frozenset(after), dpkg_lock)
+
+    @property
+    def steps(self) -> list[str]:
+        """Get the names of the steps in the order they were added."""
+        return list(self._steps)
+
+    def run(self, on_change: Callable[[list[str]], None] | None = None) -> dict[str, float]:
+        """Run every step.
+
+        Args:
+            on_change: Function called with the names of the running steps whenever the
+                running steps change. It is always called from the calling thread, so it can
+                safely update the unit status.
+
+        Returns:
+            Map of step names to the time in seconds taken by the step, in the order the
+            steps finished.
+
+        Raises:
+            ValueError: Raised if a step depends on an unknown step or if the dependencies
+                of the steps form a cycle.
+
+        Notes:
+            - If a step fails, no further steps are started. Running steps are waited for,
+              then the error raised by the first failed step is re-raised.
+        """
+        for step in self._steps.values():
+            if unknown := sorted(step.after - self._steps.keys()):
+                raise ValueError(f"step '{step.name}' depends on unknown steps {unknown}")
+
+        graph = TopologicalSorter({step.name: step.after for step in self._steps.values()})
+        graph.prepare()
+
+        timings: dict[str, float] = {}
+        ready: list[_Step] = []
+        running: dict[Future, tuple[_Step, float]] = {}
+        reported: list[str] = []
+        error: BaseException | None = None
+        with ThreadPoolExecutor(
+            max_workers=max(len(self._steps), 1), thread_name_prefix="slurm-ops-stage"
+        ) as pool:
+            while True:
+                if error is None:
+                    ready.extend(self._steps[name] for name in graph.get_ready())
+                    self._start(pool, ready, running)
+
+                names = [step.name for step, _ in running.values()]
+                if on_change is not None and names and names != reported:
+                    on_change(names)
+                    reported = names
+
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    step, start = running.pop(future)
+                    timings[step.name] = time.monotonic() - start
+                    if (e := future.exception()) is not None:
+                        _logger.error("step '%s' failed. reason: %s", step.name, e)
+                        error = error or e
+                    else:
+                        _logger.debug("step '%s' took %.1fs", step.name, timings[step.name])
+                        graph.done(step.name)
+
+        if error is not None:
+            raise error
+
+        return timings
+
+    @staticmethod
+    def _start(
+        pool: ThreadPoolExecutor,
+        ready: list[_Step],
+        running: dict[Future, tuple[_Step, float]],
+    ) -> None:
+        """Start the ready steps that can run now, respecting the dpkg lock."""
+        locked = any(step.dpkg_lock for step, _ in running.values())
+        for step in list(ready):
+            if step.dpkg_lock and locked:
+                continue
+
+            ready.remove(step)
+            running[pool.submit(step.run)] = (step, time.monotonic())
+            locked |= step.dpkg_lock
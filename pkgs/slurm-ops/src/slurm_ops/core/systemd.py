@@ -0,0 +1,228 @@
+# Copyright 2025 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Manage systemd services over D-Bus rather than by forking `systemctl`."""
+
+__all__ = ["DBusServiceManager", "SystemdBus"]
+
+import asyncio
+import threading
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from hpc_libs.errors import SystemdError
+from hpc_libs.machine import ServiceManager
+
+_SYSTEMD = "org.freedesktop.systemd1"
+_SYSTEMD_PATH = "/org/freedesktop/systemd1"
+_SYSTEMD_MANAGER = "org.freedesktop.systemd1.Manager"
+_JOB_REMOVED_MATCH = (
+    f"type='signal',interface='{_SYSTEMD_MANAGER}',member='JobRemoved',path='{_SYSTEMD_PATH}'"
+)
+
+
+def _unit(service: str) -> str:
+    """Get the name of the systemd unit for a service."""
+    return service if "." in service else f"{service}.service"
+
+
+class SystemdBus:
+    """Client for the systemd manager D-Bus API.
+
+    The connection to the system bus is opened on first use and reused for every later call,
+    so a hook that checks or controls several services only connects once.
+
+    Notes:
+        - Jobs such as `StartUnit` are waited on until systemd emits `JobRemoved` for them,
+          which matches the default behavior of `systemctl`.
+        - Requires the `dbus-fast` package. Install `slurm-ops[dbus]` to pull it in.
+    """
+
+    def __init__(self) -> None:
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._bus: Any = None
+        self._pending: dict[str, asyncio.Future[str]] = {}
+        self._finished: dict[str, str] = {}
+        # The event loop can only run one call at a time, so calls from other threads wait.
+        self._lock = threading.Lock()
+
+    def active_states(self, services: Iterable[str]) -> dict[str, str]:
+        """Get the `ActiveState` of several services in a single round trip.
+
+        Returns:
+            Map of service names to their `ActiveState`, such as "active" or "inactive".
+            Services that systemd does not know about are reported as "inactive".
+        """
+        services = list(services)
+        units = {_unit(service): service for service in services}
+        states = dict.fromkeys(services, "inactive")
+        for name, _, _, active, *_ in self._call("ListUnitsByNames", "as", [list(units)])[0]:
+            if name in units:
+                states[units[name]] = active
+
+        return states
+
+    def run_job(self, method: str, service: str) -> None:
+        """Queue a job for a service and wait for it to finish.
+
+        Args:
+            method: Manager method that queues the job, such as `StartUnit` or `RestartUnit`.
+            service: Name of the service.
+
+        Raises:
+            SystemdError: Raised if the job did not finish successfully.
+        """
+        unit = _unit(service)
+        job = self._call(method, "ss", [unit, "replace"])[0]
+        if (result := self._wait(job)) != "done":
+            raise SystemdError(f"systemd job {method} for {unit} failed. result: {result}")
+
+    def enable(self, services: Sequence[str]) -> None:
+        """Enable services and reload the systemd manager configuration."""
+        self._call("EnableUnitFiles", "asbb", [[_unit(s) for s in services], False, True])
+        self._call("Reload")
+
+    def disable(self, services: Sequence[str]) -> None:
+        """Disable services and reload the systemd manager configuration."""
+        self._call("DisableUnitFiles", "asb", [[_unit(s) for s in services], False])
+        self._call("Reload")
+
+    def reload(self) -> None:
+        """Reload the systemd manager configuration."""
+        self._call("Reload")
+
+    def _call(self, method: str, signature: str = "", body: Sequence[Any] = ()) -> list[Any]:
+        """Call a method on the systemd manager and return the body of the reply."""
+        return self._run(self._send(method, signature, body))
+
+    def _wait(self, job: str) -> str:
+        """Wait for a queued job to be removed and return its result."""
+        return self._run(self._wait_for_job(job))
+
+    def _run(self, coro: Any) -> Any:
+        """Run a coroutine on the client's private event loop."""
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+
+            return self._loop.run_until_complete(coro)
+
+    async def _connect(self) -> Any:
+        """Connect to the system bus and subscribe to systemd job signals."""
+        if self._bus is not None:
+            return self._bus
+
+        try:
+            from dbus_fast import BusType, Message
+            from dbus_fast.aio import MessageBus
+        except ImportError as e:
+            raise SystemdError(
+                "the D-Bus service manager requires `dbus-fast`. "
+                + "install `slurm-ops[dbus]` to use it"
+            ) from e
+
+        self._bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
+        self._bus.add_message_handler(self._on_message)
+        await self._bus.call(
+            Message(
+                destination="org.freedesktop.DBus",
+                path="/org/freedesktop/DBus",
+                interface="org.freedesktop.DBus",
+                member="AddMatch",
+                signature="s",
+                body=[_JOB_REMOVED_MATCH],
+            )
+        )
+        await self._send("Subscribe")
+        return self._bus
+
+    async def _send(self, method: str, signature: str = "", body: Sequence[Any] = ()) -> list:
+        """Send a method call to the systemd manager."""
+        from dbus_fast import Message, MessageType
+
+        bus = await self._connect()
+        reply = await bus.call(
+            Message(
+                destination=_SYSTEMD,
+                path=_SYSTEMD_PATH,
+                interface=_SYSTEMD_MANAGER,
+                member=method,
+                signature=signature,
+                body=list(body),
+            )
+        )
+        if reply.message_type == MessageType.ERROR:
+            reason = reply.body[0] if reply.body else reply.error_name
+            raise SystemdError(f"systemd {method} call failed. reason: {reason}")
+
+        return reply.body
+
+    async def _wait_for_job(self, job: str) -> str:
+        """Wait for systemd to emit `JobRemoved` for a job."""
+        if job in self._finished:
+            return self._finished.pop(job)
+
+        future = self._pending[job] = asyncio.get_running_loop().create_future()
+        try:
+            return await future
+        finally:
+            self._pending.pop(job, None)
+
+    def _on_message(self, message: Any) -> None:
+        """Record the result of jobs removed by systemd."""
+        if message.member != "JobRemoved" or message.interface != _SYSTEMD_MANAGER:
+            return
+
+        _, job, _, result = message.body
+        if (future := self._pending.get(job)) is not None and not future.done():
+            future.set_result(result)
+        else:
+            self._finished[job] = result
+
+
+class DBusServiceManager(ServiceManager):
+    """Control a systemd service over D-Bus.
+
+    This service manager is a drop-in replacement for `SystemctlServiceManager` that does not
+    fork a `systemctl` process for each operation. Service managers that share a `SystemdBus`
+    also share its connection to the system bus.
+    """
+
+    def __init__(self, service: str, bus: SystemdBus, /) -> None:
+        self._service = service
+        self._bus = bus
+
+    def start(self) -> None:
+        """Start the service."""
+        self._bus.run_job("StartUnit", self._service)
+
+    def stop(self) -> None:
+        """Stop the service."""
+        self._bus.run_job("StopUnit", self._service)
+
+    def enable(self) -> None:
+        """Enable the service."""
+        self._bus.enable([self._service])
+
+    def disable(self) -> None:
+        """Disable the service."""
+        self._bus.disable([self._service])
+
+    def restart(self) -> None:
+        """Restart the service."""
+        self._bus.run_job("RestartUnit", self._service)
+
+    def is_active(self) -> bool:
+        """Check if the service is active."""
+        return self._bus.active_states([self._service])[self._service] == "active"
@@ -0,0 +1,140 @@
+# Copyright 2025 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Cache the installed version of Slurm across charm hooks."""
+
+__all__ = ["VersionCache", "dpkg_status_key", "snap_revision_key"]
+
+import json
+import logging
+import os
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from .errors import SlurmOpsError
+
+_logger = logging.getLogger(__name__)
+_DPKG_STATUS = Path("/var/lib/dpkg/status")
+_SNAP_ROOT = Path("/snap")
+
+
+def dpkg_status_key() -> str | None:
+    """Get a cache key that changes whenever a Debian package is installed or removed.
+
+    Returns:
+        The modification time and size of the dpkg status file, or `None` if the
+        dpkg status file does not exist.
+    """
+    try:
+        info = _DPKG_STATUS.stat()
+    except FileNotFoundError:
+        return None
+
+    return f"{info.st_mtime_ns}:{info.st_size}"
+
+
+def snap_revision_key(name: str) -> str | None:
+    """Get a cache key that changes whenever a snap is installed, refreshed, or reverted.
+
+    Returns:
+        The revision that the `current` symlink of the snap points to, or `None` if the
+        snap is not installed.
+    """
+    try:
+        return os.readlink(_SNAP_ROOT / name / "current")
+    except OSError:
+        return None
+
+
+class VersionCache:
+    """Persistent cache of installed Slurm versions.
+
+    Each entry records the result of a version probe along with a cache key that is cheap to
+    compute, such as the modification time of the dpkg status file or the current snap revision.
+    A cached entry is only used if the cache key still matches, so looking up the installed
+    version only costs a `stat()` unless packages have changed.
+
+    Notes:
+        - Failed probes are cached as well so that `is_installed` does not fork on every hook
+          before Slurm is installed.
+        - Probes are never cached if the cache key is `None`.
+        - Failing to write the cache file is not an error. The version is probed again
+          on the next lookup.
+    """
+
+    def __init__(self, file: str | os.PathLike) -> None:
+        self._file = Path(file)
+
+    def get(self, name: str, key: str | None, probe: Callable[[], str]) -> str:
+        """Get the installed version of `name`, probing for it if the cached entry is stale.
+
+        Args:
+            name: Name of the package or snap.
+            key: Cache key for the current state of the package manager.
+            probe: Function that gets the installed version.
+
+        Raises:
+            SlurmOpsError: Raised if `probe` failed for the current cache key.
+        """
+        if key is None:
+            return probe()
+
+        entry = self._load().get(name)
+        if entry is not None and entry.get("key") == key:
+            if (version := entry.get("version")) is None:
+                raise SlurmOpsError(entry.get("error", f"{name} is not installed"))
+
+            return version
+
+        try:
+            version = probe()
+        except SlurmOpsError as e:
+            self._update(name, {"key": key, "version": None, "error": e.message})
+            raise
+
+        self._update(name, {"key": key, "version": version})
+        return version
+
+    def invalidate(self, name: str) -> None:
+        """Remove the cached version of `name`."""
+        entries = self._load()
+        if entries.pop(name, None) is not None:
+            self._save(entries)
+
+    def _update(self, name: str, entry: dict[str, Any]) -> None:
+        """Update the cached entry of `name`."""
+        entries = self._load()
+        entries[name] = entry
+        self._save(entries)
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        """Load all cached entries."""
+        try:
+            return json.loads(self._file.read_text())
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _save(self, entries: dict[str, dict[str, Any]]) -> None:
+        """Atomically save all cached entries."""
+        try:
+            self._file.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp = tempfile.mkstemp(prefix=f".{self._file.name}.", dir=self._file.parent)
+            with os.fdopen(fd, "w") as f:
+                json.dump(entries, f, sort_keys=True)
+
+            os.replace(temp, self._file)
+        except OSError as e:
+            _logger.debug("failed to save version cache %s. reason: %s", self._file, e)
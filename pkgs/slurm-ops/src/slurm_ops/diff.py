@@ -0,0 +1,189 @@
+# Copyright 2025 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare Slurm configurations to determine how to apply changes."""
+
+__all__ = ["ReconfigureAction", "SlurmConfigDiff", "diff_slurm_config"]
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from enum import IntEnum
+from pathlib import PurePath
+from typing import Any
+
+from slurmutils import SlurmConfig
+
+# Configuration sections that hold named records, e.g. `NodeName=...` or `PartitionName=...`.
+_SECTIONS = ("nodes", "frontendnodes", "nodesets", "partitions")
+
+# Parameters whose changes do not change the running cluster. Every other change must be
+# re-read by `slurmctld`, as it serves `slurm.conf` to the rest of the cluster in configless mode.
+# Include files are merged into `slurm.conf` before comparing, so only their contents matter.
+_NO_OP_KEYS = frozenset({"include"})
+
+# Parameters that `slurmctld` only reads at startup. `scontrol reconfigure` does not apply them.
+_RESTART_KEYS = frozenset(
+    {
+        "authaltparameters",
+        "authinfo",
+        "clustername",
+        "communicationparameters",
+        "firstjobid",
+        "maxjobcount",
+        "plugindir",
+        "selecttypeparameters",
+        "slurmctldaddr",
+        "slurmctldhost",
+        "slurmctldparameters",
+        "slurmctldpidfile",
+        "slurmctldport",
+        "slurmdport",
+        "slurmdspooldir",
+        "slurmduser",
+        "slurmuser",
+        "statesavelocation",
+        "treewidth",
+        # Plugins are loaded when `slurmctld` starts.
+        "accountingstoragetype",
+        "acctgatherenergytype",
+        "acctgatherfilesystemtype",
+        "acctgatherinterconnecttype",
+        "acctgatherprofiletype",
+        "authalttypes",
+        "authtype",
+        "burstbuffertype",
+        "clifilterplugins",
+        "credtype",
+        "grestypes",
+        "jobacctgathertype",
+        "jobcomptype",
+        "jobcontainertype",
+        "jobsubmitplugins",
+        "mcsplugin",
+        "nodefeaturesplugins",
+        "preempttype",
+        "prepplugins",
+        "prioritysitefactorplugin",
+        "prioritytype",
+        "proctracktype",
+        "schedulertype",
+        "selecttype",
+        "switchtype",
+        "taskplugin",
+        "topologyplugin",
+    }
+)
+
+
+class ReconfigureAction(IntEnum):
+    """Actions for applying Slurm configuration changes, ordered from least to most disruptive."""
+
+    NONE = 0
+    RECONFIGURE = 1
+    RESTART = 2
+
+
+@dataclass(frozen=True)
+class SlurmConfigDiff:
+    """Differences between two Slurm configurations.
+
+    Attributes:
+        changes:
+            Map of changed configuration keys to the action required to apply the change.
+            Records in sections are keyed as `<section>/<name>`, e.g. `partitions/batch`.
+    """
+
+    changes: Mapping[str, ReconfigureAction] = field(default_factory=dict)
+
+    @property
+    def action(self) -> ReconfigureAction:
+        """Get the least disruptive action that applies all changes."""
+        return max(self.changes.values(), default=ReconfigureAction.NONE)
+
+
+def diff_slurm_config(
+    old: Mapping[str, SlurmConfig], new: Mapping[str, SlurmConfig], /
+) -> SlurmConfigDiff:
+    """Compare two Slurm configurations.
+
+    Args:
+        old: Map of configuration file names to the previous Slurm configuration.
+        new: Map of configuration file names to the new Slurm configuration.
+
+    Notes:
+        - Both maps must hold the main configuration under the `slurm.conf` key. Include files
+          are only considered if they are listed in the `include` parameter of `slurm.conf`.
+        - Include files are merged into `slurm.conf` before the configurations are compared,
+          so moving a parameter between `slurm.conf` and an include file is not a change.
+        - Adding or removing a node requires a restart. Other changes to records in sections,
+          such as adding a partition, only require a reconfigure.
+        - Changes that need no action, such as to the list of include files, are listed in
+          `changes` with `ReconfigureAction.NONE`.
+
+    Examples:
+        >>> diff = diff_slurm_config(
+        ...     {"slurm.conf": SlurmConfig(slurmctldport=6817)},
+        ...     {"slurm.conf": SlurmConfig(slurmctldport=6818)},
+        ... )
+        >>> diff.action
+        <ReconfigureAction.RESTART: 2>
+    """
+    before = _flatten(old)
+    after = _flatten(new)
+
+    changes = {}
+    for key in before.keys() | after.keys():
+        old_value = before.get(key)
+        new_value = after.get(key)
+        if old_value != new_value:
+            changes[key] = _classify(key, old_value, new_value)
+
+    return SlurmConfigDiff(changes)
+
+
+def _flatten(configs: Mapping[str, SlurmConfig]) -> dict[str, Any]:
+    """Merge `slurm.conf` and its include files into a single map of parameters."""
+    if (main := configs.get("slurm.conf")) is None:
+        return {}
+
+    result: dict[str, Any] = {}
+    includes = [PurePath(include).name for include in main.include or []]
+    for config in [main] + [configs[name] for name in includes if name in configs]:
+        for key, value in config.dict().items():
+            if key in _SECTIONS:
+                result.update({f"{key}/{name}": record for name, record in value.items()})
+            elif key == "downnodes":
+                result.setdefault(key, []).extend(value)
+            else:
+                result[key] = value
+
+    return result
+
+
+def _classify(key: str, old: Any, new: Any) -> ReconfigureAction:
+    """Determine the action required to apply a changed configuration key."""
+    if key in _NO_OP_KEYS:
+        return ReconfigureAction.NONE
+
+    section, _, _ = key.partition("/")
+    if section == "nodes" and (old is None or new is None):
+        return ReconfigureAction.RESTART
+
+    if section in _SECTIONS or section == "downnodes":
+        return ReconfigureAction.RECONFIGURE
+
+    if key in _RESTART_KEYS:
+        return ReconfigureAction.RESTART
+
+    return ReconfigureAction.RECONFIGURE
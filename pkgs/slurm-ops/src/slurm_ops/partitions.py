@@ -0,0 +1,220 @@
+# Copyright 2025 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Index the partitions defined in the include files of `slurm.conf`."""
+
+__all__ = ["PartitionCatalog", "PartitionInfo"]
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from slurmutils import SlurmConfigEditor
+
+from slurm_ops.core import SlurmConfigManager
+
+_logger = logging.getLogger(__name__)
+
+# Version of the catalog file format. Catalogs with a different version are rebuilt.
+_VERSION = 1
+
+
+@dataclass(frozen=True)
+class PartitionInfo:
+    """Information about a partition defined in an include file.
+
+    Attributes:
+        include: Name of the include file that defines the partition, e.g. `slurm.conf.batch`.
+        nodeset: Name of the node set in the include file used by the partition, if any.
+        default: Whether the partition is the default partition.
+        digest: SHA-256 digest of the include file when the partition was indexed.
+    """
+
+    include: str
+    nodeset: str | None
+    default: bool
+    digest: str
+
+
+class PartitionCatalog:
+    """Catalog of the partitions defined in the include files of `slurm.conf`.
+
+    The catalog is stored as a JSON file next to `slurm.conf` and is updated whenever an
+    include file is written or deleted through the `slurm.conf` configuration manager, so
+    partition lookups do not need to parse every include file.
+
+    Notes:
+        - The catalog is rebuilt if its file is missing. Include files that were added,
+          deleted, or edited outside the `slurm.conf` configuration manager, such as by another
+          `slurmctld` unit, are indexed again when the catalog is first loaded. They are
+          detected by comparing their digests against the digests stored in the catalog.
+    """
+
+    def __init__(
+        self,
+        config: SlurmConfigManager[type[SlurmConfigEditor]],
+        file: Path,
+        *,
+        user: str,
+        group: str,
+    ) -> None:
+        self._config = config
+        self._file = file
+        self._user = user
+        self._group = group
+        self._data: dict[str, Any] | None = None
+        config.watch(self._on_change)
+
+    def __contains__(self, partition: object) -> bool:
+        """Check if a partition is defined in an include file."""
+        return partition in self._load()["partitions"]
+
+    def get(self, partition: str) -> PartitionInfo | None:
+        """Get information about a partition.
+
+        Returns:
+            Information about the partition, or `None` if the partition is not defined in
+            any include file.
+        """
+        if (info := self._load()["partitions"].get(partition)) is None:
+            return None
+
+        return PartitionInfo(**info)
+
+    def rebuild(self) -> None:
+        """Rebuild the catalog from the include files of `slurm.conf`."""
+        _logger.debug("rebuilding partition catalog '%s'", self._file)
+        data: dict[str, Any] = {
+            "version": _VERSION,
+            "includes": {},
+            "partitions": {},
+            "default": "",
+        }
+        for name, manager in self._config.includes.items():
+            self._index(data, name, manager)
+
+        self._save(data)
+
+    @property
+    def default(self) -> str:
+        """Get the name of the default partition.
+
+        Returns:
+            Name of the default partition. An empty string is returned if there is
+            no configured default partition.
+        """
+        return self._load()["default"]
+
+    @property
+    def path(self) -> Path:
+        """Get path to the catalog file."""
+        return self._file
+
+    def _load(self) -> dict[str, Any]:
+        """Load the catalog, rebuilding it if it is missing or out of date."""
+        if self._data is None:
+            try:
+                data = json.loads(self._file.read_text())
+            except (FileNotFoundError, json.JSONDecodeError):
+                data = None
+
+            if data is None or data.get("version") != _VERSION:
+                self.rebuild()
+            else:
+                self._refresh(data)
+
+        assert self._data is not None
+        return self._data
+
+    def _refresh(self, data: dict[str, Any]) -> None:
+        """Index the include files that changed since the catalog was saved again."""
+        includes = self._config.includes
+        stale = [
+            name
+            for name in sorted(data["includes"].keys() | includes.keys())
+            if data["includes"].get(name) != includes[name].digest()
+        ]
+        for name in stale:
+            _logger.debug("include file '%s' changed outside the partition catalog", name)
+            self._index(data, name, includes[name])
+
+        if stale:
+            self._save(data)
+        else:
+            self._data = data
+
+    def _index(self, data: dict[str, Any], name: str, manager: SlurmConfigManager) -> None:
+        """Replace the catalog entries for an include file with its current partitions."""
+        data["includes"].pop(name, None)
+        for partition, info in list(data["partitions"].items()):
+            if info["include"] == name:
+                del data["partitions"][partition]
+
+        if (digest := manager.digest()) is not None:
+            config = manager.load()
+            data["includes"][name] = digest
+            for partition in config.partitions.values():
+                nodeset = next((n for n in partition.nodes or [] if n in config.nodesets), None)
+                data["partitions"][partition.partition_name] = asdict(
+                    PartitionInfo(
+                        include=name,
+                        nodeset=nodeset,
+                        default=bool(partition.default),
+                        digest=digest,
+                    )
+                )
+
+        data["default"] = next(
+            (p for p, info in data["partitions"].items() if info["default"]), ""
+        )
+
+    def _on_change(self, file: Path) -> None:
+        """Update the catalog after a configuration file is written or deleted."""
+        if (
+            file.parent != self._config.path.parent
+            or not file.name.startswith(f"{self._config.path.name}.")
+            or file.suffix == ".snapshot"
+        ):
+            return
+
+        data = self._load()
+        if data["includes"].get(file.name) == self._config.includes[file.name].digest():
+            return
+
+        self._index(data, file.name, self._config.includes[file.name])
+        self._save(data)
+
+    def _save(self, data: dict[str, Any]) -> None:
+        """Atomically write the catalog to its file."""
+        self._data = data
+        if not self._file.parent.exists():
+            # Nothing to index against until Slurm is installed.
+            return
+
+        fd, temp = tempfile.mkstemp(prefix=f".{self._file.name}.", dir=self._file.parent)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+
+            os.chmod(temp, 0o644)
+            shutil.chown(temp, self._user, self._group)
+            os.replace(temp, self._file)
+        except BaseException:
+            Path(temp).unlink(missing_ok=True)
+            raise
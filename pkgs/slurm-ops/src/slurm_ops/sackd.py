@@ -14,34 +14,71 @@
 
 """Manage Slurm's authentication and kiosk service, `sackd`."""
 
-__all__ = ["SackdManager"]
+__all__ = ["SackdManager", "SackdOptions"]
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from typing import Any
 
-from slurm_ops.core import SLURM_GROUP, SLURM_USER, SlurmManager
+from slurm_ops.core import SLURM_GROUP, SLURM_USER, Sandbox, SlurmManager
+
+
+class SackdOptions:
+    """Typed view of the `SACKD_OPTIONS` environment variable passed to `sackd`.
+
+    Notes:
+        - Changes made through this object are only saved to the `sackd` environment file
+          when the `SackdManager.options` context exits.
+    """
+
+    def __init__(self, options: dict[str, Any], /) -> None:
+        self._options = options
+
+    @property
+    def conf_server(self) -> list[str]:
+        """Get the list of controller addresses `sackd` uses to communicate with `slurmctld`."""
+        return list(filter(None, self._options.get("--conf-server", "").split(",")))
+
+    @conf_server.setter
+    def conf_server(self, value: Iterable[str]) -> None:
+        self._options["--conf-server"] = ",".join(value)
+
+    @conf_server.deleter
+    def conf_server(self) -> None:
+        self._options.pop("--conf-server", None)
 
 
 class SackdManager(SlurmManager):
     """Manage Slurm's authentication and kiosk service, `sackd`."""
 
-    def __init__(self, snap: bool = False) -> None:
-        super().__init__("sackd", snap)
+    def __init__(
+        self, snap: bool = False, dbus: bool = False, sandbox: Sandbox | None = None
+    ) -> None:
+        super().__init__("sackd", snap, dbus, sandbox)
+
+    @contextmanager
+    def options(self) -> Iterator[SackdOptions]:
+        """Edit the options passed to `sackd` in a single read and write of its env file.
+
+        The environment file is only written if the options changed.
+        """
+        with self._edit_options() as options:
+            yield SackdOptions(options)
 
     @property
     def conf_server(self) -> list[str]:
         """Get the list of controller addresses `sackd` uses to communicate with `slurmctld`."""
-        options = self._load_options()
-        return list(filter(None, options.get("--conf-server", "").split(",")))
+        return SackdOptions(self._load_options()).conf_server
 
     @conf_server.setter
     def conf_server(self, value: Iterable[str]) -> None:
-        with self._edit_options() as options:
-            options["--conf-server"] = ",".join(value)
+        with self.options() as options:
+            options.conf_server = value
 
     @conf_server.deleter
     def conf_server(self) -> None:
-        with self._edit_options() as options:
-            options.pop("--conf-server", None)
+        with self.options() as options:
+            del options.conf_server
 
     @property
     def user(self) -> str:
@@ -17,58 +17,76 @@
 __all__ = ["SlurmctldManager"]
 
 import json
+from pathlib import Path
+
 from slurmutils import (
     AcctGatherConfigEditor,
     CGroupConfigEditor,
     GresConfigEditor,
     OCIConfigEditor,
+    SlurmConfig,
     SlurmConfigEditor,
 )
 
 from slurm_ops import scontrol
-from slurm_ops.core import SLURM_GROUP, SLURM_USER, SlurmConfigManager, SlurmManager
+from slurm_ops.core import SLURM_GROUP, SLURM_USER, Sandbox, SlurmConfigManager, SlurmManager
+from slurm_ops.diff import ReconfigureAction, diff_slurm_config
+from slurm_ops.partitions import PartitionCatalog
 
 
 class SlurmctldManager(SlurmManager):
     """Manage Slurm's controller service, `slurmctld`."""
 
-    def __init__(self, snap: bool = False) -> None:
-        super().__init__("slurmctld", snap)
+    def __init__(
+        self, snap: bool = False, dbus: bool = False, sandbox: Sandbox | None = None
+    ) -> None:
+        super().__init__("slurmctld", snap, dbus, sandbox)
 
         self.config = SlurmConfigManager(
             SlurmConfigEditor,
             file=self._ops_manager.etc_path / "slurm.conf",
             mode=0o644,
-            user=self.user,
-            group=self.group,
+            user=self._file_user,
+            group=self._file_group,
+            store=self._snapshots,
         )
         self.acct_gather = SlurmConfigManager(
             AcctGatherConfigEditor,
             file=self._ops_manager.etc_path / "acct_gather.conf",
             mode=0o600,
-            user=self.user,
-            group=self.group,
+            user=self._file_user,
+            group=self._file_group,
+            store=self._snapshots,
         )
         self.cgroup = SlurmConfigManager(
             CGroupConfigEditor,
             file=self._ops_manager.etc_path / "cgroup.conf",
             mode=0o644,
-            user=self.user,
-            group=self.group,
+            user=self._file_user,
+            group=self._file_group,
+            store=self._snapshots,
         )
         self.gres = SlurmConfigManager(
             GresConfigEditor,
             file=self._ops_manager.etc_path / "gres.conf",
             mode=0o644,
-            user=self.user,
-            group=self.group,
+            user=self._file_user,
+            group=self._file_group,
+            store=self._snapshots,
         )
         self.oci = SlurmConfigManager(
             OCIConfigEditor,
             file=self._ops_manager.etc_path / "oci.conf",
             mode=0o644,
-            user=self.user,
-            group=self.group,
+            user=self._file_user,
+            group=self._file_group,
+            store=self._snapshots,
+        )
+        self.partitions = PartitionCatalog(
+            self.config,
+            file=self._ops_manager.etc_path / ".slurm-partitions.json",
+            user=self._file_user,
+            group=self._file_group,
         )
 
     def get_default_partition(self) -> str:
@@ -78,19 +96,13 @@ class SlurmctldManager(SlurmManager):
             Name of the default partition. An empty string is returned if there is
             no configured default partition.
         """
-        for include in self.config.includes.values():
-            config = include.load()
-            for partition in config.partitions.values():
-                if partition.default:
-                    return partition.partition_name
-
-        return ""
+        return self.partitions.default
 
     def get_controllers(self) -> list[str]:
         """Get hostnames for all controllers defined in the slurm.conf file."""
         controllers = []
         if self.config.path.exists():
-            config = self.config.load()
+            config = self.config.load_keys("slurmctld_host")
             if config.slurmctld_host:
                 controllers = config.slurmctld_host
 
@@ -122,6 +134,83 @@ class SlurmctldManager(SlurmManager):
 
         return ""
 
+    def get_reconfigure_action(self) -> ReconfigureAction:
+        """Get the least disruptive action that applies the changes made by this manager.
+
+        Notes:
+            - `slurm.conf` and its include files are compared against their contents before
+              they were first changed. See `diff_slurm_config` for how changes are classified.
+            - Changes to the other Slurm configuration files only require a reconfigure.
+              Changes to the `slurmctld` secret or environment files require a restart.
+            - The `pending_action` left by an earlier hook that failed to apply its changes is
+              also taken, as the configuration files of that hook were already written.
+        """
+        if self.key.changed or self.jwt.changed or self._env_changed:
+            return ReconfigureAction.RESTART
+
+        action = self.pending_action
+        if self.config.changed:
+            diff = diff_slurm_config(
+                self._load_slurm_config(original=True), self._load_slurm_config()
+            )
+            action = max(action, diff.action)
+
+        if any(m.changed for m in (self.acct_gather, self.cgroup, self.gres, self.oci)):
+            action = max(action, ReconfigureAction.RECONFIGURE)
+
+        return action
+
+    @property
+    def pending_action(self) -> ReconfigureAction:
+        """Get the action that must still be taken to apply configuration changes.
+
+        Notes:
+            - Set the pending action before restarting or reconfiguring `slurmctld`, and reset it
+              to `ReconfigureAction.NONE` once the changes are applied. If the restart or
+              reconfigure fails, later hooks still apply the changes.
+            - The pending action is stored in the hidden `.slurm.conf.pending` file next to
+              `slurm.conf`.
+        """
+        try:
+            return ReconfigureAction[self._pending_action_path.read_text().strip()]
+        except (FileNotFoundError, KeyError):
+            return ReconfigureAction.NONE
+
+    @pending_action.setter
+    def pending_action(self, value: ReconfigureAction) -> None:
+        if value == ReconfigureAction.NONE:
+            self._pending_action_path.unlink(missing_ok=True)
+        else:
+            self._pending_action_path.write_text(f"{value.name}\n")
+
+    @property
+    def _pending_action_path(self) -> Path:
+        """Get path to the file that records the pending reconfigure action."""
+        return self.config.path.parent / f".{self.config.path.name}.pending"
+
+    def _load_slurm_config(self, *, original: bool = False) -> dict[str, SlurmConfig]:
+        """Load `slurm.conf` and its include files.
+
+        Args:
+            original: If `True`, load changed files as they were before they were first changed.
+        """
+        originals = {
+            path.name: content
+            for path, content in self.config.originals.items()
+            if path.suffix != ".snapshot"
+        }
+        managers = {self.config.path.name: self.config, **self.config.includes}
+
+        result = {}
+        for name in managers.keys() | (originals.keys() if original else set()):
+            if original and name in originals:
+                if (content := originals[name]) is not None:
+                    result[name] = SlurmConfig.from_str(content)
+            elif (manager := managers.get(name)) is not None and manager.exists():
+                result[name] = manager.load()
+
+        return result
+
     @property
     def user(self) -> str:
         """Get the user that the `slurmctld` service runs as."""
@@ -14,63 +14,125 @@
 
 """Manage Slurm's compute service, `slurmd`."""
 
-__all__ = ["SlurmdManager"]
+__all__ = ["SlurmdManager", "SlurmdOptions"]
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from typing import Any
 
 from slurmutils import Node
 
-from slurm_ops.core import SLURMD_GROUP, SLURMD_USER, SlurmManager
+from slurm_ops.core import SLURMD_GROUP, SLURMD_USER, Sandbox, SlurmManager
+
+
+class SlurmdOptions:
+    """Typed view of the `SLURMD_OPTIONS` environment variable passed to `slurmd`.
+
+    Notes:
+        - Changes made through this object are only saved to the `slurmd` environment file
+          when the `SlurmdManager.options` context exits.
+    """
+
+    def __init__(self, options: dict[str, Any], /) -> None:
+        self._options = options
+
+    @property
+    def conf(self) -> Node:
+        """Get the current node configuration."""
+        return Node.from_str(self._options.get("--conf", ""))
+
+    @conf.setter
+    def conf(self, value: Node) -> None:
+        self._options["--conf"] = str(value)
+
+    @conf.deleter
+    def conf(self) -> None:
+        self._options.pop("--conf", None)
+
+    @property
+    def conf_server(self) -> list[str]:
+        """Get the list of controller addresses `slurmd` uses to communicate with `slurmctld`."""
+        return list(filter(None, self._options.get("--conf-server", "").split(",")))
+
+    @conf_server.setter
+    def conf_server(self, value: Iterable[str]) -> None:
+        self._options["--conf-server"] = ",".join(value)
+
+    @conf_server.deleter
+    def conf_server(self) -> None:
+        self._options.pop("--conf-server", None)
+
+    @property
+    def dynamic(self) -> bool:
+        """Determine if this is a dynamic node."""
+        return self._options.get("-Z", False)
+
+    @dynamic.setter
+    def dynamic(self, value: bool) -> None:
+        self._options["-Z"] = value
 
 
 class SlurmdManager(SlurmManager):
     """Manage Slurm's compute service, `slurmd`."""
 
-    def __init__(self, snap: bool = False) -> None:
-        super().__init__("slurmd", snap)
+    def __init__(
+        self, snap: bool = False, dbus: bool = False, sandbox: Sandbox | None = None
+    ) -> None:
+        super().__init__("slurmd", snap, dbus, sandbox)
+
+    @contextmanager
+    def options(self) -> Iterator[SlurmdOptions]:
+        """Edit the options passed to `slurmd` in a single read and write of its env file.
+
+        The environment file is only written if the options changed.
+
+        Examples:
+            >>> with slurmd.options() as options:
+            ...     options.conf_server = ["10.0.0.1:6817"]
+            ...     options.dynamic = True
+        """
+        with self._edit_options() as options:
+            yield SlurmdOptions(options)
 
     @property
     def conf(self) -> Node:
         """Get the current node configuration."""
-        options = self._load_options()
-        return Node.from_str(options.get("--conf", ""))
+        return SlurmdOptions(self._load_options()).conf
 
     @conf.setter
     def conf(self, value: Node) -> None:
-        with self._edit_options() as options:
-            options["--conf"] = str(value)
+        with self.options() as options:
+            options.conf = value
 
     @conf.deleter
     def conf(self) -> None:
-        with self._edit_options() as options:
-            options.pop("--conf", None)
+        with self.options() as options:
+            del options.conf
 
     @property
     def conf_server(self) -> list[str]:
         """Get the list of controller addresses `slurmd` uses to communicate with `slurmctld`."""
-        options = self._load_options()
-        return list(filter(None, options.get("--conf-server", "").split(",")))
+        return SlurmdOptions(self._load_options()).conf_server
 
     @conf_server.setter
     def conf_server(self, value: Iterable[str]) -> None:
-        with self._edit_options() as options:
-            options["--conf-server"] = ",".join(value)
+        with self.options() as options:
+            options.conf_server = value
 
     @conf_server.deleter
     def conf_server(self) -> None:
-        with self._edit_options() as options:
-            options.pop("--conf-server", None)
+        with self.options() as options:
+            del options.conf_server
 
     @property
     def dynamic(self) -> bool:
         """Determine if this is a dynamic node."""
-        options = self._load_options()
-        return options.get("-Z", False)
+        return SlurmdOptions(self._load_options()).dynamic
 
     @dynamic.setter
     def dynamic(self, value: bool) -> None:
-        with self._edit_options() as options:
-            options["-Z"] = value
+        with self.options() as options:
+            options.dynamic = value
 
     @property
     def user(self) -> str:
@@ -17,26 +17,72 @@
 __all__ = ["SlurmdbdManager"]
 
 from os import PathLike
+from pathlib import Path
 
 from slurmutils import SlurmdbdConfigEditor
 
-from slurm_ops.core import SLURM_GROUP, SLURM_USER, SlurmConfigManager, SlurmManager
+from slurm_ops.core import SLURM_GROUP, SLURM_USER, Sandbox, SlurmConfigManager, SlurmManager
 
 
 class SlurmdbdManager(SlurmManager):
     """Manage Slurm's database service, `slurmdbd`."""
 
-    def __init__(self, snap: bool = False) -> None:
-        super().__init__("slurmdbd", snap)
+    def __init__(
+        self, snap: bool = False, dbus: bool = False, sandbox: Sandbox | None = None
+    ) -> None:
+        super().__init__("slurmdbd", snap, dbus, sandbox)
 
         self.config = SlurmConfigManager(
             SlurmdbdConfigEditor,
             file=self._ops_manager.etc_path / "slurmdbd.conf",
             mode=0o600,
-            user=self.user,
-            group=self.group,
+            user=self._file_user,
+            group=self._file_group,
+            store=self._snapshots,
         )
 
+    @property
+    def needs_restart(self) -> bool:
+        """Check if the `slurmdbd` service must be restarted to apply the changes of this manager.
+
+        Notes:
+            - `slurmdbd` does not read include files, so changes to `slurmdbd.conf.*` files
+              only require a restart once `config.merge()` applies them to `slurmdbd.conf`.
+            - A restart left pending by an earlier hook also requires a restart.
+        """
+        return (
+            self.restart_pending
+            or self._env_changed
+            or self._units_changed
+            or self.key.changed
+            or self.jwt.changed
+            or self.config.path in self.config.changes
+        )
+
+    @property
+    def restart_pending(self) -> bool:
+        """Check if an earlier restart of the `slurmdbd` service has not completed yet.
+
+        Notes:
+            - Set `restart_pending` before restarting `slurmdbd`, and unset it once the restart
+              succeeds. If the restart fails, later hooks still restart `slurmdbd`.
+            - The pending restart is recorded in the hidden `.slurmdbd.conf.pending` file next
+              to `slurmdbd.conf`.
+        """
+        return self._restart_pending_path.exists()
+
+    @restart_pending.setter
+    def restart_pending(self, value: bool) -> None:
+        if value:
+            self._restart_pending_path.touch()
+        else:
+            self._restart_pending_path.unlink(missing_ok=True)
+
+    @property
+    def _restart_pending_path(self) -> Path:
+        """Get path to the file that records a pending restart."""
+        return self.config.path.parent / f".{self.config.path.name}.pending"
+
     @property
     def mysql_unix_port(self) -> str | None:
         """Get the URI of the unix socket the `slurmd` service uses to communication with MySQL."""
@@ -45,10 +91,12 @@ class SlurmdbdManager(SlurmManager):
     @mysql_unix_port.setter
     def mysql_unix_port(self, value: str | PathLike) -> None:
         self._env_manager.set({"MYSQL_UNIX_PORT": value})
+        self._env_changed = True
 
     @mysql_unix_port.deleter
     def mysql_unix_port(self) -> None:
         self._env_manager.unset("MYSQL_UNIX_PORT")
+        self._env_changed = True
 
     @property
     def user(self) -> str:
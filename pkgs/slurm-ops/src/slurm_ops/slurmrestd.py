@@ -18,21 +18,30 @@ __all__ = ["SlurmrestdManager"]
 
 from slurmutils import SlurmConfigEditor
 
-from slurm_ops.core import SLURMRESTD_GROUP, SLURMRESTD_USER, SlurmConfigManager, SlurmManager
+from slurm_ops.core import (
+    SLURMRESTD_GROUP,
+    SLURMRESTD_USER,
+    Sandbox,
+    SlurmConfigManager,
+    SlurmManager,
+)
 
 
 class SlurmrestdManager(SlurmManager):
     """Manage Slurm's REST API service, `slurmrestd`."""
 
-    def __init__(self, snap: bool = False) -> None:
-        super().__init__("slurmrestd", snap)
+    def __init__(
+        self, snap: bool = False, dbus: bool = False, sandbox: Sandbox | None = None
+    ) -> None:
+        super().__init__("slurmrestd", snap, dbus, sandbox)
 
         self.config = SlurmConfigManager(
             SlurmConfigEditor,
             file=self._ops_manager.etc_path / "slurm.conf",
             mode=0o644,
-            user=self.user,
-            group=self.group,
+            user=self._file_user,
+            group=self._file_group,
+            store=self._snapshots,
         )
 
     @property
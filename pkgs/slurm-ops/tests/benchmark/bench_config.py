@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks for the `slurm_ops` configuration layer.
+
+Each scenario generates a synthetic `slurm.conf` tree in a temporary directory and measures
+the wall time, peak traced memory allocation, and read/write syscall count of common
+configuration operations. Results are compared against `baseline.json`.
+
+Usage:
+    python tests/benchmark/bench_config.py [--scenario NAME ...] [--update-baseline]
+
+Notes:
+    - The benchmarks run offline and without root. `shutil.chown` is mocked so that the
+      configuration managers can be created with the `slurm` user and group.
+    - Syscall counts are read from `/proc/self/io` and only count `read` and `write`
+      syscalls. They are not recorded if `/proc/self/io` is unavailable.
+    - Wall time is noisy across machines. Regenerate the baseline with `--update-baseline`
+      on the machine that runs the comparison.
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from slurm_ops import diff_slurm_config
+from slurm_ops.core import SlurmConfigManager, marshal_options, parse_options
+from slurmutils import SlurmConfigEditor
+
+BASELINE = Path(__file__).parent / "baseline.json"
+
+# Allowed increase over the baseline before a metric is reported as a regression.
+TOLERANCE = {"time": 0.5, "alloc": 0.1, "syscalls": 0.1}
+
+MAIN_CONFIG = """\
+clustername=bench
+slurmctldhost=bench-0
+slurmctldport=6817
+slurmdport=6818
+statesavelocation=/var/lib/slurm/checkpoint
+slurmdspooldir=/var/lib/slurm/slurmd
+authtype=auth/slurm
+credtype=cred/slurm
+selecttype=select/cons_tres
+proctracktype=proctrack/cgroup
+taskplugin=task/cgroup,task/affinity
+schedulertype=sched/backfill
+killwait=30
+"""
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """Size of a synthetic `slurm.conf` tree."""
+
+    nodes: int
+    includes: int
+
+
+SCENARIOS = {
+    "tiny": Scenario(nodes=10, includes=1),
+    "small": Scenario(nodes=1_000, includes=10),
+    "medium": Scenario(nodes=10_000, includes=100),
+    "large": Scenario(nodes=50_000, includes=1_000),
+}
+
+
+def generate(root: Path, scenario: Scenario) -> None:
+    """Generate a synthetic `slurm.conf` tree with a partition include file per node set."""
+    names = [f"part-{i:04d}" for i in range(scenario.includes)]
+    lines = [MAIN_CONFIG]
+    lines.extend(f"include {root / f'slurm.conf.{name}'}\n" for name in names)
+    for i in range(scenario.nodes):
+        feature = names[i % len(names)]
+        lines.append(
+            f"nodename=node-{i:05d} nodeaddr=10.{i // 65536}.{i // 256 % 256}.{i % 256} "
+            + f"cpus=64 realmemory=256000 features={feature}\n"
+        )
+
+    (root / "slurm.conf").write_text("".join(lines))
+    for name in names:
+        (root / f"slurm.conf.{name}").write_text(
+            f"nodeset={name} feature={name}\npartitionname={name} nodes={name} maxtime=60\n"
+        )
+
+
+def manager(root: Path) -> SlurmConfigManager:
+    """Create a new `slurm.conf` configuration manager for a synthetic tree."""
+    return SlurmConfigManager(
+        SlurmConfigEditor,
+        file=root / "slurm.conf",
+        mode=0o644,
+        user="slurm",
+        group="slurm",
+    )
+
+
+def operations(root: Path) -> Iterator[tuple[str, Callable[[], Any]]]:
+    """Yield the operations to benchmark against a synthetic tree.
+
+    Each operation is yielded as a name and a function that performs the operation once.
+    Setup work that should not be measured is done before the operation is yielded.
+    """
+    editor = SlurmConfigEditor()
+    text = (root / "slurm.conf").read_text()
+    config = editor.loads(text)
+    yield "editor.loads", lambda: editor.loads(text)
+    yield "editor.dumps", lambda: editor.dumps(config)
+
+    yield "load.cold", lambda: manager(root).load()
+    warm = manager(root)
+    warm.load()
+    yield "load.warm", warm.load
+    yield "load_keys", lambda: manager(root).load_keys("slurmctld_host")
+    yield "records.first", lambda: next(manager(root).records("nodes"))
+
+    yield "dump.unchanged", lambda: warm.dump(config)
+    ports = iter(range(7000, 60000))
+
+    def edit() -> None:
+        with warm.edit() as c:
+            c.slurmctld_port = next(ports)
+
+    yield "edit", edit
+
+    yield "includes.list", lambda: list(manager(root).includes)
+    yield "includes.load", lambda: [i.load() for i in manager(root).includes.values()]
+
+    merged = manager(root)
+    merged.merge()
+    yield "merge.unchanged", lambda: manager(root).merge()
+
+    includes = {name: i.load() for name, i in manager(root).includes.items()}
+    changed = editor.loads(text)
+    changed.kill_wait = 60
+    yield "diff_slurm_config", lambda: diff_slurm_config(
+        {"slurm.conf": config, **includes}, {"slurm.conf": changed, **includes}
+    )
+
+    options = {"-Z": True, "--conf": "RealMemory=60000 CPUs=16", "--conf-server": "bench-0:6817"}
+    marshalled = marshal_options(options)
+    yield "marshal_options", lambda: [marshal_options(options) for _ in range(1000)]
+    yield "parse_options", lambda: [parse_options(marshalled) for _ in range(1000)]
+
+
+def _syscalls() -> int | None:
+    """Get the number of read and write syscalls made by this process."""
+    try:
+        io = dict(line.split(": ") for line in Path("/proc/self/io").read_text().splitlines())
+    except OSError:
+        return None
+
+    return int(io["syscr"]) + int(io["syscw"])
+
+
+@contextmanager
+def _traced() -> Iterator[list[int]]:
+    """Trace the peak memory allocated within the context."""
+    result = []
+    tracemalloc.start()
+    try:
+        yield result
+        result.append(tracemalloc.get_traced_memory()[1])
+    finally:
+        tracemalloc.stop()
+
+
+def measure(func: Callable[[], Any], repeat: int) -> dict[str, float | int | None]:
+    """Measure an operation.
+
+    Returns:
+        The minimum wall time in seconds over `repeat` runs, the peak memory allocated in
+        bytes, and the number of read and write syscalls made by a single run.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    with _traced() as peak:
+        func()
+
+    before = _syscalls()
+    func()
+    after = _syscalls()
+
+    return {
+        "time": min(times),
+        "alloc": peak[0],
+        "syscalls": after - before if before is not None and after is not None else None,
+    }
+
+
+def run(names: list[str], repeat: int) -> dict[str, dict[str, dict[str, Any]]]:
+    """Run the benchmarks for the named scenarios."""
+    results = {}
+    with patch("shutil.chown"):
+        for name in names:
+            results[name] = _run(name, repeat)
+
+    return results
+
+
+def _run(name: str, repeat: int) -> dict[str, dict[str, Any]]:
+    """Run the benchmarks for a single scenario."""
+    results = {}
+    with tempfile.TemporaryDirectory(prefix=f"slurm-ops-bench-{name}-") as tmp:
+        root = Path(tmp)
+        generate(root, SCENARIOS[name])
+        for op, func in operations(root):
+            results[op] = measure(func, repeat)
+            print(f"{name:>8} {op:<18} {_format(results[op])}", file=sys.stderr)
+
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, dict[str, Any]]], baseline: dict[str, dict[str, dict[str, Any]]]
+) -> list[str]:
+    """Compare benchmark results against a baseline.
+
+    Returns:
+        A description of each metric that regressed beyond its tolerance.
+    """
+    regressions = []
+    for name, ops in results.items():
+        for op, metrics in ops.items():
+            expected = baseline.get(name, {}).get(op)
+            if expected is None:
+                continue
+
+            for metric, tolerance in TOLERANCE.items():
+                value, reference = metrics.get(metric), expected.get(metric)
+                if value is None or not reference:
+                    continue
+
+                if value > reference * (1 + tolerance):
+                    regressions.append(
+                        f"{name}/{op}: {metric} {value:.4g} exceeds baseline {reference:.4g} "
+                        + f"by more than {tolerance:.0%}"
+                    )
+
+    return regressions
+
+
+def _format(metrics: dict[str, Any]) -> str:
+    """Format the metrics of an operation for display."""
+    syscalls = metrics["syscalls"] if metrics["syscalls"] is not None else "-"
+    return (
+        f"{metrics['time'] * 1000:10.3f} ms {metrics['alloc'] / 1024:10.1f} KiB "
+        + f"{syscalls:>8} syscalls"
+    )
+
+
+def main() -> int:
+    """Run the benchmarks and compare the results against the stored baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=SCENARIOS,
+        help="Scenario to run. Can be repeated. Defaults to every scenario.",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per operation.")
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="Store the results as the new baseline."
+    )
+    args = parser.parse_args()
+
+    results = run(args.scenario or list(SCENARIOS), args.repeat)
+    baseline = json.loads(BASELINE.read_text()) if BASELINE.exists() else {}
+    if args.update_baseline:
+        BASELINE.write_text(json.dumps(baseline | results, indent=2, sort_keys=True) + "\n")
+        return 0
+
+    regressions = compare(results, baseline)
+    for regression in regressions:
+        print(f"regression: {regression}", file=sys.stderr)
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,7 +18,14 @@ import subprocess
 from unittest.mock import Mock
 
 import pytest
+
+# `slurm_ops` imports `cryptography` lazily. Import it before any fake filesystem is set up, as
+# `pyfakefs` unloads modules first imported while it is active, and re-importing the Python half
+# of `cryptography` leaves it out of sync with its already-loaded Rust bindings.
+import cryptography.hazmat.primitives.asymmetric.rsa  # noqa: F401
+import cryptography.hazmat.primitives.serialization  # noqa: F401
 from pytest_mock import MockerFixture
+from slurm_ops.core import SnapdClient
 
 
 @pytest.fixture(scope="function")
@@ -27,3 +34,9 @@ def mock_run(mocker: MockerFixture) -> Mock:
     return mocker.patch.object(
         subprocess, "run", return_value=subprocess.CompletedProcess(args=[], returncode=0)
     )
+
+
+@pytest.fixture(autouse=True)
+def mock_snapd(mocker: MockerFixture) -> None:
+    """Make the snap backend use the mocked `snap` CLI rather than the host's snapd socket."""
+    mocker.patch("slurm_ops.core.base._snapd", SnapdClient("/nonexistent/snapd.socket"))
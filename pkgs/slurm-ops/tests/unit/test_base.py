@@ -30,6 +30,9 @@ from hpc_libs.machine import apt
 from pyfakefs.fake_filesystem import FakeFilesystem
 from pytest_mock import MockerFixture
 from slurm_ops import (
+    InstallSource,
+    ProvisioningPlan,
+    ResourceProfile,
     SackdManager,
     SlurmctldManager,
     SlurmdbdManager,
@@ -63,15 +66,18 @@ class TestAptManager:
 
         return request.param[0](), request.param[1]
 
-    def test_install(self, mock_manager, mocker: MockerFixture) -> None:
+    def test_install(self, mock_manager, mock_run, mocker: MockerFixture) -> None:
         """Test the `install` method."""
-        manager, _ = mock_manager
+        manager, service = mock_manager
         mocker.patch("slurm_ops.core.base._AptManager._init_ubuntu_hpc_ppa")
-        mocker.patch("slurm_ops.core.base._AptManager._install_service")
         mocker.patch("slurm_ops.core.base._AptManager._apply_overrides")
         mocker.patch("shutil.chown")
+        mock_update = mocker.patch.object(apt, "update")
 
         manager.install()
+        mock_update.assert_called_once()
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0][:4] == ["apt-get", "--yes", "install", service]
         f_info = Path("/var/lib/slurm").stat()
         assert stat.filemode(f_info.st_mode) == "drwxr-xr-x"
         f_info = Path("/var/lib/slurm/checkpoint").stat()
@@ -179,19 +185,18 @@ class TestAptManager:
         f_info = target.stat()
         assert stat.filemode(f_info.st_mode) == "-rw-r--r--"
 
-    def test_install_service(self, mock_manager, mocker: MockerFixture) -> None:
-        """Test the `_install_service` helper method."""
+    def test_service_packages(self, mock_manager) -> None:
+        """Test the `_service_packages` helper method."""
         manager, service = mock_manager
-        mock_add_package = mocker.patch.object(apt, "add_package")
 
-        # Test that the correct packages are installed based on the Slurm service being managed.
-        manager._ops_manager._install_service()
+        # Test that the correct packages are needed based on the Slurm service being managed.
+        packages = manager._ops_manager._service_packages()
         match service:
             case "sackd":
-                assert mock_add_package.call_args[0][0] == ["sackd", "slurm-client"]
+                assert packages == ["sackd", "slurm-client"]
 
             case "slurmctld":
-                assert mock_add_package.call_args[0][0] == [
+                assert packages == [
                     "slurmctld",
                     "libpmix-dev",
                     "mailutils",
@@ -199,7 +204,7 @@ class TestAptManager:
                 ]
 
             case "slurmd":
-                assert mock_add_package.call_args[0][0] == [
+                assert packages == [
                     "slurmd",
                     "slurm-client",
                     "libpmix-dev",
@@ -207,22 +212,39 @@ class TestAptManager:
                 ]
 
             case "slurmdbd":
-                assert mock_add_package.call_args[0][0] == ["slurmdbd"]
+                assert packages == ["slurmdbd"]
 
             case "slurmrestd":
-                assert mock_add_package.call_args[0][0] == [
+                assert packages == [
                     "slurmrestd",
                     "slurm-wlm-basic-plugins",
                 ]
 
-        # Test that a `SlurmOpsError` error is raised if a package fails to install.
-        mock_add_package.side_effect = apt.PackageError("failed to install packages")
+    def test_provision_install_source(self, mock_manager, mocker: MockerFixture) -> None:
+        """Test that the Ubuntu HPC PPA is not added when installing from an install source."""
+        manager, service = mock_manager
+        mock_init_ppa = mocker.patch("slurm_ops.core.base._AptManager._init_ubuntu_hpc_ppa")
+        plan = ProvisioningPlan(source=InstallSource("file:///srv/slurm-debs", verified=True))
+
+        manager.provision(plan)
+        mock_init_ppa.assert_not_called()
+        assert plan.phases == [service]
+
+    def test_install_error(self, mock_manager, mock_run, mocker: MockerFixture) -> None:
+        """Test that `install` raises a `SlurmOpsError` if the packages fail to install."""
+        manager, service = mock_manager
+        mocker.patch("slurm_ops.core.base._AptManager._init_ubuntu_hpc_ppa")
+        mocker.patch.object(apt, "update")
+        mock_run.side_effect = CalledProcessError(
+            returncode=100, cmd=["apt-get"], stderr="failed to install packages"
+        )
+
         with pytest.raises(SlurmOpsError) as exec_info:
-            manager._ops_manager._install_service()
+            manager.install()
 
         assert exec_info.type == SlurmOpsError
         assert exec_info.value.message == (
-            f"failed to install {service}. reason: failed to install packages"
+            f"failed to install packages for {service}. reason: failed to install packages"
         )
 
     def test_apply_overrides(self, mock_manager, mock_run) -> None:
@@ -250,9 +272,47 @@ class TestAptManager:
                 ]
                 assert systemctl == ["systemctl", "daemon-reload"]
 
+            case "slurmdbd":
+                # `slurmdbd` has no overrides, so systemd does not need to be reloaded.
+                assert ["systemctl", "daemon-reload"] not in [
+                    c[0][0] for c in mock_run.call_args_list
+                ]
+
             case _:
                 assert mock_run.call_args[0][0] == ["systemctl", "daemon-reload"]
 
+        # Test that systemd is not reloaded if the overrides are unchanged.
+        mock_run.reset_mock()
+        manager._ops_manager._apply_overrides()
+        assert ["systemctl", "daemon-reload"] not in [c[0][0] for c in mock_run.call_args_list]
+
+    def test_set_resources(self, mock_manager, mock_run) -> None:
+        """Test the `set_resources` method."""
+        manager, service = mock_manager
+        dropin = Path(f"/etc/systemd/system/{service}.service.d/20-resources.conf")
+        profile = ResourceProfile(slice="slurm.slice", cpus="0-3,8", io_weight=500, nice=-5)
+
+        assert manager.set_resources(profile)
+        assert dropin.read_text() == (
+            "[Service]\n"
+            + "Slice=slurm.slice\n"
+            + "AllowedCPUs=0-3,8\n"
+            + "CPUAffinity=0-3,8\n"
+            + "IOWeight=500\n"
+            + "Nice=-5\n"
+        )
+        assert mock_run.call_args[0][0] == ["systemctl", "daemon-reload"]
+        assert manager.changed
+
+        # Test that an unchanged profile does not require a restart.
+        mock_run.reset_mock()
+        assert not manager.set_resources(profile)
+        mock_run.assert_not_called()
+
+        # Test that an empty profile removes the drop-in.
+        assert manager.set_resources(ResourceProfile())
+        assert not dropin.exists()
+
 
 class TestSnapManager:
     """Unit tests for the `_SnapManager` class."""
@@ -15,6 +15,7 @@
 
 """Unit tests for the Slurm service configuration managers."""
 
+import os
 import stat
 from pathlib import Path
 
@@ -32,7 +33,9 @@ from constants import (
     FAKE_USER_UID,
 )
 from pyfakefs.fake_filesystem import FakeFilesystem
-from slurm_ops.core import SlurmConfigManager, SlurmManager
+from slurm_ops import SlurmOpsError
+from slurm_ops.core import SlurmConfigManager, SlurmManager, SnapshotStore
+from slurm_ops.core.config import IncludeMapping
 from slurmutils import (
     AcctGatherConfigEditor,
     CGroupConfigEditor,
@@ -422,3 +425,319 @@ class TestConfigManagers:
         mock_manager.slurmdbd.restore()
         config = mock_manager.slurmdbd.includes["slurmdbd.conf.overrides"].load()
         assert config.debug_level == "debug5"
+
+    def test_load_cache(self, mock_manager, mocker) -> None:
+        """Test that configuration files are only parsed again after they change."""
+        load = mocker.spy(mock_manager.slurm._editor, "loads")
+
+        config = mock_manager.slurm.load()
+        assert mock_manager.slurm.load().dict() == config.dict()
+        assert load.call_count == 1
+
+        # Check that modifying a loaded configuration does not modify later loads.
+        port = config.slurmctld_port
+        config.slurmctld_port = 8081
+        config.nodes.clear()
+        assert mock_manager.slurm.load().slurmctld_port == port
+        assert mock_manager.slurm.load().nodes
+        assert load.call_count == 1
+
+        # Check that an edit that is never written does not modify the cached configuration.
+        with pytest.raises(ValueError):
+            with mock_manager.slurm.edit() as edited:
+                edited.slurmctld_port = 8081
+                raise ValueError
+
+        assert mock_manager.slurm.load().slurmctld_port != 8081
+        assert load.call_count == 1
+
+        # Check that the cache is invalidated after a configuration file is edited.
+        with mock_manager.slurm.edit() as config:
+            config.slurmctld_port = 8081
+
+        assert mock_manager.slurm.load().slurmctld_port == 8081
+        assert load.call_count == 2
+
+        # Check that changes made outside the configuration manager are picked up.
+        path = Path("/etc/slurm/slurm.conf")
+        path.write_text(path.read_text().replace("8081", "8082"))
+        assert mock_manager.slurm.load().slurmctld_port == 8082
+        assert load.call_count == 3
+
+        # Check that the cache is invalidated after a configuration file is deleted.
+        mock_manager.slurm.delete()
+        with pytest.raises(FileNotFoundError):
+            mock_manager.slurm.load()
+
+    def test_transaction(self, mock_manager, mocker) -> None:
+        """Test editing a configuration file and its includes in a single transaction."""
+        Path("/etc/slurm/slurm.conf.old").write_text("slurmctldport=8080\n")
+
+        with mock_manager.slurm.transaction() as tx:
+            tx.includes["slurm.conf.batch"].slurmctld_port = 8081
+            tx.config.include = ["slurm.conf.batch"]
+            tx.config.slurmctld_port = 8082
+            tx.delete("slurm.conf.old")
+
+            # Check that nothing is written until the transaction is committed.
+            assert not Path("/etc/slurm/slurm.conf.batch").exists()
+            assert Path("/etc/slurm/slurm.conf.old").exists()
+            assert mock_manager.slurm.load().slurmctld_port != 8082
+
+        assert mock_manager.slurm.load().include == ["slurm.conf.batch"]
+        assert mock_manager.slurm.load().slurmctld_port == 8082
+        assert mock_manager.slurm.includes["slurm.conf.batch"].load().slurmctld_port == 8081
+        assert not Path("/etc/slurm/slurm.conf.old").exists()
+        assert sorted(p.name for p in Path("/etc/slurm").glob("*slurm.conf*")) == [
+            "slurm.conf",
+            "slurm.conf.batch",
+        ]
+
+        # Ensure that permissions on committed files are correct.
+        f_info = Path("/etc/slurm/slurm.conf.batch").stat()
+        assert stat.filemode(f_info.st_mode) == "-rw-r--r--"
+        assert f_info.st_uid == FAKE_USER_UID
+        assert f_info.st_gid == FAKE_GROUP_GID
+
+        # Check that nothing is written if the transaction fails.
+        with pytest.raises(ValueError):
+            with mock_manager.slurm.transaction() as tx:
+                tx.config.slurmctld_port = 8083
+                raise ValueError
+
+        assert mock_manager.slurm.load().slurmctld_port == 8082
+
+    def test_write_elision(self, mock_manager) -> None:
+        """Test that configuration files are only written if their contents change."""
+        # Normalize `slurm.conf` so that its content matches the rendered configuration.
+        config = mock_manager.slurm.load()
+        assert mock_manager.slurm.dump(config) is True
+        mock_manager = MockManager()
+        path = Path("/etc/slurm/slurm.conf")
+        mtime = path.stat().st_mtime_ns
+        assert not mock_manager.changed
+
+        # Check that dumping the same configuration does not rewrite the configuration file.
+        assert mock_manager.slurm.dump(config) is False
+        with mock_manager.slurm.edit() as config:
+            config.slurmctld_port = config.slurmctld_port
+
+        with mock_manager.slurm.transaction() as tx:
+            tx.config.slurmctld_port = tx.config.slurmctld_port
+
+        assert path.stat().st_mtime_ns == mtime
+        assert not mock_manager.slurm.changed
+        assert not mock_manager.changed
+
+        # Check that changes are recorded on both the configuration manager and the manager.
+        with mock_manager.slurm.includes["slurm.conf.overrides"].edit() as config:
+            config.slurmctld_port = 8081
+
+        assert mock_manager.slurm.changes == {Path("/etc/slurm/slurm.conf.overrides")}
+        assert mock_manager.changed
+        assert not mock_manager.cgroup.changed
+
+        mock_manager.cgroup.delete()
+        assert mock_manager.cgroup.changes == {Path("/etc/slurm/cgroup.conf")}
+
+    def test_dump_atomic(self, mock_manager, mocker) -> None:
+        """Test that `dump` replaces configuration files atomically."""
+        path = Path("/etc/slurm/cgroup.conf")
+        content = path.read_text()
+        config = mock_manager.cgroup.load()
+        config.constrain_cores = not config.constrain_cores
+
+        # Check that the configuration file is left untouched if it cannot be replaced.
+        mocker.patch("os.replace", side_effect=OSError)
+        with pytest.raises(OSError):
+            mock_manager.cgroup.dump(config)
+
+        assert path.read_text() == content
+        assert not [p for p in path.parent.iterdir() if p.name.startswith(".cgroup.conf.")]
+
+        mocker.stopall()
+        assert mock_manager.cgroup.dump(config) is True
+        assert mock_manager.cgroup.load().constrain_cores == config.constrain_cores
+
+        # Ensure that permissions on the replaced file are correct.
+        f_info = path.stat()
+        assert stat.filemode(f_info.st_mode) == "-rw-r--r--"
+        assert f_info.st_uid == FAKE_USER_UID
+        assert f_info.st_gid == FAKE_GROUP_GID
+
+    def test_include_index(self, mock_manager, mocker) -> None:
+        """Test that include files are only listed again when the directory changes."""
+        listed = mocker.spy(IncludeMapping, "__init__")
+
+        includes = mock_manager.slurm.includes
+        assert mock_manager.slurm.includes["slurm.conf.batch"] is includes["slurm.conf.batch"]
+        assert "slurm.conf.batch" not in includes
+        assert listed.call_count == 1
+
+        # Check that include files created or deleted by the manager update the index.
+        with mock_manager.slurm.includes["slurm.conf.batch"].edit() as config:
+            config.slurmctld_port = 8081
+
+        assert "slurm.conf.batch" in mock_manager.slurm.includes
+        mock_manager.slurm.includes["slurm.conf.batch"].delete()
+        assert "slurm.conf.batch" not in mock_manager.slurm.includes
+        assert listed.call_count == 1
+
+        # Check that include files created by others are picked up.
+        # pyfakefs does not update the modification time of a directory when a file is created.
+        Path("/etc/slurm/slurm.conf.debug").write_text("slurmctlddebug=debug\n")
+        mtime = Path("/etc/slurm").stat().st_mtime_ns + 1
+        os.utime("/etc/slurm", ns=(mtime, mtime))
+        assert "slurm.conf.debug" in mock_manager.slurm.includes
+        assert listed.call_count == 2
+
+    def test_incremental_merge(self, mock_manager, mocker) -> None:
+        """Test that only include files changed since the last merge are merged again."""
+        with mock_manager.slurmdbd.includes["slurmdbd.conf.a"].edit() as config:
+            config.debug_level = "debug"
+
+        with mock_manager.slurmdbd.includes["slurmdbd.conf.b"].edit() as config:
+            config.debug_level = "debug2"
+
+        assert mock_manager.slurmdbd.merge() is True
+        assert mock_manager.slurmdbd.load().debug_level == "debug2"
+        assert mock_manager.slurmdbd.merge() is False
+
+        # Check that nothing is merged by a new manager if the include files are unchanged.
+        mock_manager = MockManager()
+        load = mocker.spy(mock_manager.slurmdbd.includes["slurmdbd.conf.a"], "load")
+        assert mock_manager.slurmdbd.merge() is False
+        assert load.call_count == 0
+
+        # Check that later include files still take precedence over a changed include file.
+        with mock_manager.slurmdbd.includes["slurmdbd.conf.a"].edit() as config:
+            config.debug_level = "debug3"
+            config.log_file = "/var/log/slurm/slurmdbd.log"
+
+        assert mock_manager.slurmdbd.merge() is True
+        config = mock_manager.slurmdbd.load()
+        assert config.debug_level == "debug2"
+        assert config.log_file == "/var/log/slurm/slurmdbd.log"
+
+        # Check that all include files are merged again if `slurmdbd.conf` is replaced.
+        with mock_manager.slurmdbd.edit() as config:
+            config.debug_level = "info"
+
+        assert mock_manager.slurmdbd.merge() is True
+        assert mock_manager.slurmdbd.load().debug_level == "debug2"
+
+    def test_incremental_merge_matches_full_merge(self, mock_manager) -> None:
+        """Test that incremental merges produce the same configuration as full merges."""
+
+        def full_merge() -> dict:
+            Path("/etc/slurm/.slurmdbd.conf.merge").unlink()
+            mock_manager.slurmdbd.merge()
+            return mock_manager.slurmdbd.load().dict()
+
+        Path("/etc/slurm/slurmdbd.conf.a").write_text("debuglevel=debug\n")
+        Path("/etc/slurm/slurmdbd.conf.b").write_text("debuglevel=debug2\nlogfile=/var/log/b\n")
+        mock_manager.slurmdbd.merge()
+        assert mock_manager.slurmdbd.load().debug_level == "debug2"
+
+        # Check that an overlapping key changed in an earlier include file is still overridden.
+        Path("/etc/slurm/slurmdbd.conf.a").write_text("debuglevel=debug3\nlogfile=/var/log/a\n")
+        assert mock_manager.slurmdbd.merge() is False
+        incremental = mock_manager.slurmdbd.load()
+        assert incremental.dict() == full_merge()
+
+        # Check that a key removed from a later include file falls back to the earlier value.
+        Path("/etc/slurm/slurmdbd.conf.b").write_text("logfile=/var/log/b\n")
+        assert mock_manager.slurmdbd.merge() is True
+        incremental = mock_manager.slurmdbd.load()
+        assert incremental.debug_level == "debug3"
+        assert incremental.dict() == full_merge()
+
+    def test_snapshot_store(self, mock_manager) -> None:
+        """Test saving and restoring generations of a configuration file and its includes."""
+        store = SnapshotStore(Path("/var/lib/slurm/snapshots"), keep=2)
+        slurm = SlurmConfigManager(
+            SlurmConfigEditor,
+            file=Path("/etc/slurm/slurm.conf"),
+            mode=0o644,
+            user=FAKE_USER,
+            group=FAKE_GROUP,
+            store=store,
+        )
+        assert slurm.list_generations() == []
+        with slurm.includes["slurm.conf.overrides"].edit() as config:
+            config.slurmctld_port = 8081
+
+        slurm.save()
+        original = Path("/etc/slurm/slurm.conf").read_text()
+        # Check that unchanged files do not create a new generation.
+        slurm.save()
+        assert [g.id for g in slurm.list_generations()] == [1]
+        assert set(slurm.list_generations()[0].files) == {"slurm.conf", "slurm.conf.overrides"}
+
+        with slurm.edit() as config:
+            config.slurmctld_port = 8082
+
+        with slurm.includes["slurm.conf.batch"].edit() as config:
+            config.slurmd_port = 8083
+
+        slurm.save()
+        # Check that the unchanged `slurm.conf.overrides` file is not stored again.
+        assert len(list(Path("/var/lib/slurm/snapshots/objects").iterdir())) == 4
+
+        # Restore the first generation.
+        slurm.restore(1)
+        assert Path("/etc/slurm/slurm.conf").read_text() == original
+        assert slurm.load().slurmctld_port != 8082
+        assert slurm.includes["slurm.conf.overrides"].load().slurmctld_port == 8081
+        assert not Path("/etc/slurm/slurm.conf.batch").exists()
+        f_info = Path("/etc/slurm/slurm.conf.overrides").stat()
+        assert stat.filemode(f_info.st_mode) == "-rw-r--r--"
+        assert f_info.st_uid == FAKE_USER_UID
+
+        with slurm.edit() as config:
+            config.slurmctld_port = 8084
+
+        slurm.save()
+        # Check that only the newest generations, and the files they reference, are kept.
+        assert [g.id for g in slurm.list_generations()] == [2, 3]
+        assert len(list(Path("/var/lib/slurm/snapshots/objects").iterdir())) == 4
+        with pytest.raises(SlurmOpsError):
+            slurm.restore(1)
+
+    def test_load_keys(self, mock_manager, mocker) -> None:
+        """Test loading only some keys or records from a configuration file."""
+        config = mock_manager.slurm.load_keys("slurmctld_host", "StateSaveLocation")
+        assert len(config.slurmctld_host) == 2
+        assert config.state_save_location == "/var/spool/slurm.state"
+        assert config.nodes == {}
+        assert mock_manager.slurm.load_keys("partitions").partitions.keys() == {
+            "default",
+            "batch",
+        }
+
+        # Check that records are parsed lazily.
+        loads = mocker.spy(mock_manager.slurm._editor, "loads")
+        nodes = mock_manager.slurm.records("nodes")
+        assert next(nodes).node_name == "juju-c9fc6f-2"
+        assert next(nodes).node_name == "juju-c9fc6f-3"
+        assert loads.call_count == 2
+        nodes.close()
+
+        assert [n.down_nodes for n in mock_manager.slurm.records("down_nodes")] == [
+            ["juju-c9fc6f-5"]
+        ]
+        with pytest.raises(ValueError):
+            mock_manager.slurm.records("slurmctld_host")
+
+        # Check that keys and records are served from the cache once the file is loaded.
+        cached = mock_manager.slurm.load()
+        assert config.slurmctld_host == cached.slurmctld_host
+        loads.reset_mock()
+        assert mock_manager.slurm.load_keys("slurmctld_host").dict() == cached.dict()
+        assert [n.node_name for n in mock_manager.slurm.records("nodes")] == list(cached.nodes)
+        assert loads.call_count == 0
+
+        # Check that modifying cached keys or records does not modify later loads.
+        mock_manager.slurm.load_keys("slurmctld_host").slurmctld_host.clear()
+        next(mock_manager.slurm.records("nodes")).cpus = 128
+        assert mock_manager.slurm.load().dict() == cached.dict()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the Slurm configuration diff utilities."""
+
+import copy
+from unittest.mock import PropertyMock
+
+import pytest
+from constants import FAKE_GROUP, FAKE_USER
+from pyfakefs.fake_filesystem import FakeFilesystem
+from pytest_mock import MockerFixture
+from slurm_ops import ReconfigureAction, SlurmctldManager, diff_slurm_config
+from slurmutils import Node, NodeSet, Partition, SlurmConfig
+
+# Only the keys under test. Parsing is slow, so large configurations are covered by
+# `tests/benchmark` instead.
+SLURM_CONFIG = """\
+slurmctldhost=juju-c9fc6f-1
+slurmctldport=7002
+killwait=30
+nodename=juju-c9fc6f-2 cpus=1
+"""
+
+
+@pytest.fixture
+def config() -> SlurmConfig:
+    """Request an example Slurm configuration."""
+    return SlurmConfig.from_str(SLURM_CONFIG)
+
+
+def test_diff_no_changes(config) -> None:
+    """Test that configurations with the same effective parameters need no action."""
+    # Move `SlurmctldPort` from `slurm.conf` into an include file.
+    moved = copy.deepcopy(config)
+    include = SlurmConfig(slurmctldport=moved.slurmctld_port)
+    del moved.slurmctld_port
+    moved.include = ["slurm.conf.overrides"]
+
+    diff = diff_slurm_config(
+        {"slurm.conf": config}, {"slurm.conf": moved, "slurm.conf.overrides": include}
+    )
+    assert diff.changes == {"include": ReconfigureAction.NONE}
+    assert diff.action == ReconfigureAction.NONE
+
+    diff = diff_slurm_config({"slurm.conf": config}, {"slurm.conf": copy.deepcopy(config)})
+    assert diff.changes == {}
+    assert diff.action == ReconfigureAction.NONE
+
+
+def test_diff_reconfigure(config) -> None:
+    """Test changes that only require `scontrol reconfigure`."""
+    new = copy.deepcopy(config)
+    new.kill_wait = 60
+    new.nodes["juju-c9fc6f-2"].cpus = 10
+    new.include = ["slurm.conf.batch"]
+    partition = SlurmConfig()
+    partition.nodesets["batch"] = NodeSet(nodeset="batch", feature="batch")
+    partition.partitions["batch"] = Partition(partitionname="batch", nodes=["batch"])
+
+    diff = diff_slurm_config(
+        {"slurm.conf": config}, {"slurm.conf": new, "slurm.conf.batch": partition}
+    )
+    assert diff.changes == {
+        "include": ReconfigureAction.NONE,
+        "killwait": ReconfigureAction.RECONFIGURE,
+        "nodes/juju-c9fc6f-2": ReconfigureAction.RECONFIGURE,
+        "nodesets/batch": ReconfigureAction.RECONFIGURE,
+        "partitions/batch": ReconfigureAction.RECONFIGURE,
+    }
+    assert diff.action == ReconfigureAction.RECONFIGURE
+
+
+@pytest.mark.parametrize(
+    "key,value",
+    (
+        pytest.param("slurmctld_host", ["juju-c9fc6f-0"], id="slurmctldhost"),
+        pytest.param("state_save_location", "/srv/slurm", id="statesavelocation"),
+        pytest.param("slurmd_port", 7000, id="slurmdport"),
+        pytest.param("scheduler_type", "sched/builtin", id="schedulertype"),
+        pytest.param("task_plugin", ["task/affinity"], id="taskplugin"),
+    ),
+)
+def test_diff_restart(config, key, value) -> None:
+    """Test changes that require a restart of `slurmctld`."""
+    new = copy.deepcopy(config)
+    setattr(new, key, value)
+
+    diff = diff_slurm_config({"slurm.conf": config}, {"slurm.conf": new})
+    assert diff.action == ReconfigureAction.RESTART
+
+
+@pytest.mark.parametrize(
+    "key,value",
+    (
+        pytest.param("kill_wait", 60, id="killwait"),
+        pytest.param("max_array_size", 2000, id="maxarraysize"),
+        pytest.param("slurmctld_debug", "debug", id="slurmctlddebug"),
+    ),
+)
+def test_diff_unlisted(config, key, value) -> None:
+    """Test that changes to parameters without a listed action only require a reconfigure."""
+    new = copy.deepcopy(config)
+    setattr(new, key, value)
+
+    diff = diff_slurm_config({"slurm.conf": config}, {"slurm.conf": new})
+    assert diff.action == ReconfigureAction.RECONFIGURE
+
+
+def test_diff_node_added(config) -> None:
+    """Test that adding a node requires a restart of `slurmctld`."""
+    new = copy.deepcopy(config)
+    new.nodes["juju-c9fc6f-20"] = Node(nodename="juju-c9fc6f-20", cpus=1)
+
+    diff = diff_slurm_config({"slurm.conf": config}, {"slurm.conf": new})
+    assert diff.changes == {"nodes/juju-c9fc6f-20": ReconfigureAction.RESTART}
+
+
+def test_get_reconfigure_action(fs: FakeFilesystem, mocker: MockerFixture) -> None:
+    """Test that `SlurmctldManager` picks the least disruptive action for its changes."""
+    mocker.patch.object(SlurmctldManager, "user", new=PropertyMock(return_value=FAKE_USER))
+    mocker.patch.object(SlurmctldManager, "group", new=PropertyMock(return_value=FAKE_GROUP))
+    fs.create_file("/etc/slurm/slurm.conf", contents=SLURM_CONFIG)
+
+    slurmctld = SlurmctldManager()
+    assert slurmctld.get_reconfigure_action() == ReconfigureAction.NONE
+
+    with slurmctld.config.edit() as config:
+        config.kill_wait = 60
+
+    assert slurmctld.get_reconfigure_action() == ReconfigureAction.RECONFIGURE
+
+    with slurmctld.config.edit() as config:
+        config.slurmctld_port = 7000
+
+    assert slurmctld.get_reconfigure_action() == ReconfigureAction.RESTART
+
+    # Check that reverting a change does not require any action.
+    slurmctld = SlurmctldManager()
+    with slurmctld.config.edit() as config:
+        config.kill_wait = 90
+
+    with slurmctld.config.edit() as config:
+        config.kill_wait = 60
+
+    assert slurmctld.config.changed
+    assert slurmctld.get_reconfigure_action() == ReconfigureAction.NONE
+
+
+def test_pending_action(fs: FakeFilesystem, mocker: MockerFixture) -> None:
+    """Test that an action left pending by an earlier hook is taken by later hooks."""
+    mocker.patch.object(SlurmctldManager, "user", new=PropertyMock(return_value=FAKE_USER))
+    mocker.patch.object(SlurmctldManager, "group", new=PropertyMock(return_value=FAKE_GROUP))
+    fs.create_file("/etc/slurm/slurm.conf", contents=SLURM_CONFIG)
+
+    slurmctld = SlurmctldManager()
+    with slurmctld.config.edit() as config:
+        config.slurmctld_port = 7000
+
+    # Simulate a hook whose restart failed after `slurm.conf` was written.
+    slurmctld.pending_action = slurmctld.get_reconfigure_action()
+
+    slurmctld = SlurmctldManager()
+    assert slurmctld.pending_action == ReconfigureAction.RESTART
+    assert slurmctld.get_reconfigure_action() == ReconfigureAction.RESTART
+    assert "slurm.conf.pending" not in slurmctld.config.includes
+
+    slurmctld.pending_action = ReconfigureAction.NONE
+    assert SlurmctldManager().get_reconfigure_action() == ReconfigureAction.NONE
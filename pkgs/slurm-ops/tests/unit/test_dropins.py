@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the `slurm_ops.core.dropins` module."""
+
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from pyfakefs.fake_filesystem import FakeFilesystem
+from slurm_ops.core import DropInManager
+from slurm_ops.core.dropins import render_unit
+
+
+def test_render_unit() -> None:
+    """Test the `render_unit` function."""
+    assert render_unit(
+        {
+            "Unit": {"After": ["network.target", "munge.service"]},
+            "Service": {"LimitNOFILE": 1048576, "Delegate": True, "CPUAffinity": None},
+        }
+    ) == (
+        "[Unit]\n"
+        + "After=network.target\n"
+        + "After=munge.service\n"
+        + "\n"
+        + "[Service]\n"
+        + "LimitNOFILE=1048576\n"
+        + "Delegate=yes\n"
+    )
+
+
+class TestDropInManager:
+    """Unit tests for the `DropInManager` class."""
+
+    @pytest.fixture
+    def manager(self, fs: FakeFilesystem) -> DropInManager:
+        """Request a drop-in manager for `slurmd.service` with a mocked reload."""
+        return DropInManager("slurmd.service", reload=Mock())
+
+    def test_set(self, manager) -> None:
+        """Test that drop-in files are only written and reloaded when they change."""
+        sections = {"Service": {"MemoryHigh": "90%"}}
+
+        with manager.edit() as dropins:
+            assert dropins.set("20-resources", sections)
+
+        assert Path("/etc/systemd/system/slurmd.service.d/20-resources.conf").read_text() == (
+            "[Service]\nMemoryHigh=90%\n"
+        )
+        assert manager.names() == ["20-resources"]
+        manager._reload.assert_called_once()
+
+        with manager.edit() as dropins:
+            assert not dropins.set("20-resources", sections)
+
+        manager._reload.assert_called_once()
+
+    def test_delete(self, manager) -> None:
+        """Test the `delete` method."""
+        assert not manager.delete("20-resources")
+        assert not manager.apply()
+
+        manager.set("20-resources", {"Service": {"LimitNOFILE": 65536}})
+        manager.apply()
+        assert manager.delete("20-resources")
+        assert manager.get("20-resources") is None
+        assert manager.apply()
+        assert manager._reload.call_count == 2
+
+    def test_set_unit(self, manager) -> None:
+        """Test the `set_unit` method."""
+        manager.set_unit({"Service": {"ExecStart": "/usr/sbin/slurmd"}}, path="/usr/lib/systemd")
+
+        assert Path("/usr/lib/systemd/slurmd.service").read_text() == (
+            "[Service]\nExecStart=/usr/sbin/slurmd\n"
+        )
+        assert manager.dirty
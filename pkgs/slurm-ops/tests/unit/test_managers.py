@@ -74,9 +74,9 @@ class TestManager:
             fs.create_file("/etc/slurm/slurm.key")
 
         manager, _ = mock_manager
-        manager.key._user = FAKE_USER
-        manager.key._group = FAKE_GROUP
-        manager.key._file.write_bytes(base64.b64decode(SLURM_KEY_BASE64))
+        manager.key._file._user = FAKE_USER
+        manager.key._file._group = FAKE_GROUP
+        manager.key.path.write_bytes(base64.b64decode(SLURM_KEY_BASE64))
         return manager
 
     @pytest.fixture
@@ -88,9 +88,9 @@ class TestManager:
             fs.create_file("/etc/slurm/jwt_hs256.key")
 
         manager, _ = mock_manager
-        manager.jwt._user = FAKE_USER
-        manager.jwt._group = FAKE_GROUP
-        manager.jwt._file.write_text(JWT_KEY)
+        manager.jwt._file._user = FAKE_USER
+        manager.jwt._file._group = FAKE_GROUP
+        manager.jwt.path.write_text(JWT_KEY)
         return manager
 
     # Test `<manager>.service` component.
@@ -188,6 +188,21 @@ class TestManager:
         mock_slurm_key.key.set(SLURM_KEY_BASE64)
         assert mock_slurm_key.key.get() == SLURM_KEY_BASE64
 
+    def test_set_slurm_key_unchanged(self, mocker: MockerFixture, mock_slurm_key) -> None:
+        """Test that setting the current `slurm.key` secret does not rewrite the file."""
+        chown = mocker.patch("shutil.chown")
+        key_id = mock_slurm_key.key.id
+
+        mock_slurm_key.key.set(SLURM_KEY_BASE64)
+        assert not mock_slurm_key.key.changed
+        assert mock_slurm_key.key.id == key_id
+        chown.assert_not_called()
+
+        mock_slurm_key.key.set(base64.b64encode(b"new key").decode())
+        assert mock_slurm_key.key.changed
+        assert mock_slurm_key.key.id != key_id
+        chown.assert_called_once()
+
     def test_generate_slurm_key(self, mock_slurm_key) -> None:
         """Test the `<manager>.key.generate()` method."""
         mock_slurm_key.key.generate()
@@ -327,6 +342,28 @@ class TestSlurmdManager:
         assert "SLURMD_OPTIONS" in env
         assert env["SLURMD_OPTIONS"] == ""
 
+    def test_options(self, mocker: MockerFixture, mock_manager) -> None:
+        """Test the `options` session."""
+        save_options = mocker.spy(mock_manager, "_save_options")
+        with mock_manager.options() as options:
+            options.conf_server = ["host1:6817"]
+            options.dynamic = True
+            node = options.conf
+            node.cpus = 8
+            options.conf = node
+
+        env = dotenv_values("/etc/default/slurmd")
+        assert save_options.call_count == 1
+        assert env["SLURMD_OPTIONS"] == "--conf-server host1:6817 -Z --conf cpus=8"
+        assert mock_manager.changed
+
+        # Test that unchanged options are not written back.
+        with mock_manager.options() as options:
+            options.conf_server = ["host1:6817"]
+            options.dynamic = True
+
+        assert save_options.call_count == 1
+
 
 class TestSlurmdbdManager:
     """Test additional behavior of the `SlurmdbdManager` class."""
@@ -351,9 +388,12 @@ class TestSlurmdbdManager:
         # Get the path to MySQL unix port.
         assert mock_manager.mysql_unix_port == "/var/run/mysql/mysql.sock"
 
+        assert not mock_manager.needs_restart
+
         # Set the path to MySQL unix port.
         mock_manager.mysql_unix_port = "/var/snap/mysql/common/run/mysql/mysql.sock"
         env = dotenv_values("/etc/default/slurmdbd")
+        assert mock_manager.needs_restart
 
         assert mock_manager.mysql_unix_port == "/var/snap/mysql/common/run/mysql/mysql.sock"
         assert "MYSQL_UNIX_PORT" in env
@@ -365,3 +405,17 @@ class TestSlurmdbdManager:
 
         assert mock_manager.mysql_unix_port is None
         assert "MYSQL_UNIX_PORT" not in env
+
+    def test_restart_pending(self, mock_manager, fs: FakeFilesystem) -> None:
+        """Test that a restart that did not complete is still required by later hooks."""
+        fs.create_dir("/etc/slurm")
+        assert not mock_manager.needs_restart
+
+        mock_manager.restart_pending = True
+        mock_manager = SlurmdbdManager()
+        assert mock_manager.restart_pending
+        assert mock_manager.needs_restart
+        assert "slurmdbd.conf.pending" not in mock_manager.config.includes
+
+        mock_manager.restart_pending = False
+        assert not SlurmdbdManager().needs_restart
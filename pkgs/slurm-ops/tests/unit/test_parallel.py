@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the `slurm_ops.core.parallel` module."""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+from slurm_ops import ServiceGroup, ServiceGroupError, SlurmOpsError
+from slurm_ops.core import CoalescingServiceManager, RestartAction, RestartCoordinator
+
+
+def test_concurrent() -> None:
+    """Test that operations on every service in a group run at the same time."""
+    barrier = threading.Barrier(2, timeout=5)
+    slurmctld, exporter = Mock(), Mock()
+    # Each restart only returns once both restarts are running.
+    slurmctld.restart.side_effect = barrier.wait
+    exporter.restart.side_effect = barrier.wait
+
+    ServiceGroup({"slurmctld": slurmctld, "exporter": exporter}).restart()
+
+    slurmctld.restart.assert_called_once()
+    exporter.restart.assert_called_once()
+
+
+def test_errors() -> None:
+    """Test that a failed operation does not stop the others and that errors are aggregated."""
+    slurmctld, exporter = Mock(), Mock()
+    slurmctld.stop.side_effect = SlurmOpsError("stop failed")
+
+    with pytest.raises(ServiceGroupError) as exec_info:
+        ServiceGroup({"slurmctld": slurmctld, "exporter": exporter}).stop()
+
+    assert list(exec_info.value.errors) == ["slurmctld"]
+    assert exec_info.value.message == (
+        "failed to run operation on slurmctld. reason: slurmctld: stop failed"
+    )
+    exporter.stop.assert_called_once()
+
+
+def test_timeout() -> None:
+    """Test that operations that take longer than the timeout are reported as failed."""
+    release = threading.Event()
+    slurmctld, exporter = Mock(), Mock()
+    slurmctld.start.side_effect = lambda: release.wait(5)
+
+    try:
+        with pytest.raises(ServiceGroupError) as exec_info:
+            ServiceGroup({"slurmctld": slurmctld, "exporter": exporter}, timeout=0.1).start()
+    finally:
+        release.set()
+
+    assert isinstance(exec_info.value.errors["slurmctld"], TimeoutError)
+
+
+def test_is_active() -> None:
+    """Test the `is_active` method."""
+    slurmctld, exporter = Mock(), Mock()
+    slurmctld.is_active.return_value = True
+    exporter.is_active.return_value = False
+    services = ServiceGroup({"slurmctld": slurmctld, "exporter": exporter})
+
+    assert not services.is_active()
+    exporter.is_active.return_value = True
+    assert services.is_active()
+
+
+def test_parallel_flush() -> None:
+    """Test that pending restarts can be flushed at the same time."""
+    coordinator = RestartCoordinator()
+    barrier = threading.Barrier(2, timeout=5)
+    managers = []
+    for name in ["slurmctld", "prometheus-slurm-exporter"]:
+        service = Mock()
+        service.restart.side_effect = barrier.wait
+        manager = CoalescingServiceManager(name, service, reload=Mock(), coordinator=coordinator)
+        manager.request_restart()
+        managers.append(manager)
+
+    assert coordinator.flush(parallel=True) == {
+        "slurmctld": RestartAction.RESTART,
+        "prometheus-slurm-exporter": RestartAction.RESTART,
+    }
+    assert coordinator.pending == {}
+    for manager in managers:
+        manager._service.restart.assert_called_once()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the partition catalog."""
+
+import json
+from pathlib import Path
+from unittest.mock import PropertyMock
+
+import pytest
+from constants import EXAMPLE_SLURM_CONFIG, FAKE_GROUP, FAKE_USER
+from pyfakefs.fake_filesystem import FakeFilesystem
+from pytest_mock import MockerFixture
+from slurm_ops import PartitionInfo, SlurmctldManager
+from slurmutils import NodeSet, Partition, SlurmConfigEditor
+
+BATCH_CONFIG = """\
+nodeset=batch feature=batch
+partitionname=batch nodes=batch default=True
+"""
+
+
+@pytest.fixture
+def slurmctld(fs: FakeFilesystem, mocker: MockerFixture) -> SlurmctldManager:
+    """Request a `SlurmctldManager` with an existing partition include file."""
+    mocker.patch.object(SlurmctldManager, "user", new=PropertyMock(return_value=FAKE_USER))
+    mocker.patch.object(SlurmctldManager, "group", new=PropertyMock(return_value=FAKE_GROUP))
+    fs.create_file("/etc/slurm/slurm.conf", contents=EXAMPLE_SLURM_CONFIG)
+    fs.create_file("/etc/slurm/slurm.conf.batch", contents=BATCH_CONFIG)
+    return SlurmctldManager()
+
+
+def test_catalog_rebuild(slurmctld) -> None:
+    """Test that a missing catalog is built from the existing include files."""
+    assert slurmctld.get_default_partition() == "batch"
+    assert "batch" in slurmctld.partitions
+    assert "debug" not in slurmctld.partitions
+    assert slurmctld.partitions.get("batch") == PartitionInfo(
+        include="slurm.conf.batch",
+        nodeset="batch",
+        default=True,
+        digest=slurmctld.config.includes["slurm.conf.batch"].digest(),
+    )
+    assert json.loads(Path("/etc/slurm/.slurm-partitions.json").read_text())["default"] == "batch"
+
+
+def test_catalog_update(slurmctld, mocker: MockerFixture) -> None:
+    """Test that the catalog is updated when include files are written through the manager."""
+    assert slurmctld.get_default_partition() == "batch"
+
+    # Check that later queries do not parse any include files.
+    spy = mocker.spy(SlurmConfigEditor, "loads")
+
+    with slurmctld.config.transaction() as tx:
+        config = tx.includes["slurm.conf.debug"]
+        config.nodesets["debug"] = NodeSet(nodeset="debug", feature="debug")
+        config.partitions["debug"] = Partition(partitionname="debug", nodes=["debug"])
+
+    with slurmctld.config.includes["slurm.conf.batch"].edit() as config:
+        config.partitions["batch"].default = False
+
+    assert spy.call_count == 2
+    assert slurmctld.get_default_partition() == ""
+    assert slurmctld.partitions.get("debug").include == "slurm.conf.debug"
+    assert slurmctld.partitions.get("debug").nodeset == "debug"
+    assert spy.call_count == 2
+
+    slurmctld.config.includes["slurm.conf.debug"].delete()
+    assert "debug" not in slurmctld.partitions
+
+    # Check that a new manager reads the updated catalog from disk.
+    slurmctld = SlurmctldManager()
+    spy.reset_mock()
+    assert "batch" in slurmctld.partitions
+    assert "debug" not in slurmctld.partitions
+    assert spy.call_count == 0
+
+
+def test_catalog_stale(slurmctld, fs: FakeFilesystem) -> None:
+    """Test that the catalog is rebuilt if include files are added outside the manager."""
+    assert slurmctld.get_default_partition() == "batch"
+
+    fs.create_file("/etc/slurm/slurm.conf.debug", contents="partitionname=debug\n")
+
+    slurmctld = SlurmctldManager()
+    assert "debug" in slurmctld.partitions
+
+
+def test_catalog_edited(slurmctld) -> None:
+    """Test that include files edited outside the manager are indexed again."""
+    assert slurmctld.get_default_partition() == "batch"
+
+    # Simulate another `slurmctld` unit changing the default partition.
+    Path("/etc/slurm/slurm.conf.batch").write_text(BATCH_CONFIG.replace("True", "False"))
+
+    slurmctld = SlurmctldManager()
+    assert slurmctld.get_default_partition() == ""
+    assert slurmctld.partitions.get("batch").digest == (
+        slurmctld.config.includes["slurm.conf.batch"].digest()
+    )
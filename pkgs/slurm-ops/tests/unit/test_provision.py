@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the `slurm_ops.core.provision` module."""
+
+import os
+import threading
+import time
+from subprocess import CalledProcessError
+from unittest.mock import Mock
+
+import pytest
+from hpc_libs.machine import apt
+from pyfakefs.fake_filesystem import FakeFilesystem
+from pytest_mock import MockerFixture
+from slurm_ops import ProvisioningPlan, SlurmOpsError
+from slurm_ops.core import index_age
+
+STAMP = "/var/lib/apt/periodic/update-success-stamp"
+
+
+@pytest.fixture
+def mock_apt(mocker: MockerFixture, mock_run) -> tuple[Mock, Mock]:
+    """Mock `apt update` and `apt-get install`."""
+    return mocker.patch.object(apt, "update"), mock_run
+
+
+def test_index_age(fs: FakeFilesystem) -> None:
+    """Test that the age of the package index accounts for changed package sources."""
+    assert index_age() is None
+
+    fs.create_file("/etc/apt/sources.list.d/ubuntu.sources")
+    stamp = fs.create_file(STAMP)
+    os.utime(stamp.path, (time.time() - 60, time.time() - 60))
+    os.utime("/etc/apt/sources.list.d/ubuntu.sources", (time.time() - 120, time.time() - 120))
+    assert 55 < index_age() < 65
+
+    # A repository added after the last update makes the package index stale.
+    fs.create_file("/etc/apt/sources.list.d/ubuntu-hpc.list")
+    assert index_age() is None
+
+
+def test_single_transaction(fs: FakeFilesystem, mock_apt) -> None:
+    """Test that the packages of every phase are installed at once, in order."""
+    mock_update, mock_install = mock_apt
+    calls = []
+    plan = ProvisioningPlan()
+    plan.add("slurmd", ["slurmd", "slurm-client"], setup=lambda: calls.append("slurmd"))
+    plan.add("nhc", ["make"], setup=lambda: calls.append("nhc"))
+    plan.add("rdma", ["rdma-core", "slurm-client"])
+    plan.add("gpu", lambda: calls.append("detect") or ["nvidia-headless-no-dkms-535-server"])
+
+    timings = plan.apply()
+
+    mock_update.assert_called_once()
+    mock_install.assert_called_once()
+    assert mock_install.call_args[0][0] == [
+        "apt-get",
+        "--yes",
+        "install",
+        "slurmd",
+        "slurm-client",
+        "make",
+        "rdma-core",
+        "nvidia-headless-no-dkms-535-server",
+    ]
+    assert mock_install.call_args[1]["env"]["DEBIAN_FRONTEND"] == "noninteractive"
+    assert calls[0] == "detect"
+    assert sorted(calls[1:]) == ["nhc", "slurmd"]
+    assert timings.keys() == {"update", "gpu-packages", "install", "slurmd", "nhc"}
+    assert plan.timings == timings
+
+
+def test_independent_phases(fs: FakeFilesystem, mock_apt) -> None:
+    """Test that setup steps that do not need packages run alongside the install."""
+    mock_update, mock_install = mock_apt
+    barrier = threading.Barrier(2, timeout=5)
+    # The update only finishes once the `nhc` setup step is running, and vice versa.
+    mock_update.side_effect = barrier.wait
+    running = []
+    plan = ProvisioningPlan()
+    plan.add("slurmd", ["slurmd"], setup=Mock())
+    plan.add("nhc", setup=barrier.wait)
+
+    plan.apply(on_change=running.append)
+
+    mock_install.assert_called_once()
+    assert running[0] == ["update", "nhc"]
+    assert ["slurmd"] in running
+
+
+def test_dpkg_lock(fs: FakeFilesystem, mock_apt) -> None:
+    """Test that setup steps that take the dpkg lock never run alongside the install."""
+    _, mock_install = mock_apt
+    running = []
+    overlaps = []
+
+    def hold(name: str):
+        def run(*_, **__) -> None:
+            overlaps.extend(running)
+            running.append(name)
+            time.sleep(0.1)
+            running.remove(name)
+
+        return run
+
+    mock_install.side_effect = hold("install")
+    plan = ProvisioningPlan()
+    plan.add("slurmd", ["slurmd"])
+    plan.add("snap", setup=hold("snap"), dpkg_lock=True)
+
+    plan.apply()
+
+    mock_install.assert_called_once()
+    assert overlaps == []
+
+
+def test_fresh_index(fs: FakeFilesystem, mock_apt) -> None:
+    """Test that the package index is only updated if it is older than `max_index_age`."""
+    mock_update, _ = mock_apt
+    fs.create_file(STAMP)
+
+    assert ProvisioningPlan().update_index() is False
+    mock_update.assert_not_called()
+
+    os.utime(STAMP, (time.time() - 600, time.time() - 600))
+    assert ProvisioningPlan(max_index_age=300).update_index() is True
+    mock_update.assert_called_once()
+
+    # A successful update is recorded, so the next plan skips the update.
+    assert ProvisioningPlan(max_index_age=300).update_index() is False
+    mock_update.assert_called_once()
+
+
+def test_errors(fs: FakeFilesystem, mock_apt) -> None:
+    """Test that `apt` errors are raised as `SlurmOpsError`."""
+    mock_update, mock_install = mock_apt
+    plan = ProvisioningPlan()
+    plan.add("slurmd", ["slurmd"])
+    plan.add("nhc", ["make"])
+
+    mock_update.side_effect = CalledProcessError(returncode=100, cmd=["apt-get", "update"])
+    with pytest.raises(SlurmOpsError) as exec_info:
+        plan.apply()
+
+    assert exec_info.value.message.startswith("failed to update apt package index")
+    mock_install.assert_not_called()
+
+    mock_update.side_effect = None
+    mock_install.side_effect = CalledProcessError(
+        returncode=100, cmd=["apt-get"], stderr="E: Unable to locate package make"
+    )
+    with pytest.raises(SlurmOpsError) as exec_info:
+        plan.apply()
+
+    assert exec_info.value.message == (
+        "failed to install packages for slurmd, nhc. reason: E: Unable to locate package make"
+    )
+
+
+def test_nothing_to_install(fs: FakeFilesystem, mock_apt) -> None:
+    """Test that a plan without packages does not touch `apt`."""
+    mock_update, mock_install = mock_apt
+    fs.create_file(STAMP)
+    setup = Mock()
+    plan = ProvisioningPlan()
+    plan.add("slurm", setup=setup)
+
+    plan.apply()
+
+    mock_update.assert_not_called()
+    mock_install.assert_not_called()
+    setup.assert_called_once()
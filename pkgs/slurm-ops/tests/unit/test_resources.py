@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the `slurm_ops.core.resources` module."""
+
+import pytest
+from slurm_ops import ResourceProfile
+
+
+class TestResourceProfile:
+    """Unit tests for the `ResourceProfile` class."""
+
+    def test_from_str(self) -> None:
+        """Test the `from_str` method."""
+        profile = ResourceProfile.from_str(
+            "slice=slurm.slice cpus=0-7,64-71 memory-low=8G io-weight=500 nice=-5"
+        )
+
+        assert profile == ResourceProfile(
+            slice="slurm.slice", cpus="0-7,64-71", memory_low="8G", io_weight=500, nice=-5
+        )
+        assert profile
+        assert not ResourceProfile.from_str("")
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "cpu=0-7",
+            "slice",
+            "slice=slurm",
+            "cpus=0-7;8",
+            "memory-low=lots",
+            "io-weight=high",
+            "io-weight=0",
+            "nice=20",
+        ],
+    )
+    def test_from_str_invalid(self, value) -> None:
+        """Test that invalid resource profiles are rejected."""
+        with pytest.raises(ValueError):
+            ResourceProfile.from_str(value)
+
+    def test_sections(self) -> None:
+        """Test that unset resource controls are omitted from the drop-in sections."""
+        sections = ResourceProfile(memory_low="10%").sections()
+
+        assert {k: v for k, v in sections["Service"].items() if v is not None} == {
+            "MemoryLow": "10%"
+        }
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the `slurm_ops.core.restarts` module."""
+
+from unittest.mock import Mock
+
+import pytest
+from slurm_ops.core import CoalescingServiceManager, RestartAction, RestartCoordinator
+
+
+@pytest.fixture
+def coordinator() -> RestartCoordinator:
+    """Request an empty restart coordinator."""
+    return RestartCoordinator()
+
+
+def _manager(name: str, coordinator: RestartCoordinator) -> CoalescingServiceManager:
+    """Create a coalescing service manager around a mocked service manager."""
+    return CoalescingServiceManager(name, Mock(), reload=Mock(), coordinator=coordinator)
+
+
+def test_merge(coordinator) -> None:
+    """Test that a restart wins over a reload, and that each service is acted on once."""
+    slurmctld = _manager("slurmctld", coordinator)
+    exporter = _manager("prometheus-slurm-exporter", coordinator)
+
+    slurmctld.request_reload()
+    slurmctld.request_restart()
+    slurmctld.request_reload()
+    exporter.request_reload()
+    assert coordinator.pending == {
+        "slurmctld": RestartAction.RESTART,
+        "prometheus-slurm-exporter": RestartAction.RELOAD,
+    }
+
+    assert coordinator.flush() == {
+        "slurmctld": RestartAction.RESTART,
+        "prometheus-slurm-exporter": RestartAction.RELOAD,
+    }
+    slurmctld._service.restart.assert_called_once()
+    slurmctld._reload.assert_not_called()
+    exporter._service.restart.assert_not_called()
+    exporter._reload.assert_called_once()
+
+    assert coordinator.flush() == {}
+
+
+def test_immediate_restart(coordinator) -> None:
+    """Test that an immediate restart satisfies a pending request."""
+    slurmctld = _manager("slurmctld", coordinator)
+
+    slurmctld.request_restart()
+    slurmctld.restart()
+    assert coordinator.flush() == {}
+    slurmctld._service.restart.assert_called_once()
+
+
+def test_stop(coordinator) -> None:
+    """Test that stopping a service drops its pending action."""
+    slurmctld = _manager("slurmctld", coordinator)
+
+    slurmctld.request_restart()
+    slurmctld.stop()
+    assert coordinator.flush() == {}
+    slurmctld._service.restart.assert_not_called()
+
+
+def test_failed_flush(coordinator) -> None:
+    """Test that a failed action is not retried."""
+    slurmctld = _manager("slurmctld", coordinator)
+    slurmctld._service.restart.side_effect = RuntimeError("restart failed")
+
+    slurmctld.request_restart()
+    with pytest.raises(RuntimeError):
+        coordinator.flush()
+
+    assert coordinator.pending == {}
+
+    # Check that the failed action can be requested again by name, e.g. in the next hook.
+    slurmctld._service.restart.side_effect = None
+    coordinator.request("slurmctld", RestartAction.RESTART)
+    assert coordinator.flush() == {"slurmctld": RestartAction.RESTART}
+    with pytest.raises(KeyError):
+        coordinator.request("slurmd", RestartAction.RESTART)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the sandboxed `slurm_ops` backend."""
+
+from pathlib import Path
+
+import pytest
+from slurm_ops import (
+    ResourceProfile,
+    Sandbox,
+    SlurmctldManager,
+    SlurmdManager,
+    SlurmOpsError,
+)
+from slurmutils import SlurmConfig
+
+
+@pytest.fixture
+def sandbox(tmp_path: Path) -> Sandbox:
+    """Request a sandboxed machine rooted in a temporary directory."""
+    return Sandbox(tmp_path, version="25.05.0")
+
+
+def test_slurmctld(sandbox, mock_run) -> None:
+    """Test a `slurmctld` install and start flow in a sandbox."""
+    slurmctld = SlurmctldManager(sandbox=sandbox)
+    assert not slurmctld.is_installed()
+    with pytest.raises(SlurmOpsError):
+        slurmctld.version()
+
+    slurmctld.install()
+    slurmctld.key.generate()
+    slurmctld.jwt.generate()
+    slurmctld.config.dump(SlurmConfig(clustername="sandbox", slurmctldhost=["ctl-0"]))
+    slurmctld.set_resources(ResourceProfile(cpus="0-3"))
+    slurmctld.service.enable()
+    slurmctld.service.request_restart()
+    slurmctld.restarts.flush()
+
+    assert slurmctld.version() == "25.05.0"
+    assert slurmctld.config.path == sandbox.root / "etc/slurm/slurm.conf"
+    assert slurmctld.config.load().cluster_name == "sandbox"
+    assert (sandbox.root / "etc/slurm/slurm.key").exists()
+    assert (sandbox.root / "etc/systemd/system/slurmctld.service.d/20-resources.conf").exists()
+    assert sandbox.daemon_reloads == 1
+    assert sandbox.service("slurmctld").calls == ["enable", "restart"]
+    assert slurmctld.service.is_active()
+    mock_run.assert_not_called()
+
+
+def test_slurmd(sandbox, mock_run) -> None:
+    """Test that `slurmd` options are stored in the sandbox."""
+    slurmd = SlurmdManager(sandbox=sandbox)
+    slurmd.install()
+
+    with slurmd.options() as options:
+        options.conf_server = ["10.0.0.1:6817"]
+        options.dynamic = True
+
+    assert SlurmdManager(sandbox=sandbox).conf_server == ["10.0.0.1:6817"]
+    assert "SLURMD_OPTIONS" in (sandbox.root / "etc/default/slurmd").read_text()
+    mock_run.assert_not_called()
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the `slurm_ops.core.snapd` module."""
+
+import json
+import socketserver
+import tempfile
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from pytest_mock import MockerFixture
+from slurm_ops import SlurmdManager, SlurmOpsError
+from slurm_ops.core import SnapdClient, SnapdServiceManager
+
+
+class FakeSnapd(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Fake snapd REST API served on a local UNIX domain socket.
+
+    Implements the subset of the snapd REST API used by `SnapdClient`. Every request is
+    recorded in `requests`, and every accepted connection is counted in `connections`.
+    The connection is closed without a response to the next POST request if `drop_post`
+    is set.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path: Path) -> None:
+        self.snaps: dict[str, dict[str, Any]] = {}
+        self.apps: dict[str, dict[str, Any]] = {}
+        self.requests: list[tuple[str, str, Any]] = []
+        self.connections = 0
+        self.failing: set[str] = set()
+        self.drop_post = False
+        self._changes: dict[str, dict[str, Any]] = {}
+        super().__init__(str(path), _FakeSnapdHandler)
+
+    def handle(self, method: str, path: str, body: Any) -> dict[str, Any]:
+        """Handle a snapd API request."""
+        self.requests.append((method, path, body))
+        url = urlparse(path)
+        match method, url.path.split("/")[1:]:
+            case "GET", ["v2", "snaps", name]:
+                if name not in self.snaps:
+                    return _error(404, "snap not installed", "snap-not-found")
+                return _sync(self.snaps[name])
+            case "GET", ["v2", "apps"]:
+                names = parse_qs(url.query)["names"][0].split(",")
+                return _sync([self.apps[name] for name in names if name in self.apps])
+            case "POST", ["v2", "apps"]:
+                change = str(len(self._changes) + 1)
+                status = "Done"
+                for name in body["names"]:
+                    if name in self.failing:
+                        status = "Error"
+                    elif name in self.apps:
+                        self.apps[name]["active"] = body["action"] != "stop"
+                        if body.get("enable"):
+                            self.apps[name]["enabled"] = True
+                        if body.get("disable"):
+                            self.apps[name]["enabled"] = False
+                self._changes[change] = {"ready": True, "status": status, "err": "failed"}
+                return {"type": "async", "status-code": 202, "change": change}
+            case "GET", ["v2", "changes", change]:
+                return _sync(self._changes[change])
+            case _:
+                return _error(404, "not found", "")
+
+
+class _FakeSnapdHandler(BaseHTTPRequestHandler):
+    """Request handler for `FakeSnapd`."""
+
+    protocol_version = "HTTP/1.1"
+    server: FakeSnapd
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.connections += 1
+
+    def do_GET(self) -> None:  # noqa N802
+        self._respond(self.server.handle("GET", self.path, None))
+
+    def do_POST(self) -> None:  # noqa N802
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        response = self.server.handle("POST", self.path, body)
+        if self.server.drop_post:
+            self.server.drop_post = False
+            self.close_connection = True
+            return
+
+        self._respond(response)
+
+    def _respond(self, response: dict[str, Any]) -> None:
+        content = json.dumps(response).encode()
+        self.send_response(response["status-code"])
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *_: Any) -> None:
+        pass
+
+
+def _sync(result: Any) -> dict[str, Any]:
+    return {"type": "sync", "status-code": 200, "result": result}
+
+
+def _error(code: int, message: str, kind: str) -> dict[str, Any]:
+    return {"type": "error", "status-code": code, "result": {"message": message, "kind": kind}}
+
+
+@pytest.fixture
+def snapd() -> Iterator[FakeSnapd]:
+    """Request a fake snapd server with the `slurm` snap installed."""
+    # Use a short path as UNIX domain socket paths are limited to 108 characters.
+    with tempfile.TemporaryDirectory() as tmp:
+        server = FakeSnapd(Path(tmp) / "snapd.socket")
+        server.snaps["slurm"] = {"name": "slurm", "version": "23.11.7", "revision": "x1"}
+        server.apps["slurm.slurmd"] = {
+            "snap": "slurm",
+            "name": "slurmd",
+            "daemon": "simple",
+            "enabled": False,
+            "active": False,
+        }
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def client(snapd) -> Iterator[SnapdClient]:
+    """Request a snapd client connected to the fake snapd server."""
+    client = SnapdClient(snapd.server_address, poll_interval=0)
+    yield client
+    client.close()
+
+
+class TestSnapdClient:
+    """Unit tests for the `SnapdClient` class."""
+
+    def test_snap(self, client, snapd) -> None:
+        """Test the `snap` method."""
+        assert client.snap("slurm")["version"] == "23.11.7"
+        assert client.snap("missing") is None
+
+    def test_connection_reused(self, client, snapd) -> None:
+        """Test that several requests share one connection."""
+        for _ in range(3):
+            client.snap("slurm")
+            client.services("slurm.slurmd")
+
+        assert snapd.connections == 1
+
+    def test_reconnect(self, client, snapd) -> None:
+        """Test that the client reconnects if the kept-alive connection was closed."""
+        client.snap("slurm")
+        client._conn.sock.close()
+
+        assert client.snap("slurm")["version"] == "23.11.7"
+        assert snapd.connections == 2
+
+    def test_no_retry_after_send(self, client, snapd) -> None:
+        """Test that a POST request is not sent again if its response was lost."""
+        snapd.drop_post = True
+        with pytest.raises(SlurmOpsError):
+            client.service_action("start", "slurm.slurmd")
+
+        assert [r for r in snapd.requests if r[0] == "POST"] == [
+            ("POST", "/v2/apps", {"action": "start", "names": ["slurm.slurmd"]})
+        ]
+
+    def test_unreachable(self) -> None:
+        """Test that an unreachable snapd raises a `SlurmOpsError`."""
+        with pytest.raises(SlurmOpsError):
+            SnapdClient("/nonexistent/snapd.socket").snap("slurm")
+
+
+class TestSnapdServiceManager:
+    """Unit tests for the `SnapdServiceManager` class."""
+
+    def test_service(self, client, snapd) -> None:
+        """Test that service operations go through snapd."""
+        service = SnapdServiceManager("slurmd", client, snap="slurm")
+
+        service.enable()
+        assert service.is_active()
+        assert snapd.apps["slurm.slurmd"]["enabled"]
+
+        service.restart()
+        service.disable()
+        assert not service.is_active()
+        assert not snapd.apps["slurm.slurmd"]["enabled"]
+
+        assert [b["action"] for m, _, b in snapd.requests if m == "POST"] == [
+            "start",
+            "restart",
+            "stop",
+        ]
+
+    def test_failed_change(self, client, snapd) -> None:
+        """Test that a failed snapd change raises a `SlurmOpsError`."""
+        snapd.failing.add("slurm.slurmd")
+
+        with pytest.raises(SlurmOpsError):
+            SnapdServiceManager("slurmd", client, snap="slurm").start()
+
+
+def test_snap_manager(mocker: MockerFixture, client, mock_run) -> None:
+    """Test that the snap backend does not fork `snap` when snapd is reachable."""
+    mocker.patch("slurm_ops.core.base._snapd", client)
+    manager = SlurmdManager(snap=True)
+
+    assert manager.service.is_active() is False
+    assert manager._ops_manager._version() == "23.11.7"
+    mock_run.assert_not_called()
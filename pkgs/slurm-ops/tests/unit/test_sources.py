@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the `slurm_ops.core.sources` module."""
+
+import hashlib
+import tarfile
+from pathlib import Path
+from subprocess import CompletedProcess
+
+import pytest
+from hpc_libs.machine import apt
+from pytest_mock import MockerFixture
+from slurm_ops import InstallSource, ProvisioningPlan, SlurmOpsError
+
+DEBS = {"slurmd_23.11.7_amd64.deb": b"slurmd", "slurm-client_23.11.7_amd64.deb": b"client"}
+KEY = """-----BEGIN PGP PUBLIC KEY BLOCK-----
+
+mQINBGVsbHVybQ==
+-----END PGP PUBLIC KEY BLOCK-----
+"""
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """Request a local directory of pre-fetched packages."""
+    repo = tmp_path / "debs"
+    repo.mkdir()
+    for name, content in DEBS.items():
+        (repo / name).write_bytes(content)
+
+    (repo / "SHA256SUMS").write_text(
+        "".join(f"{hashlib.sha256(c).hexdigest()}  {n}\n" for n, c in DEBS.items())
+    )
+    return repo
+
+
+@pytest.fixture
+def source_list(tmp_path: Path, mocker: MockerFixture) -> Path:
+    """Write the install source to a temporary `apt` source list."""
+    target = tmp_path / "slurm-ops-install-source.list"
+    mocker.patch("slurm_ops.core.sources.SOURCE_LIST", target)
+    mocker.patch("slurm_ops.core.sources.KEYRING", tmp_path / "keyrings" / "install-source.asc")
+    return target
+
+
+@pytest.fixture
+def mock_dpkg_deb(mock_run):
+    """Mock `dpkg-deb --field` output for the pre-fetched packages."""
+    mock_run.return_value = CompletedProcess(
+        [], returncode=0, stdout="Package: slurmd\nVersion: 23.11.7\nArchitecture: amd64\n"
+    )
+    return mock_run
+
+
+def test_from_str() -> None:
+    """Test parsing install sources from charm configuration."""
+    source = InstallSource.from_str("http://mirror.internal/ubuntu-hpc noble main", key=KEY)
+    assert source == InstallSource(
+        "http://mirror.internal/ubuntu-hpc", "noble", ("main",), key=KEY
+    )
+    assert str(source) == (
+        "deb [signed-by=/etc/apt/keyrings/slurm-ops-install-source.asc] "
+        + "http://mirror.internal/ubuntu-hpc noble main"
+    )
+
+    source = InstallSource.from_str("file:///srv/slurm-debs", key=KEY)
+    assert str(source) == (
+        "deb [signed-by=/etc/apt/keyrings/slurm-ops-install-source.asc] "
+        + "file:///srv/slurm-debs ./"
+    )
+
+    with pytest.raises(ValueError):
+        InstallSource.from_str("ppa:ubuntu-hpc/experimental", key=KEY)
+
+    with pytest.raises(ValueError):
+        InstallSource.from_str("http://mirror.internal/ubuntu-hpc noble", key=KEY)
+
+    # Check that only repositories verified by `from_debs` are trusted without a signing key.
+    with pytest.raises(ValueError):
+        InstallSource.from_str("https://mirror.internal/ubuntu-hpc noble main", key="")
+
+    with pytest.raises(ValueError):
+        InstallSource("https://mirror.internal/ubuntu-hpc/", verified=True)
+
+
+def test_from_debs(repo, mock_dpkg_deb) -> None:
+    """Test creating a flat install source from a directory of pre-fetched packages."""
+    source = InstallSource.from_debs(repo)
+
+    assert source.uri == repo.as_uri()
+    assert source.verified
+    assert str(source) == f"deb [trusted=yes] {repo.as_uri()} ./"
+    index = (repo / "Packages").read_text()
+    for name, content in DEBS.items():
+        assert f"Filename: ./{name}\n" in index
+        assert f"SHA256: {hashlib.sha256(content).hexdigest()}\n" in index
+
+    assert mock_dpkg_deb.call_args[0][0][:2] == ["dpkg-deb", "--field"]
+
+
+def test_from_debs_archive(repo, tmp_path, mocker: MockerFixture, mock_dpkg_deb) -> None:
+    """Test creating a flat install source from an archive of pre-fetched packages."""
+    target = tmp_path / "extracted"
+    mocker.patch("slurm_ops.core.sources.DEBS_DIR", target)
+    archive = tmp_path / "slurm-debs.tar.gz"
+    with tarfile.open(archive, "w:gz") as tar:
+        tar.add(repo, arcname="slurm-debs")
+
+    source = InstallSource.from_debs(archive)
+
+    assert source.uri == (target / "slurm-debs").as_uri()
+    assert (target / "slurm-debs" / "Packages").exists()
+
+
+def test_from_debs_verify(repo, mock_dpkg_deb) -> None:
+    """Test that pre-fetched packages are verified against `SHA256SUMS`."""
+    (repo / "slurmd_23.11.7_amd64.deb").write_bytes(b"tampered")
+    with pytest.raises(SlurmOpsError) as exec_info:
+        InstallSource.from_debs(repo)
+
+    assert exec_info.value.message.startswith(
+        "checksum mismatch for package 'slurmd_23.11.7_amd64.deb'"
+    )
+
+    (repo / "slurmd_23.11.7_amd64.deb").write_bytes(DEBS["slurmd_23.11.7_amd64.deb"])
+    (repo / "munge_0.5.15_amd64.deb").write_bytes(b"munge")
+    with pytest.raises(SlurmOpsError) as exec_info:
+        InstallSource.from_debs(repo)
+
+    assert "['munge_0.5.15_amd64.deb'] are not listed" in exec_info.value.message
+
+    (repo / "SHA256SUMS").unlink()
+    with pytest.raises(SlurmOpsError) as exec_info:
+        InstallSource.from_debs(repo)
+
+    assert exec_info.value.message == f"'{repo}' does not contain a SHA256SUMS file"
+    assert not (repo / "Packages").exists()
+
+
+def test_plan(repo, source_list, mocker: MockerFixture, mock_dpkg_deb) -> None:
+    """Test that a plan with an install source only updates the index of the source."""
+    mock_update = mocker.patch.object(apt, "update")
+    source = InstallSource.from_debs(repo)
+    plan = ProvisioningPlan(source=source)
+    plan.add("slurmd", ["slurmd", "slurm-client"])
+
+    plan.apply()
+
+    mock_update.assert_not_called()
+    assert source_list.read_text() == f"{source}\n"
+    update, install = (c[0][0] for c in mock_dpkg_deb.call_args_list[-2:])
+    assert update == [
+        "apt-get",
+        "update",
+        "-o",
+        f"Dir::Etc::SourceList={source_list}",
+        "-o",
+        "Dir::Etc::SourceParts=-",
+        "-o",
+        "APT::Get::List-Cleanup=0",
+    ]
+    assert install == ["apt-get", "--yes", "install", "slurmd", "slurm-client"]
+
+    # Installing from the PPA again removes the install source.
+    mocker.patch("slurm_ops.core.provision.index_age", return_value=0.0)
+    ProvisioningPlan().update_index()
+    assert not source_list.exists()
+
+
+def test_configure_key(source_list, tmp_path) -> None:
+    """Test that the signing key of an install source is written for `apt`."""
+    keyring = tmp_path / "keyrings" / "install-source.asc"
+    source = InstallSource.from_str("https://mirror.internal/ubuntu-hpc noble main", key=KEY)
+    source.configure()
+
+    assert keyring.read_text() == KEY
+    assert source_list.read_text() == f"{source}\n"
+
+    InstallSource.clear()
+    assert not keyring.exists()
+    assert not source_list.exists()
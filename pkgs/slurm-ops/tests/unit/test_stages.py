@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the `slurm_ops.core.stages` module."""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+from slurm_ops import SlurmOpsError
+from slurm_ops.core import StagedExecutor
+
+
+def test_concurrent() -> None:
+    """Test that independent steps run at the same time."""
+    barrier = threading.Barrier(2, timeout=5)
+    executor = StagedExecutor()
+    # Each step only returns once both steps are running.
+    executor.add("nhc", barrier.wait)
+    executor.add("gpu", barrier.wait)
+
+    timings = executor.run()
+
+    assert timings.keys() == {"nhc", "gpu"}
+
+
+def test_dependencies() -> None:
+    """Test that steps only start once the steps they depend on have finished."""
+    order = []
+    executor = StagedExecutor()
+    executor.add("setup", lambda: order.append("setup"), after=["install"])
+    executor.add("install", lambda: order.append("install"), after=["update"])
+    executor.add("update", lambda: order.append("update"))
+
+    executor.run()
+
+    assert order == ["update", "install", "setup"]
+
+
+def test_dpkg_lock() -> None:
+    """Test that steps that take the dpkg lock never run at the same time."""
+    lock = threading.Lock()
+    overlaps = []
+
+    def step() -> None:
+        if not lock.acquire(blocking=False):
+            overlaps.append(threading.current_thread().name)
+            return
+
+        time.sleep(0.01)
+        lock.release()
+
+    running = []
+    executor = StagedExecutor()
+    for name in ["update", "install", "drivers"]:
+        executor.add(name, step, dpkg_lock=True)
+
+    executor.add("nhc", lambda: time.sleep(0.01))
+
+    executor.run(on_change=running.append)
+
+    assert overlaps == []
+    assert running[0] == ["update", "nhc"]
+    assert all(len(set(names) - {"nhc"}) <= 1 for names in running)
+
+
+def test_errors() -> None:
+    """Test that a failed step stops dependent steps and its error is re-raised."""
+    setup = Mock()
+    nhc = Mock()
+    executor = StagedExecutor()
+    executor.add("install", Mock(side_effect=SlurmOpsError("failed to install packages")))
+    executor.add("setup", setup, after=["install"])
+    executor.add("nhc", nhc)
+
+    with pytest.raises(SlurmOpsError) as exec_info:
+        executor.run()
+
+    assert exec_info.value.message == "failed to install packages"
+    setup.assert_not_called()
+    nhc.assert_called_once()
+
+
+def test_invalid() -> None:
+    """Test that invalid step dependencies are rejected."""
+    executor = StagedExecutor()
+    executor.add("install", Mock(), after=["update"])
+    with pytest.raises(ValueError):
+        executor.add("install", Mock())
+
+    with pytest.raises(ValueError):
+        executor.run()
+
+    executor.add("update", Mock(), after=["install"])
+    with pytest.raises(ValueError):
+        executor.run()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the `slurm_ops.core.systemd` module."""
+
+from collections.abc import Sequence
+from typing import Any
+
+import pytest
+from hpc_libs.errors import SystemdError
+from slurm_ops import SlurmctldManager
+from slurm_ops.core import DBusServiceManager, SystemdBus
+
+
+class FakeSystemdBus(SystemdBus):
+    """Test double for the systemd manager D-Bus API.
+
+    Implements the subset of `org.freedesktop.systemd1.Manager` used by `SystemdBus`
+    in memory. Every method call is recorded in `calls`.
+    """
+
+    def __init__(self, units: dict[str, str] | None = None) -> None:
+        super().__init__()
+        self.units = units if units is not None else {}
+        self.enabled: set[str] = set()
+        self.calls: list[tuple[str, list[Any]]] = []
+        self.failing: set[str] = set()
+        self._jobs: dict[str, str] = {}
+
+    def _call(self, method: str, signature: str = "", body: Sequence[Any] = ()) -> list[Any]:
+        self.calls.append((method, list(body)))
+        match method:
+            case "ListUnitsByNames":
+                return [
+                    [
+                        (unit, "", "loaded", self.units[unit], "", "", "", 0, "", "/")
+                        for unit in body[0]
+                        if unit in self.units
+                    ]
+                ]
+            case "StartUnit" | "RestartUnit" | "StopUnit":
+                unit = body[0]
+                job = f"/org/freedesktop/systemd1/job/{len(self._jobs) + 1}"
+                if unit in self.failing:
+                    self._jobs[job] = "failed"
+                else:
+                    self.units[unit] = "inactive" if method == "StopUnit" else "active"
+                    self._jobs[job] = "done"
+                return [job]
+            case "EnableUnitFiles":
+                self.enabled.update(body[0])
+                return [True, []]
+            case "DisableUnitFiles":
+                self.enabled.difference_update(body[0])
+                return [[]]
+            case "Reload":
+                return []
+            case _:
+                raise SystemdError(f"systemd {method} call failed. reason: unknown method")
+
+    def _wait(self, job: str) -> str:
+        return self._jobs.pop(job)
+
+
+@pytest.fixture
+def bus() -> FakeSystemdBus:
+    """Request a fake systemd D-Bus API."""
+    return FakeSystemdBus({"slurmctld.service": "inactive"})
+
+
+class TestDBusServiceManager:
+    """Unit tests for the `DBusServiceManager` class."""
+
+    def test_jobs(self, bus) -> None:
+        """Test that service jobs are queued and waited on."""
+        service = DBusServiceManager("slurmctld", bus)
+
+        service.start()
+        assert service.is_active()
+
+        service.restart()
+        assert service.is_active()
+
+        service.stop()
+        assert not service.is_active()
+        assert [method for method, _ in bus.calls if method.endswith("Unit")] == [
+            "StartUnit",
+            "RestartUnit",
+            "StopUnit",
+        ]
+
+    def test_failed_job(self, bus) -> None:
+        """Test that failed jobs raise a `SystemdError`."""
+        bus.failing.add("slurmctld.service")
+
+        with pytest.raises(SystemdError):
+            DBusServiceManager("slurmctld", bus).restart()
+
+    def test_enable_disable(self, bus) -> None:
+        """Test that unit files are enabled and disabled, and systemd is reloaded."""
+        service = DBusServiceManager("slurmctld", bus)
+
+        service.enable()
+        assert bus.enabled == {"slurmctld.service"}
+        assert bus.calls[-1] == ("Reload", [])
+
+        service.disable()
+        assert bus.enabled == set()
+        assert bus.calls[-1] == ("Reload", [])
+
+
+def test_active_states(bus) -> None:
+    """Test that the state of several services is read in a single call."""
+    bus.units["prometheus-slurm-exporter.service"] = "active"
+
+    assert bus.active_states(["slurmctld", "prometheus-slurm-exporter", "missing"]) == {
+        "slurmctld": "inactive",
+        "prometheus-slurm-exporter": "active",
+        "missing": "inactive",
+    }
+    assert len(bus.calls) == 1
+
+
+def test_slurm_manager_dbus(mocker, bus, mock_run) -> None:
+    """Test that Slurm managers created with `dbus=True` do not fork `systemctl`."""
+    mocker.patch("slurm_ops.core.base._systemd_bus", bus)
+    manager = SlurmctldManager(dbus=True)
+
+    manager.service.enable()
+    manager.service.restart()
+    manager.exporter.service.stop()
+
+    assert manager.service.is_active()
+    mock_run.assert_not_called()
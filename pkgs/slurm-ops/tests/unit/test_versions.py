@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the `slurm_ops.core.versions` module."""
+
+import os
+from unittest.mock import Mock
+
+import pytest
+from pyfakefs.fake_filesystem import FakeFilesystem
+from slurm_ops import SlurmOpsError
+from slurm_ops.core.versions import VersionCache, dpkg_status_key, snap_revision_key
+
+
+class TestVersionCache:
+    """Unit tests for the `VersionCache` class."""
+
+    @pytest.fixture
+    def cache(self, fs: FakeFilesystem) -> VersionCache:
+        """Request a version cache on a fake filesystem."""
+        return VersionCache("/var/cache/slurm-ops/versions.json")
+
+    def test_get(self, cache) -> None:
+        """Test that a version is only probed again when the cache key changes."""
+        probe = Mock(return_value="23.11.7")
+
+        assert cache.get("slurmd", "1", probe) == "23.11.7"
+        assert cache.get("slurmd", "1", probe) == "23.11.7"
+        # Test that a new cache instance reads the persisted entry.
+        assert VersionCache("/var/cache/slurm-ops/versions.json").get("slurmd", "1", probe)
+        assert probe.call_count == 1
+
+        probe.return_value = "24.05.1"
+        assert cache.get("slurmd", "2", probe) == "24.05.1"
+        assert probe.call_count == 2
+
+    def test_get_not_installed(self, cache) -> None:
+        """Test that failed probes are cached."""
+        probe = Mock(side_effect=SlurmOpsError("slurmd is not installed"))
+
+        for _ in range(2):
+            with pytest.raises(SlurmOpsError) as exec_info:
+                cache.get("slurmd", "1", probe)
+
+            assert exec_info.value.message == "slurmd is not installed"
+
+        assert probe.call_count == 1
+
+    def test_get_without_key(self, cache) -> None:
+        """Test that probes are not cached if there is no cache key."""
+        probe = Mock(return_value="23.11.7")
+
+        cache.get("slurmd", None, probe)
+        cache.get("slurmd", None, probe)
+        assert probe.call_count == 2
+
+    def test_invalidate(self, cache) -> None:
+        """Test the `invalidate` method."""
+        probe = Mock(return_value="23.11.7")
+
+        cache.get("slurmd", "1", probe)
+        cache.invalidate("slurmd")
+        cache.get("slurmd", "1", probe)
+        assert probe.call_count == 2
+
+
+def test_dpkg_status_key(fs: FakeFilesystem) -> None:
+    """Test the `dpkg_status_key` function."""
+    assert dpkg_status_key() is None
+
+    fs.create_file("/var/lib/dpkg/status", contents="Package: slurmd\n")
+    key = dpkg_status_key()
+    assert key is not None
+
+    with open("/var/lib/dpkg/status", "a") as f:
+        f.write("Status: install ok installed\n")
+
+    assert dpkg_status_key() != key
+
+
+def test_snap_revision_key(fs: FakeFilesystem) -> None:
+    """Test the `snap_revision_key` function."""
+    assert snap_revision_key("slurm") is None
+
+    fs.create_dir("/snap/slurm/x1")
+    os.symlink("x1", "/snap/slurm/current")
+    assert snap_revision_key("slurm") == "x1"
@@ -738,6 +738,13 @@ def unit_test_cli(
     uv_run(["coverage", "xml", "-o", "cover/coverage.xml"])
     logger.info(f"XML report generated at {ROOT_DIR}/cover/coverage.xml")
 
+    logger.info("running import benchmarks...")
+    uv_run(
+        ["pytest", "-v", "--tb", "native", str(ROOT_DIR / "tests" / "benchmark")]
+        + [f"--charm={charm.name}" for charm in charms],
+        cwd=ROOT_DIR,
+    )
+
 
 def build_cli(
     charms: Iterable[Charm],
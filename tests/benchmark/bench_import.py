@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark the time taken to import the `charm` module of each charmed operator.
+
+Every hook imports `charm`, so its import time is paid by every hook of every unit.
+
+Usage:
+    python tests/benchmark/bench_import.py [--charm NAME ...] [--top N]
+
+Notes:
+    - Charms must be staged first with `just repo stage`, as the charm libraries are only
+      fetched into the staged charms. `just repo unit` stages the charms and enforces the
+      import budgets with `test_bench_import.py`.
+    - Import times are measured with `python -X importtime` in a fresh interpreter.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+ROOT_DIR = Path(__file__).parents[2]
+BUILD_PATH = ROOT_DIR / "_build"
+
+
+class ImportBudget(NamedTuple):
+    """Import budget of a charm.
+
+    Attributes:
+        lazy_modules: Top-level modules that importing `charm` must not import, as they are
+            only imported by the code that uses them.
+        seconds: Time that importing `charm` may take. Kept loose so that busy CI runners
+            do not flake.
+    """
+
+    lazy_modules: frozenset[str]
+    seconds: float
+
+
+CHARMS = {
+    "sackd": ImportBudget(frozenset({"cryptography", "distro"}), 0.5),
+    "slurmctld": ImportBudget(
+        frozenset({"cryptography", "distro", "influxdb", "netifaces", "requests"}), 1.0
+    ),
+    "slurmd": ImportBudget(
+        frozenset({"UbuntuDrivers", "apt_pkg", "cryptography", "distro", "pynvml"}), 1.0
+    ),
+    "slurmdbd": ImportBudget(frozenset({"cryptography", "distro"}), 1.0),
+    "slurmrestd": ImportBudget(frozenset({"cryptography", "distro"}), 0.5),
+}
+
+
+def _import_charm(charm: str, *args: str) -> subprocess.CompletedProcess[str]:
+    """Import the `charm` module of a staged charm in a fresh interpreter."""
+    path = BUILD_PATH / charm
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        check=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": f"{path}/src:{path}/lib"},
+    )
+
+
+def imported_modules(charm: str) -> set[str]:
+    """Get the top-level modules imported by `charm`."""
+    result = _import_charm(charm, "-c", "import sys, charm; print(*sys.modules)")
+    return {name.split(".")[0] for name in result.stdout.split()}
+
+
+def import_time(charm: str) -> dict[str, int]:
+    """Get the time in microseconds taken to import each module imported by `charm`."""
+    result = _import_charm(charm, "-X", "importtime", "-c", "import charm")
+    timings = {}
+    for line in result.stderr.splitlines():
+        # Lines look like `import time:       339 |      13290 |   json.decoder`.
+        if not line.startswith("import time:") or line.endswith("imported package"):
+            continue
+
+        self_time, _, name = line.removeprefix("import time:").split("|")
+        timings[name.strip()] = int(self_time)
+
+    return timings
+
+
+def main() -> int:
+    """Run the import time benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--charm", action="append", choices=CHARMS, help="charm to measure")
+    parser.add_argument("--top", type=int, default=5, help="number of slowest modules to list")
+    args = parser.parse_args()
+
+    failed = []
+    for charm in args.charm or CHARMS:
+        timings = import_time(charm)
+        total = sum(timings.values()) / 1_000_000
+        print(f"{charm:>10} {total:.3f}s (budget {CHARMS[charm].seconds}s)")
+        for name, micros in sorted(timings.items(), key=lambda t: t[1], reverse=True)[: args.top]:
+            print(f"{'':>10}   {micros / 1_000_000:.3f}s {name}")
+
+        if total > CHARMS[charm].seconds:
+            failed.append(charm)
+
+    if failed:
+        print(f"importing `charm` exceeded its budget: {', '.join(failed)}", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Configure charm import benchmarks."""
+
+from bench_import import CHARMS
+
+
+def pytest_addoption(parser) -> None:
+    parser.addoption(
+        "--charm",
+        action="append",
+        choices=list(CHARMS),
+        help="charm to benchmark. May be repeated. Defaults to all charms",
+    )
+
+
+def pytest_generate_tests(metafunc) -> None:
+    if "charm" in metafunc.fixturenames:
+        metafunc.parametrize("charm", metafunc.config.getoption("--charm") or list(CHARMS))
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Import regression tests for the charmed operators.
+
+Every hook imports `charm`, so the time taken to import it is paid by every hook of every unit.
+"""
+
+from bench_import import CHARMS, import_time, imported_modules
+
+
+def test_lazy_imports(charm: str) -> None:
+    """Test that importing `charm` does not import modules that are imported lazily."""
+    assert not imported_modules(charm) & CHARMS[charm].lazy_modules
+
+
+def test_import_time(charm: str) -> None:
+    """Test that importing `charm` stays within the charm's import budget."""
+    total = sum(import_time(charm).values()) / 1_000_000
+    assert total <= CHARMS[charm].seconds